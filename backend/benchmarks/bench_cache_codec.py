@@ -0,0 +1,67 @@
+"""
+Benchmark of the Redis cache format for list pages.
+
+Compares the plain JSON previously stored in Redis (``model_dump_json`` /
+``json.loads``) with BooksCacheCodec for every compression available in
+this environment, reporting payload size, encode time and decode time.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.bench_cache_codec
+"""
+
+import argparse
+import json
+import timeit
+
+from benchmarks.bench_decode import build_payload
+from src.books.app.cache.codec import BooksCacheCodec
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.books.infra.searcher.nyt_books.client.schemas import BOOK_LIST_ADAPTER
+
+COMPRESSIONS = ("none", "zlib", "zstd", "lz4")
+
+
+def measure(encode, decode, number: int):
+    encoded = encode()
+    encode_seconds = min(timeit.repeat(encode, number=number, repeat=3))
+    decode_seconds = min(timeit.repeat(lambda: decode(encoded), number=number, repeat=3))
+    return len(encoded), encode_seconds / number, decode_seconds / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, nargs="+", default=[15, 100])
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'results':>8} {'format':>16} {'bytes':>8} {'encode us':>10} {'decode us':>10}")
+    for results in args.results:
+        books = BOOK_LIST_ADAPTER.validate_json(build_payload(results))
+        cached = CachedBooksSchema(data=books, stored_at=0.0, fresh_until=3600.0)
+
+        rows = {
+            "json (current)": measure(
+                books.model_dump_json, json.loads, args.number
+            ),
+        }
+        for compression in COMPRESSIONS:
+            try:
+                codec = BooksCacheCodec(compression=compression, min_size=0)
+            except ValueError:
+                continue
+            rows[f"codec {compression}"] = measure(
+                lambda: codec.encode(cached),
+                lambda raw: codec.decode(raw, CachedBooksSchema),
+                args.number,
+            )
+
+        for name, (size, encode, decode) in rows.items():
+            print(
+                f"{results:>8} {name:>16} {size:>8} "
+                f"{encode * 1e6:>10.1f} {decode * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
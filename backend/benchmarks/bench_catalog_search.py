@@ -0,0 +1,68 @@
+"""
+Benchmark of full-text search over the in-memory book catalog.
+
+Indexes the first page of every list produced by the NYT simulator's
+payload generator, for a number of weeks, and reports the time to index
+the catalog and the mean time per query.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.bench_catalog_search
+"""
+
+import argparse
+import time
+import timeit
+
+from src.books.app.catalog.service import BookCatalog
+from src.books.infra.searcher.nyt_books.client.schemas import BOOK_LIST_ADAPTER
+from src.books.infra.searcher.nyt_books.simulator import SimulatorSettings
+from src.books.infra.searcher.nyt_books.simulator.payloads import PayloadGenerator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--weeks", type=int, default=4)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    payloads = PayloadGenerator(SimulatorSettings())
+    pages = []
+    for week in range(args.weeks):
+        published_date = f"2024-{1 + week // 4:02d}-{1 + 7 * (week % 4):02d}"
+        for code in payloads.list_codes():
+            payload = payloads.lists(code, published_date, 0)
+            pages.append(
+                (f"{code}:{published_date}", BOOK_LIST_ADAPTER.validate_python(payload))
+            )
+
+    catalog = BookCatalog()
+    started_at = time.perf_counter()
+    for key, books in pages:
+        catalog.index_page(key, books)
+    index_seconds = time.perf_counter() - started_at
+    stats = catalog.stats()
+    print(
+        f"indexed {len(pages)} pages, {stats['books']} books, "
+        f"{stats['search_terms']} terms in {index_seconds * 1e3:.1f} ms"
+    )
+
+    title_words = pages[0][1].results[0].book_details[0].title.lower().split()
+    queries = {
+        "one word": title_words[0],
+        "prefix": title_words[0][:3],
+        "two words": " ".join(title_words[:2]),
+        "one letter": title_words[0][0],
+        "no match": "zzzzzz",
+    }
+    print(f"{'query':>12} {'results':>8} {'us/query':>10}")
+    for name, query in queries.items():
+        results = len(catalog.search(query))
+        seconds = min(
+            timeit.repeat(lambda: catalog.search(query), number=args.number, repeat=3)
+        )
+        print(f"{name:>12} {results:>8} {seconds / args.number * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Micro-benchmark for decoding a NYT /lists.json page into BookListSchema.
+
+Compares the previous two-pass path (``json.loads`` into dicts, then
+``BookListSchema(**data)``) with the single-pass ``validate_json`` used by
+NYTBooksClient, reporting time per decode and memory allocated per decode.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.bench_decode
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Callable, List
+
+from pydantic import BaseModel
+
+from src.books.domain.schemas import BookResultSchema
+from src.books.infra.searcher.nyt_books.client.schemas import BOOK_LIST_ADAPTER
+
+
+class LegacyBookListSchema(BaseModel):
+    num_results: int
+    results: List[BookResultSchema]
+    page_size: int = 0
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self.page_size = len(self.results) if isinstance(self.results, List) else 0
+
+
+def build_payload(results: int) -> bytes:
+    result = {
+        "list_name": "Hardcover Fiction",
+        "display_name": "Hardcover Fiction",
+        "bestsellers_date": "2024-01-06",
+        "published_date": "2024-01-21",
+        "published_date_description": "latest",
+        "rank_last_week": 0,
+        "weeks_on_list": 1,
+        "asterisk": 0,
+        "dagger": 0,
+        "amazon_product_url": "https://www.amazon.com/dp/1234567890?tag=NYTBSREV-20",
+        "isbns": [{"isbn10": "1234567890", "isbn13": "9781234567890"}] * 3,
+        "book_details": [
+            {
+                "title": "A TITLE",
+                "description": "A long enough description of the book. " * 3,
+                "contributor": "by An Author",
+                "author": "An Author",
+                "contributor_note": "",
+                "price": "0.00",
+                "age_group": "",
+                "publisher": "Publisher",
+                "primary_isbn13": "9781234567890",
+                "primary_isbn10": "1234567890",
+            }
+        ],
+        "reviews": [
+            {
+                "book_review_link": "",
+                "first_chapter_link": "",
+                "sunday_review_link": "",
+                "article_chapter_link": "",
+            }
+        ],
+    }
+    payload = {
+        "status": "OK",
+        "copyright": "Copyright (c) 2024 The New York Times Company.",
+        "num_results": results,
+        "last_modified": "2024-01-17T22:22:13-05:00",
+        "results": [{**result, "rank": rank} for rank in range(1, results + 1)],
+    }
+    return json.dumps(payload).encode()
+
+
+def decode_two_pass(body: bytes):
+    return LegacyBookListSchema(**json.loads(body))
+
+
+def decode_single_pass(body: bytes):
+    return BOOK_LIST_ADAPTER.validate_json(body)
+
+
+def allocated_bytes(decode: Callable[[bytes], object], body: bytes) -> int:
+    tracemalloc.start()
+    try:
+        decode(body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, nargs="+", default=[15, 20, 100])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    paths = {"two-pass": decode_two_pass, "single-pass": decode_single_pass}
+    print(f"{'results':>8} {'path':>12} {'us/decode':>10} {'peak KiB':>9}")
+    for results in args.results:
+        body = build_payload(results)
+        for name, decode in paths.items():
+            seconds = min(
+                timeit.repeat(lambda: decode(body), number=args.number, repeat=3)
+            )
+            micros = seconds / args.number * 1_000_000
+            peak = allocated_bytes(decode, body) / 1024
+            print(f"{results:>8} {name:>12} {micros:>10.1f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
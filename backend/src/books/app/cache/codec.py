@@ -0,0 +1,97 @@
+import zlib
+from typing import Callable, Dict, Literal, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+try:  # optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:  # optional dependency
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover
+    lz4_frame = None
+
+Compression = Literal["none", "zlib", "zstd", "lz4"]
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+MAGIC = b"BC"
+FORMAT_VERSION = 1
+
+# One byte on the wire per algorithm; never reuse an id.
+COMPRESSION_IDS: Dict[str, int] = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached payload cannot be decoded."""
+
+
+def _compressors(level: int) -> Dict[str, Tuple[Callable, Callable]]:
+    compressors = {
+        "none": (lambda data: data, lambda data: data),
+        "zlib": (lambda data: zlib.compress(data, level), zlib.decompress),
+    }
+    if zstandard is not None:
+        compressors["zstd"] = (
+            zstandard.ZstdCompressor(level=level).compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    if lz4_frame is not None:
+        compressors["lz4"] = (lz4_frame.compress, lz4_frame.decompress)
+    return compressors
+
+
+class BooksCacheCodec:
+    """
+    Encodes cached list pages and book records into the single format shared
+    by the API and the consumer.
+
+    Layout: ``b"BC"``, a format version byte, a compression id byte, then the
+    compact JSON of the model, compressed with the configured
+    algorithm. Payloads under `min_size` bytes are stored uncompressed, since
+    compressing them saves little and costs a call per read. Decoding
+    honours the compression id in the header, so entries written with a
+    different setting stay readable. zstd and lz4 are used only if their
+    packages are installed.
+    """
+
+    def __init__(
+        self,
+        compression: Compression = "zlib",
+        level: int = 6,
+        min_size: int = 1024,
+    ):
+        self._compressors = _compressors(level)
+        if compression not in self._compressors:
+            raise ValueError(
+                f"Compression {compression!r} is not available, "
+                f"use one of {sorted(self._compressors)}"
+            )
+        self._compression = compression
+        self._min_size = min_size
+
+    def encode(self, model: BaseModel) -> bytes:
+        payload = model.model_dump_json().encode()
+        compression = self._compression
+        if len(payload) < self._min_size:
+            compression = "none"
+        compress, _ = self._compressors[compression]
+        header = MAGIC + bytes([FORMAT_VERSION, COMPRESSION_IDS[compression]])
+        return header + compress(payload)
+
+    def decode(self, raw: bytes, schema: Type[ModelType]) -> ModelType:
+        if len(raw) < 4 or raw[:2] != MAGIC:
+            raise CacheCodecError("Unknown cache payload header")
+        if raw[2] != FORMAT_VERSION:
+            raise CacheCodecError(f"Unsupported cache format version {raw[2]}")
+        names = {value: name for name, value in COMPRESSION_IDS.items()}
+        compression = names.get(raw[3])
+        if compression not in self._compressors:
+            raise CacheCodecError(f"Unsupported cache compression id {raw[3]}")
+        _, decompress = self._compressors[compression]
+        try:
+            return schema.model_validate_json(decompress(raw[4:]))
+        except (ValueError, zlib.error) as e:
+            raise CacheCodecError(str(e)) from e
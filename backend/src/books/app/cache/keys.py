@@ -0,0 +1,57 @@
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+# Bump whenever the cached payload changes shape, so old entries are ignored
+# instead of being decoded into the new schema.
+CACHE_SCHEMA_VERSION = 4
+
+
+def build_books_cache_key(criteria: BooksSearchCriteriaSchema) -> str:
+    """
+    Builds the Redis key of a list page from every search criterion.
+
+    The criteria are normalized first, so requests for the same NYT page
+    share a key, and requests for different pages, dates or lists never do.
+    """
+    criteria = criteria.normalized()
+    return (
+        f"books:v{CACHE_SCHEMA_VERSION}"
+        f":list={criteria.list or ''}"
+        f":bestsellers_date={criteria.bestsellers_date or ''}"
+        f":published_date={criteria.published_date or ''}"
+        f":offset={criteria.offset}"
+    )
+
+
+def build_book_record_key(isbn13: str) -> str:
+    """
+    Builds the key of the record of a book, shared by every page listing it.
+    It never matches `books_cache_key_pattern`.
+    """
+    return f"books:v{CACHE_SCHEMA_VERSION}:book:{isbn13}"
+
+
+def books_cache_key_pattern() -> str:
+    """
+    Glob matching every page key of the current schema version, along with
+    the lock and missing-page keys derived from them.
+    """
+    return f"books:v{CACHE_SCHEMA_VERSION}:list=*"
+
+
+def is_books_page_key(key: str) -> bool:
+    """Tells a page key apart from the keys derived from it."""
+    return key.rsplit(":", 1)[-1].startswith("offset=")
+
+
+def build_books_refresh_lock_key(criteria: BooksSearchCriteriaSchema) -> str:
+    """
+    Builds the key that marks a background refresh of a page as in progress.
+    """
+    return f"{build_books_cache_key(criteria)}:refreshing"
+
+
+def build_books_missing_key(criteria: BooksSearchCriteriaSchema) -> str:
+    """
+    Builds the key that records that NYT has no page for the criteria.
+    """
+    return f"{build_books_cache_key(criteria)}:missing"
@@ -0,0 +1,99 @@
+from typing import Dict, Mapping, Optional, Tuple
+
+from src.books.app.cache.schemas import (
+    CachedBookRecordSchema,
+    CachedBooksSchema,
+    CachedListEntrySchema,
+    CachedPageSchema,
+)
+from src.books.domain.schemas import BookListSchema, BookResultSchema
+
+
+def result_isbn13(result: BookResultSchema) -> Optional[str]:
+    if result.book_details and result.book_details[0].primary_isbn13:
+        return result.book_details[0].primary_isbn13
+    if result.isbns and result.isbns[0].isbn13:
+        return result.isbns[0].isbn13
+    return None
+
+
+def split_page(
+    cached: CachedBooksSchema,
+) -> Tuple[CachedPageSchema, Dict[str, CachedBookRecordSchema]]:
+    """
+    Splits a page into its list entries and the records of its books, by
+    ISBN-13.
+    """
+    entries = []
+    records: Dict[str, CachedBookRecordSchema] = {}
+    for result in cached.data.results:
+        record = CachedBookRecordSchema.model_construct(
+            isbns=result.isbns,
+            book_details=result.book_details,
+            reviews=result.reviews,
+        )
+        isbn13 = result_isbn13(result)
+        if isbn13 is not None:
+            records[isbn13] = record
+        entries.append(
+            CachedListEntrySchema.model_construct(
+                isbn13=isbn13,
+                book=record if isbn13 is None else None,
+                list_name=result.list_name,
+                display_name=result.display_name,
+                bestsellers_date=result.bestsellers_date,
+                published_date=result.published_date,
+                rank=result.rank,
+                rank_last_week=result.rank_last_week,
+                weeks_on_list=result.weeks_on_list,
+                asterisk=result.asterisk,
+                dagger=result.dagger,
+                amazon_product_url=result.amazon_product_url,
+            )
+        )
+    page = CachedPageSchema.model_construct(
+        num_results=cached.data.num_results,
+        entries=entries,
+        stored_at=cached.stored_at,
+        fresh_until=cached.fresh_until,
+    )
+    return page, records
+
+
+def assemble_page(
+    page: CachedPageSchema, records: Mapping[str, CachedBookRecordSchema]
+) -> Optional[CachedBooksSchema]:
+    """
+    Rebuilds a page from its entries and the records they point at, or
+    returns None if any of those records is gone.
+    """
+    results = []
+    for entry in page.entries:
+        record = entry.book if entry.isbn13 is None else records.get(entry.isbn13)
+        if record is None:
+            return None
+        # Every part was validated when decoded, so nothing is checked again
+        results.append(
+            BookResultSchema.model_construct(
+                list_name=entry.list_name,
+                display_name=entry.display_name,
+                bestsellers_date=entry.bestsellers_date,
+                published_date=entry.published_date,
+                rank=entry.rank,
+                rank_last_week=entry.rank_last_week,
+                weeks_on_list=entry.weeks_on_list,
+                asterisk=entry.asterisk,
+                dagger=entry.dagger,
+                amazon_product_url=entry.amazon_product_url,
+                isbns=record.isbns,
+                book_details=record.book_details,
+                reviews=record.reviews,
+            )
+        )
+    return CachedBooksSchema(
+        data=BookListSchema.model_construct(
+            num_results=page.num_results, results=results
+        ),
+        stored_at=page.stored_at,
+        fresh_until=page.fresh_until,
+    )
@@ -0,0 +1,86 @@
+import asyncio
+from collections import Counter
+from typing import Dict, Optional
+
+import structlog
+
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+from src.core.domain.database.schemas import RedisProtocol
+
+logger = structlog.get_logger(module="cache", process="ListHitCounter")
+
+
+class ListHitCounter:
+    """
+    Counts how often each list is requested, in a Redis sorted set shared by
+    every API worker, so that the cache warmer can refresh the most popular
+    lists first.
+
+    Hits are counted in memory and flushed every `flush_interval` seconds in
+    a single pipeline, so recording one costs no round trip on the request
+    path. Counts still pending when a flush fails are kept for the next one.
+    """
+
+    def __init__(
+        self,
+        redis_service: RedisProtocol,
+        key: str = "books:hits",
+        flush_interval: float = 10.0,
+    ) -> None:
+        self._redis_service = redis_service
+        self._key = key
+        self._flush_interval = flush_interval
+        self._pending: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+        self._recorded = 0
+        self._flushes = 0
+        self._flush_errors = 0
+
+    def record(self, criteria: BooksSearchCriteriaSchema) -> None:
+        list_code = criteria.normalized().list
+        if list_code:
+            self._pending[list_code] += 1
+            self._recorded += 1
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, Counter()
+        try:
+            await self._redis_service.increment_scores(self._key, dict(pending))
+            self._flushes += 1
+        except Exception as exc:
+            self._flush_errors += 1
+            self._pending.update(pending)
+            logger.warning("Could not flush list hits", error=str(exc))
+
+    async def scores(self) -> Dict[str, float]:
+        """Returns the hit count of every requested list, highest first."""
+        return await self._redis_service.get_scores(self._key)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "pending_lists": len(self._pending),
+            "recorded": self._recorded,
+            "flushes": self._flushes,
+            "flush_errors": self._flush_errors,
+        }
@@ -0,0 +1,69 @@
+from typing import Dict
+
+import structlog
+
+from src.books.app.cache.keys import build_books_refresh_lock_key
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+from src.core.domain.broker.broker import BrokerProtocol
+from src.core.domain.broker.schemas import MessageSchema
+from src.core.domain.database.schemas import RedisProtocol
+
+logger = structlog.get_logger(module="cache", process="BooksRefreshService")
+
+
+class BooksRefreshService:
+    """
+    Enqueues background refreshes of stale list pages on the books queue.
+
+    A short-lived Redis lock per page ensures that, however many requests
+    see the same stale page, a single refresh message is published until
+    the lock expires.
+    """
+
+    def __init__(
+        self,
+        broker: BrokerProtocol,
+        redis_service: RedisProtocol,
+        lock_ttl: int = 60,
+    ):
+        self._broker = broker
+        self._redis_service = redis_service
+        self._lock_ttl = lock_ttl
+        self._requested = 0
+        self._deduplicated = 0
+        self._failed = 0
+
+    async def request_refresh(self, criteria: BooksSearchCriteriaSchema) -> bool:
+        """
+        Publishes a refresh for the page unless one is already pending.
+
+        Never raises: the caller is serving a stale page and must not fail
+        because the refresh could not be scheduled.
+        """
+        criteria = criteria.normalized()
+        try:
+            acquired = await self._redis_service.set_if_absent(
+                build_books_refresh_lock_key(criteria), "1", ttl=self._lock_ttl
+            )
+            if not acquired:
+                self._deduplicated += 1
+                return False
+            queue_name = self._broker.books_queue.name
+            message = MessageSchema(
+                payload={"criteria": criteria.model_dump()}, queue_name=queue_name
+            )
+            await self._broker.publish(message, queue_name)
+        except Exception as e:
+            self._failed += 1
+            logger.error("Could not schedule a cache refresh", error=str(e))
+            return False
+        self._requested += 1
+        logger.info("Cache refresh scheduled", criteria=criteria.model_dump())
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "requested": self._requested,
+            "deduplicated": self._deduplicated,
+            "failed": self._failed,
+        }
@@ -0,0 +1,83 @@
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, PrivateAttr
+
+from src.books.domain.schemas import (
+    BookListSchema,
+    BookSchema,
+    ISBNSchema,
+    ReviewSchema,
+)
+
+
+class CachedBooksSchema(BaseModel):
+    """
+    A cached list page together with the times that drive
+    stale-while-revalidate: it is fresh until `fresh_until` (forever if None)
+    and is served stale after that until Redis expires the key.
+    """
+
+    data: BookListSchema
+    stored_at: float
+    fresh_until: Optional[float] = None
+    # Per-process memo of ready-to-send renderings of this entry, so that a
+    # page kept in the local cache is serialized only once
+    _rendered: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @property
+    def rendered(self) -> Dict[str, Any]:
+        return self._rendered
+
+    def age(self, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return max(0.0, now - self.stored_at)
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        if self.fresh_until is None:
+            return False
+        now = time.time() if now is None else now
+        return now >= self.fresh_until
+
+
+class CachedBookRecordSchema(BaseModel):
+    """
+    The part of a list result that describes the book itself, stored once
+    per ISBN-13 and shared by every list page the book appears on.
+    """
+
+    isbns: List[ISBNSchema]
+    book_details: List[BookSchema]
+    reviews: List[ReviewSchema]
+
+
+class CachedListEntrySchema(BaseModel):
+    """
+    A place on a list page. It points at the shared record of the book by
+    `isbn13`; results without an ISBN keep their record inline in `book`.
+    """
+
+    isbn13: Optional[str] = None
+    book: Optional[CachedBookRecordSchema] = None
+    list_name: str
+    display_name: str
+    bestsellers_date: str
+    published_date: str
+    rank: int
+    rank_last_week: int
+    weeks_on_list: int
+    asterisk: int
+    dagger: int
+    amazon_product_url: str
+
+
+class CachedPageSchema(BaseModel):
+    """
+    What Redis holds for a list page: the `CachedBooksSchema` envelope with
+    the books replaced by references to their shared records.
+    """
+
+    num_results: int
+    entries: List[CachedListEntrySchema]
+    stored_at: float
+    fresh_until: Optional[float] = None
@@ -0,0 +1,432 @@
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+from uuid import uuid4
+
+import structlog
+
+from src.books.app.cache.codec import BooksCacheCodec, CacheCodecError, ModelType
+from src.books.app.cache.keys import (
+    books_cache_key_pattern,
+    build_book_record_key,
+    build_books_cache_key,
+    build_books_missing_key,
+    is_books_page_key,
+)
+from src.books.app.cache.normalized import assemble_page, split_page
+from src.books.app.cache.schemas import (
+    CachedBookRecordSchema,
+    CachedBooksSchema,
+    CachedPageSchema,
+)
+from src.books.app.cache.ttl import BooksCacheTTLPolicy
+from src.books.app.catalog.service import BookCatalog
+from src.books.domain.schemas import (
+    PAGE_SIZE,
+    BookListSchema,
+    BooksSearchCriteriaSchema,
+)
+from src.core.application.cache.base import LocalCache
+from src.core.domain.database.schemas import RedisProtocol
+
+logger = structlog.get_logger(module="cache", process="BooksCacheService")
+
+
+class BooksCacheService:
+    """
+    Reads and writes list pages in Redis under criteria-aware keys, with a
+    TTL that follows the NYT publishing cadence. Shared by the API and the
+    consumer so both agree on keys and encoding.
+
+    Pages are handed out in a `CachedBooksSchema` envelope recording when
+    they were written and until when they are fresh. In Redis they are
+    normalized: a book appearing on several lists is stored once, as a
+    `CachedBookRecordSchema` keyed by its ISBN-13, and each page only keeps
+    the rank data of its entries. Both are encoded with `BooksCacheCodec`;
+    Redis keeps pages until the hard expiry so that stale pages can still be
+    served while refreshed, and records as long as the longest-lived page
+    that was written with them.
+
+    An optional in-process `local_cache` keeps assembled pages in front of
+    Redis, and `local_records` the book records used to assemble them. Every
+    write announces the keys it replaced on `invalidation_channel`, and
+    `handle_invalidation` evicts them from the local tiers of every other
+    process.
+    """
+
+    def __init__(
+        self,
+        redis_service: RedisProtocol,
+        ttl_policy: BooksCacheTTLPolicy,
+        local_cache: Optional[LocalCache[CachedBooksSchema]] = None,
+        local_records: Optional[LocalCache[CachedBookRecordSchema]] = None,
+        invalidation_channel: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+        codec: Optional[BooksCacheCodec] = None,
+        negative_ttl: int = 300,
+        catalog: Optional[BookCatalog] = None,
+    ):
+        self._redis_service = redis_service
+        self._ttl_policy = ttl_policy
+        self._local_cache = local_cache
+        self._local_records = local_records
+        self._invalidation_channel = invalidation_channel
+        self._clock = clock
+        self._codec = codec or BooksCacheCodec()
+        self._negative_ttl = negative_ttl
+        # Misses are looked up before every upstream call, so they are kept
+        # in process as well, whether or not there is a local tier
+        self._missing: LocalCache[bool] = LocalCache(
+            max_entries=1024, ttl=negative_ttl
+        )
+        self._missing_hits = 0
+        self._catalog = catalog
+        self._catalog_pending: Set[str] = set()
+        self._catalog_reload_all = False
+        self._catalog_task: Optional[asyncio.Task] = None
+        # Lets a process ignore the invalidations it published itself
+        self._origin = uuid4().hex
+        self._redis_hits = 0
+        self._redis_misses = 0
+        self._dangling_pages = 0
+        self._invalidations_published = 0
+        self._invalidations_received = 0
+
+    async def get(
+        self, criteria: BooksSearchCriteriaSchema
+    ) -> Optional[CachedBooksSchema]:
+        """
+        Returns the cached page, fresh or stale, or None once it is past its
+        hard expiry.
+        """
+        return (await self.get_many([criteria]))[0]
+
+    async def get_many(
+        self, criteria_list: Sequence[BooksSearchCriteriaSchema]
+    ) -> List[Optional[CachedBooksSchema]]:
+        """
+        Like `get` for several pages, reading every local miss from Redis in
+        a single MGET, plus one more for the book records they need. Results
+        keep the order of `criteria_list`.
+        """
+        keys = [build_books_cache_key(criteria) for criteria in criteria_list]
+        results: List[Optional[CachedBooksSchema]] = [None] * len(keys)
+        missing = []
+        for index, key in enumerate(keys):
+            if self._local_cache is not None:
+                results[index] = self._local_cache.get(key)
+            if results[index] is None:
+                missing.append(index)
+
+        if missing:
+            pages = await self._read([keys[i] for i in missing])
+            for index, cached in zip(missing, pages):
+                if cached is None:
+                    self._redis_misses += 1
+                    continue
+                self._redis_hits += 1
+                hard_ttl = self._ttl_policy.hard_ttl_for(criteria_list[index])
+                self._store_locally(keys[index], cached, hard_ttl)
+                results[index] = cached
+        return results
+
+    async def _read(self, keys: List[str]) -> List[Optional[CachedBooksSchema]]:
+        """
+        Reads pages from Redis and assembles them with their book records. A
+        page whose records are gone reads as a miss, so it gets rewritten.
+        """
+        pages = [
+            self._decode(raw, CachedPageSchema)
+            for raw in await self._redis_service.get_many(keys)
+        ]
+        records: Dict[str, CachedBookRecordSchema] = {}
+        wanted: Set[str] = set()
+        for page in pages:
+            for entry in page.entries if page is not None else ():
+                if entry.isbn13 is not None:
+                    wanted.add(entry.isbn13)
+        for isbn13 in list(wanted):
+            record = self._local_records.get(isbn13) if self._local_records else None
+            if record is not None:
+                records[isbn13] = record
+                wanted.discard(isbn13)
+        if wanted:
+            isbns = list(wanted)
+            raws = await self._redis_service.get_many(
+                [build_book_record_key(isbn13) for isbn13 in isbns]
+            )
+            for isbn13, raw in zip(isbns, raws):
+                record = self._decode(raw, CachedBookRecordSchema)
+                if record is not None:
+                    records[isbn13] = record
+                    if self._local_records is not None:
+                        self._local_records.set(isbn13, record)
+
+        results: List[Optional[CachedBooksSchema]] = []
+        for key, page in zip(keys, pages):
+            cached = None if page is None else assemble_page(page, records)
+            if page is not None and cached is None:
+                logger.warning("Page refers to an expired book record", key=key)
+                self._dangling_pages += 1
+            results.append(cached)
+        return results
+
+    def _decode(self, raw: Any, schema: Type[ModelType]) -> Optional[ModelType]:
+        if not raw:
+            return None
+        try:
+            return self._codec.decode(raw, schema)
+        except CacheCodecError as e:
+            logger.warning("Discarding unreadable cache entry", error=str(e))
+            return None
+
+    async def set(
+        self, criteria: BooksSearchCriteriaSchema, books: BookListSchema
+    ) -> CachedBooksSchema:
+        return (await self.set_many([(criteria, books)]))[0]
+
+    async def set_many(
+        self, entries: Sequence[Tuple[BooksSearchCriteriaSchema, BookListSchema]]
+    ) -> List[CachedBooksSchema]:
+        """
+        Like `set` for several pages, written in a single pipeline and
+        announced in a single invalidation.
+        """
+        pages = {}
+        for criteria, books in entries:
+            ttl, hard_ttl = self._ttls_for(criteria, books)
+            pages[build_books_cache_key(criteria)] = (self._wrap(books, ttl), hard_ttl)
+        await self._write(pages)
+        return [cached for cached, _ in pages.values()]
+
+    def _ttls_for(
+        self, criteria: BooksSearchCriteriaSchema, books: BookListSchema
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Returns the fresh and hard TTL of a page."""
+        if not books.results:
+            return self._negative_ttl, self._negative_ttl
+        return (
+            self._ttl_policy.ttl_for(criteria),
+            self._ttl_policy.hard_ttl_for(criteria),
+        )
+
+    async def is_missing(self, criteria: BooksSearchCriteriaSchema) -> bool:
+        """
+        Tells whether NYT recently confirmed it has no page for the criteria.
+        """
+        key = build_books_missing_key(criteria)
+        if self._missing.get(key) is None:
+            if not await self._redis_service.get(key):
+                return False
+            self._missing.set(key, True)
+        self._missing_hits += 1
+        return True
+
+    async def set_missing(self, criteria: BooksSearchCriteriaSchema) -> None:
+        key = build_books_missing_key(criteria)
+        await self._redis_service.set(key, b"1", ttl=self._negative_ttl)
+        self._missing.set(key, True)
+
+    def _wrap(self, books: BookListSchema, ttl: Optional[int]) -> CachedBooksSchema:
+        now = self._clock()
+        return CachedBooksSchema(
+            data=books,
+            stored_at=now,
+            fresh_until=None if ttl is None else now + ttl,
+        )
+
+    async def set_overview(
+        self, overview: Dict[str, BookListSchema], published_date: Optional[str]
+    ) -> None:
+        """
+        Stores every list of a full overview, cut into the same pages the
+        lists endpoint serves, in a single round trip. Each page keeps the
+        list's `num_results`, so it matches what a search would have cached.
+        """
+        if not overview:
+            return
+        criteria = BooksSearchCriteriaSchema(published_date=published_date)
+        ttl = self._ttl_policy.ttl_for(criteria)
+        hard_ttl = self._ttl_policy.hard_ttl_for(criteria)
+        pages: Dict[str, Tuple[CachedBooksSchema, Optional[int]]] = {}
+        for code, books in overview.items():
+            for offset in range(0, len(books.results), PAGE_SIZE):
+                page = BookListSchema.model_construct(
+                    num_results=books.num_results,
+                    results=books.results[offset : offset + PAGE_SIZE],
+                )
+                key = build_books_cache_key(
+                    criteria.model_copy(update={"list": code, "offset": offset})
+                )
+                pages[key] = (self._wrap(page, ttl), hard_ttl)
+        await self._write(pages)
+
+    async def _write(
+        self, pages: Dict[str, Tuple[CachedBooksSchema, Optional[int]]]
+    ) -> None:
+        """
+        Stores pages, by key, with their hard TTL, together with the records
+        of their books in a single pipeline.
+
+        A record is shared with pages that are not being written, so it is
+        only ever given a longer TTL than the one it already has, never a
+        shorter one. The last write of a record wins.
+        """
+        if not pages:
+            return
+        mapping: Dict[str, bytes] = {}
+        ttls: Dict[str, Optional[int]] = {}
+        records: Dict[str, CachedBookRecordSchema] = {}
+        for key, (cached, hard_ttl) in pages.items():
+            page, page_records = split_page(cached)
+            mapping[key] = self._codec.encode(page)
+            ttls[key] = hard_ttl
+            for isbn13, record in page_records.items():
+                records[isbn13] = record
+                record_key = build_book_record_key(isbn13)
+                ttls[record_key] = _longest_ttl(
+                    ttls.get(record_key, 0), hard_ttl
+                )
+
+        record_keys = [build_book_record_key(isbn13) for isbn13 in records]
+        current_ttls = await self._redis_service.get_ttls(record_keys)
+        for record_key, current in zip(record_keys, current_ttls):
+            if current != -2:
+                ttls[record_key] = _longest_ttl(
+                    ttls[record_key], None if current == -1 else current
+                )
+        for isbn13, record in records.items():
+            mapping[build_book_record_key(isbn13)] = self._codec.encode(record)
+
+        await self._redis_service.set_many(mapping, ttls=ttls)
+        if self._local_records is not None:
+            for isbn13, record in records.items():
+                self._local_records.set(isbn13, record)
+        for key, (cached, hard_ttl) in pages.items():
+            self._store_locally(key, cached, hard_ttl)
+        await self._publish_invalidation(list(mapping))
+
+    def _store_locally(
+        self, key: str, cached: CachedBooksSchema, ttl: Optional[int]
+    ) -> None:
+        if self._local_cache is not None:
+            self._local_cache.set(key, cached, ttl=ttl)
+        if self._catalog is not None:
+            self._index_page(key, cached)
+
+    def _index_page(self, key: str, cached: CachedBooksSchema) -> None:
+        # The catalog is a by-product of the cache: a page it cannot index
+        # must never fail the read or write that brought it in. Every write
+        # stamps a new stored_at, so it tells the catalog whether this copy
+        # of the page is already indexed.
+        try:
+            self._catalog.index_page(key, cached.data, version=cached.stored_at)
+        except Exception as e:
+            logger.warning("Could not index page in the catalog", key=key, error=str(e))
+
+    async def _publish_invalidation(self, keys: List[str]) -> None:
+        if self._invalidation_channel is None:
+            return
+        message = json.dumps({"origin": self._origin, "keys": keys})
+        try:
+            await self._redis_service.publish(self._invalidation_channel, message)
+            self._invalidations_published += 1
+        except Exception as e:
+            # The write itself succeeded; other processes catch up when their
+            # local copies expire.
+            logger.warning("Could not publish cache invalidation", error=str(e))
+
+    def handle_invalidation(self, message: bytes) -> None:
+        """
+        Evicts the keys announced by another process from the local tier.
+        """
+        data = json.loads(message)
+        if data.get("origin") == self._origin:
+            return
+        self._invalidations_received += 1
+        keys = data.get("keys", [])
+        if self._local_cache is not None:
+            self._local_cache.invalidate(keys)
+        if self._local_records is not None:
+            self._local_records.invalidate(
+                [key.rsplit(":", 1)[-1] for key in keys if not is_books_page_key(key)]
+            )
+        if self._catalog is not None:
+            self._catalog_pending.update(keys)
+            self._schedule_catalog_load()
+
+    def clear_local(self) -> None:
+        if self._local_cache is not None:
+            self._local_cache.clear()
+        if self._local_records is not None:
+            self._local_records.clear()
+
+    def resync(self) -> None:
+        """
+        Drops the local tier and reloads the catalog from Redis in the
+        background, for when invalidations may have been missed.
+        """
+        self.clear_local()
+        if self._catalog is not None:
+            self._catalog_reload_all = True
+            self._schedule_catalog_load()
+
+    def _schedule_catalog_load(self) -> None:
+        if self._catalog_task is None or self._catalog_task.done():
+            self._catalog_task = asyncio.get_running_loop().create_task(
+                self._load_catalog()
+            )
+
+    async def _load_catalog(self, chunk_size: int = 100) -> None:
+        while self._catalog_reload_all or self._catalog_pending:
+            if self._catalog_reload_all:
+                self._catalog_reload_all = False
+                self._catalog_pending.clear()
+                try:
+                    keys = await self._redis_service.scan_keys(
+                        books_cache_key_pattern()
+                    )
+                except Exception as e:
+                    logger.warning("Could not list cached pages", error=str(e))
+                    return
+            else:
+                keys = list(self._catalog_pending)
+                self._catalog_pending.clear()
+            keys = [key for key in keys if is_books_page_key(key)]
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start : start + chunk_size]
+                try:
+                    pages = await self._read(chunk)
+                except Exception as e:
+                    logger.warning(
+                        "Could not load pages into the catalog", error=str(e)
+                    )
+                    return
+                for key, cached in zip(chunk, pages):
+                    if cached is None:
+                        # Expired or deleted since it was announced
+                        self._catalog.remove_page(key)
+                    else:
+                        self._index_page(key, cached)
+
+    def stats(self) -> Dict[str, float]:
+        local_stats = self._local_cache.stats() if self._local_cache else {}
+        record_stats = self._local_records.stats() if self._local_records else {}
+        return {
+            **{f"local_{name}": value for name, value in local_stats.items()},
+            **{f"local_records_{name}": value for name, value in record_stats.items()},
+            "redis_hits": self._redis_hits,
+            "redis_misses": self._redis_misses,
+            "invalidations_published": self._invalidations_published,
+            "invalidations_received": self._invalidations_received,
+            "missing_hits": self._missing_hits,
+            "dangling_pages": self._dangling_pages,
+        }
+
+
+def _longest_ttl(first: Optional[int], second: Optional[int]) -> Optional[int]:
+    """Picks the longer of two TTLs, where None means forever."""
+    if first is None or second is None:
+        return None
+    return max(first, second)
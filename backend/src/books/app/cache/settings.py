@@ -0,0 +1,29 @@
+from pydantic_settings import BaseSettings
+
+from src.books.app.cache.codec import Compression
+
+
+class Settings(BaseSettings):
+    books_cache_current_ttl: int = 3600
+    # 0 keeps historical lists forever: a past week's list never changes
+    books_cache_historical_ttl: int = 0
+    # Stale pages are still served, and refreshed in the background, for
+    # this long after they stop being fresh
+    books_cache_stale_ttl: int = 86400
+    books_cache_refresh_lock_ttl: int = 60
+    # Empty pages and lists NYT has no page for are remembered this long
+    books_cache_negative_ttl: int = 300
+    # NYT publishes the new lists on Wednesday evenings (Eastern time)
+    books_cache_update_weekday: int = 2
+    books_cache_update_hour_utc: int = 23
+    books_cache_local_max_entries: int = 256
+    books_cache_local_ttl: float = 60.0
+    # Book records are shared by pages, so there are more of them than pages
+    books_cache_local_max_records: int = 2048
+    books_cache_invalidation_channel: str = "books:cache:invalidations"
+    books_cache_compression: Compression = "zlib"
+    books_cache_compression_level: int = 6
+    books_cache_compression_min_size: int = 1024
+    # Sorted set counting requests per list, read by the cache warmer
+    books_cache_hits_key: str = "books:hits"
+    books_cache_hits_flush_interval: float = 10.0
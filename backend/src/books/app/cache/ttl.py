@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+
+class BooksCacheTTLPolicy:
+    """
+    Decides how long a list page may stay cached, following the NYT weekly
+    publishing cadence.
+
+    Pages of the current week (no date, "current", or a date within the last
+    seven days) may still change and stay fresh until the next weekly update,
+    or for `current_ttl` if that comes first. Once stale they can still be
+    served for `stale_ttl` more seconds while they are refreshed. Pages of
+    past weeks are final and are kept for `historical_ttl` seconds, or
+    forever when it is None.
+    """
+
+    def __init__(
+        self,
+        current_ttl: int = 3600,
+        historical_ttl: Optional[int] = None,
+        stale_ttl: int = 86400,
+        update_weekday: int = 2,
+        update_hour_utc: int = 23,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self._current_ttl = current_ttl
+        self._historical_ttl = historical_ttl
+        self._stale_ttl = stale_ttl
+        self._update_weekday = update_weekday
+        self._update_hour_utc = update_hour_utc
+        self._clock = clock
+
+    def ttl_for(self, criteria: BooksSearchCriteriaSchema) -> Optional[int]:
+        """
+        Returns how many seconds the page stays fresh, or None if it never
+        goes stale.
+        """
+        now = self._clock()
+        if self.is_historical(criteria, now.date()):
+            return self._historical_ttl
+        return max(1, min(self._current_ttl, self.seconds_until_next_update(now)))
+
+    def hard_ttl_for(self, criteria: BooksSearchCriteriaSchema) -> Optional[int]:
+        """
+        Returns how many seconds the page may be kept at all, stale or not,
+        or None to never expire it.
+        """
+        ttl = self.ttl_for(criteria)
+        if ttl is None:
+            return None
+        return ttl + self._stale_ttl
+
+    @staticmethod
+    def is_historical(criteria: BooksSearchCriteriaSchema, today: date) -> bool:
+        criteria = criteria.normalized()
+        reference = criteria.published_date or criteria.bestsellers_date
+        if reference is None or reference == "current":
+            return False
+        try:
+            reference_date = date.fromisoformat(reference)
+        except ValueError:
+            return False
+        return reference_date < today - timedelta(days=7)
+
+    def seconds_until_next_update(self, now: datetime) -> int:
+        days_ahead = (self._update_weekday - now.weekday()) % 7
+        update = (now + timedelta(days=days_ahead)).replace(
+            hour=self._update_hour_utc, minute=0, second=0, microsecond=0
+        )
+        if update <= now:
+            update += timedelta(days=7)
+        return int((update - now).total_seconds())
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import structlog
+
+from src.books.app.cache.popularity import ListHitCounter
+from src.books.app.cache.service import BooksCacheService
+from src.books.app.service import BooksService
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+logger = structlog.get_logger(module="cache", process="BooksCacheWarmer")
+
+
+class BooksCacheWarmer:
+    """
+    Refreshes the first page of every known list, most requested first.
+
+    Requests are spread evenly over `window_seconds` instead of being sent
+    all at once, so a warm-up takes a steady share of the NYT quota rather
+    than a burst. A list that fails is logged and skipped.
+    """
+
+    def __init__(
+        self,
+        books_service: BooksService,
+        books_cache: BooksCacheService,
+        hit_counter: ListHitCounter,
+        window_seconds: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._books_service = books_service
+        self._books_cache = books_cache
+        self._hit_counter = hit_counter
+        self._window_seconds = window_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._refreshed = 0
+        self._failed = 0
+
+    async def __call__(self) -> None:
+        list_codes = await self.ordered_list_codes()
+        if not list_codes:
+            return
+        interval = self._window_seconds / len(list_codes)
+        started_at = self._clock()
+        for index, list_code in enumerate(list_codes):
+            # Paced from the start of the run, so slow requests do not
+            # stretch the window
+            delay = started_at + index * interval - self._clock()
+            if delay > 0:
+                await self._sleep(delay)
+            await self._refresh(list_code)
+        logger.info(
+            "Cache warm-up finished",
+            lists=len(list_codes),
+            seconds=self._clock() - started_at,
+        )
+
+    async def ordered_list_codes(self) -> List[str]:
+        genres = await self._books_service.list_genres()
+        try:
+            scores = await self._hit_counter.scores()
+        except Exception as exc:
+            logger.warning("Could not read list hits", error=str(exc))
+            scores = {}
+        codes = [genre["code"] for genre in genres]
+        # sorted() is stable: lists without hits keep the NYT order
+        return sorted(codes, key=lambda code: -scores.get(code, 0.0))
+
+    async def _refresh(self, list_code: str) -> None:
+        criteria = BooksSearchCriteriaSchema(list=list_code)
+        try:
+            books = await self._books_service.search_books(criteria)
+            await self._books_cache.set(criteria, books)
+            self._refreshed += 1
+        except Exception as exc:
+            self._failed += 1
+            logger.error(
+                "Could not warm list", list_code=list_code, error=str(exc)
+            )
+
+    def stats(self) -> Dict[str, float]:
+        return {"refreshed": self._refreshed, "failed": self._failed}
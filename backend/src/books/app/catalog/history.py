@@ -0,0 +1,171 @@
+import heapq
+from array import array
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+from src.books.app.catalog.schemas import RankMoveSchema, RankPointSchema
+
+logger = structlog.get_logger(module="catalog", process="RankHistory")
+
+
+class RankHistory:
+    """
+    Weekly ranks of every book seen on every list, kept as (list, week,
+    ISBN) rows in parallel `array` columns: about 16 bytes a row, so years
+    of lists fit in a few megabytes.
+
+    Lists and ISBNs are interned into small integers and weeks are stored
+    as date ordinals. Rows are never dropped when the page they came from
+    expires; recording the same (list, week, ISBN) again overwrites its
+    ranks. Rows are indexed by ISBN, for `history`, and by (list, week), for
+    `movers`. A record whose week is not an ISO date is skipped.
+    """
+
+    def __init__(self) -> None:
+        self._list_names: List[str] = []
+        self._list_ids: Dict[str, int] = {}
+        self._isbns: List[str] = []
+        self._isbn_ids: Dict[str, int] = {}
+        self._list = array("H")
+        self._week = array("I")
+        self._isbn = array("I")
+        self._rank = array("H")
+        self._rank_last_week = array("H")
+        self._weeks_on_list = array("H")
+        self._by_isbn: Dict[int, array] = {}
+        self._by_list_week: Dict[Tuple[int, int], array] = {}
+        self._latest_week: Dict[int, int] = {}
+        self._skipped = 0
+
+    def record(
+        self,
+        list_name: str,
+        published_date: str,
+        isbn13: str,
+        rank: int,
+        rank_last_week: int,
+        weeks_on_list: int,
+    ) -> None:
+        try:
+            week = date.fromisoformat(published_date).toordinal()
+        except (TypeError, ValueError):
+            self._skipped += 1
+            logger.warning(
+                "Skipping rank with an invalid week",
+                list_name=list_name,
+                isbn13=isbn13,
+                published_date=published_date,
+            )
+            return
+        list_id = self._intern(list_name, self._list_names, self._list_ids)
+        isbn_id = self._intern(isbn13, self._isbns, self._isbn_ids)
+
+        rows = self._by_list_week.setdefault((list_id, week), array("I"))
+        # A page holds a few dozen books at most, so a linear scan is cheap
+        row = next((row for row in rows if self._isbn[row] == isbn_id), None)
+        if row is None:
+            row = len(self._rank)
+            self._list.append(list_id)
+            self._week.append(week)
+            self._isbn.append(isbn_id)
+            self._rank.append(rank)
+            self._rank_last_week.append(rank_last_week)
+            self._weeks_on_list.append(weeks_on_list)
+            rows.append(row)
+            self._by_isbn.setdefault(isbn_id, array("I")).append(row)
+        else:
+            self._rank[row] = rank
+            self._rank_last_week[row] = rank_last_week
+            self._weeks_on_list[row] = weeks_on_list
+        if week > self._latest_week.get(list_id, 0):
+            self._latest_week[list_id] = week
+
+    def history(
+        self, isbn13: str, list_name: Optional[str] = None
+    ) -> List[RankPointSchema]:
+        """Every recorded rank of a book, oldest week first."""
+        isbn_id = self._isbn_ids.get(isbn13)
+        if isbn_id is None:
+            return []
+        list_id = self._list_ids.get(list_name) if list_name is not None else None
+        if list_name is not None and list_id is None:
+            return []
+        rows = sorted(
+            (
+                row
+                for row in self._by_isbn[isbn_id]
+                if list_id is None or self._list[row] == list_id
+            ),
+            key=lambda row: (self._week[row], self._list_names[self._list[row]]),
+        )
+        return [
+            RankPointSchema(
+                list_name=self._list_names[self._list[row]],
+                published_date=date.fromordinal(self._week[row]).isoformat(),
+                rank=self._rank[row],
+                rank_last_week=self._rank_last_week[row],
+                weeks_on_list=self._weeks_on_list[row],
+            )
+            for row in rows
+        ]
+
+    def movers(
+        self, limit: int = 10, list_name: Optional[str] = None
+    ) -> List[RankMoveSchema]:
+        """
+        The books whose rank changed the most since last week on the newest
+        week of each list, climbs and falls alike. New entries have no rank
+        to compare with and are left out.
+        """
+        if list_name is None:
+            list_ids = list(self._latest_week)
+        elif list_name in self._list_ids:
+            list_ids = [self._list_ids[list_name]]
+        else:
+            return []
+        rank, rank_last_week = self._rank, self._rank_last_week
+        moved = [
+            (abs(rank_last_week[row] - rank[row]), row)
+            for list_id in list_ids
+            for row in self._by_list_week[(list_id, self._latest_week[list_id])]
+            if rank_last_week[row] and rank_last_week[row] != rank[row]
+        ]
+        top = heapq.nlargest(limit, moved)
+        return [
+            RankMoveSchema(
+                isbn13=self._isbns[self._isbn[row]],
+                list_name=self._list_names[self._list[row]],
+                published_date=date.fromordinal(self._week[row]).isoformat(),
+                rank=rank[row],
+                rank_last_week=rank_last_week[row],
+                change=rank_last_week[row] - rank[row],
+            )
+            for _, row in top
+        ]
+
+    def stats(self) -> Dict[str, float]:
+        columns = (
+            self._list,
+            self._week,
+            self._isbn,
+            self._rank,
+            self._rank_last_week,
+            self._weeks_on_list,
+        )
+        return {
+            "rows": len(self._rank),
+            "lists": len(self._list_names),
+            "books": len(self._isbns),
+            "bytes": sum(column.itemsize * len(column) for column in columns),
+            "skipped": self._skipped,
+        }
+
+    @staticmethod
+    def _intern(value: str, values: List[str], ids: Dict[str, int]) -> int:
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = ids[value] = len(values)
+            values.append(value)
+        return value_id
@@ -0,0 +1,51 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from src.books.domain.schemas import BookSchema
+
+
+class CatalogListingSchema(BaseModel):
+    """A place of a book on one cached list page."""
+
+    list_name: str
+    display_name: str
+    bestsellers_date: str
+    published_date: str
+    rank: int
+    rank_last_week: int
+    weeks_on_list: int
+
+
+class CatalogBookSchema(BaseModel):
+    book: BookSchema
+    listings: List[CatalogListingSchema]
+
+
+class RankPointSchema(BaseModel):
+    """The rank of a book on one list in one week."""
+
+    list_name: str
+    published_date: str
+    rank: int
+    rank_last_week: int
+    weeks_on_list: int
+
+
+class BookHistorySchema(BaseModel):
+    isbn13: str
+    # None once the book is no longer on any cached page
+    book: Optional[BookSchema] = None
+    ranks: List[RankPointSchema]
+
+
+class RankMoveSchema(BaseModel):
+    """A change of rank since last week; positive when the book climbed."""
+
+    isbn13: str
+    book: Optional[BookSchema] = None
+    list_name: str
+    published_date: str
+    rank: int
+    rank_last_week: int
+    change: int
@@ -0,0 +1,112 @@
+import bisect
+import heapq
+import re
+import unicodedata
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, List, Mapping, Tuple
+
+from src.books.domain.schemas import BookSchema
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# How much a term counts depending on where it appears
+FIELD_WEIGHTS = (
+    ("title", 3.0),
+    ("author", 2.0),
+    ("publisher", 1.0),
+    ("description", 0.5),
+)
+# A term matched only as a prefix of a longer word counts this much less
+PREFIX_MATCH_FACTOR = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cases, strips accents and splits on anything but letters and digits."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return TOKEN_PATTERN.findall(text)
+
+
+class SearchIndex:
+    """
+    Inverted index over the title, author, publisher and description of
+    books, updated one book at a time.
+
+    Every query term matches the indexed words it is a prefix of, found by
+    bisecting a sorted vocabulary, so "hoov" finds "Hoover". A book must
+    match every term; it is ranked by the weight of the fields the terms
+    appear in, with whole-word matches counting more than prefix ones.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        self._documents: Dict[str, Dict[str, float]] = {}
+
+    def add(self, document_id: str, book: BookSchema) -> None:
+        self.remove(document_id)
+        weights: Dict[str, float] = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(getattr(book, field) or ""):
+                weights[token] += weight
+        self._documents[document_id] = dict(weights)
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                bisect.insort(self._vocabulary, token)
+            postings[document_id] = weight
+
+    def remove(self, document_id: str) -> None:
+        for token in self._documents.pop(document_id, {}):
+            postings = self._postings[token]
+            del postings[document_id]
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, float]]:
+        """Returns up to `limit` (document id, score) pairs, best first."""
+        scores: Mapping[str, float] = {}
+        for position, term in enumerate(dict.fromkeys(tokenize(query))):
+            term_scores = self._term_scores(term)
+            if position == 0:
+                scores = term_scores
+            else:
+                smaller, larger = sorted((scores, term_scores), key=len)
+                scores = {
+                    document_id: score + larger[document_id]
+                    for document_id, score in smaller.items()
+                    if document_id in larger
+                }
+            if not scores:
+                return []
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return sorted(best, key=lambda item: (-item[1], item[0]))
+
+    def _term_scores(self, term: str) -> Mapping[str, float]:
+        matches = []
+        index = bisect.bisect_left(self._vocabulary, term)
+        while index < len(self._vocabulary) and (
+            self._vocabulary[index].startswith(term)
+        ):
+            token = self._vocabulary[index]
+            index += 1
+            factor = 1.0 if token == term else PREFIX_MATCH_FACTOR
+            matches.append((self._postings[token], factor))
+        if len(matches) == 1 and matches[0][1] == 1.0:
+            # Read only: the postings themselves are the scores
+            return matches[0][0]
+
+        scores: Dict[str, float] = {}
+        for postings, factor in matches:
+            for document_id, weight in postings.items():
+                weight *= factor
+                # A book matching several words with the prefix counts once
+                if weight > scores.get(document_id, 0.0):
+                    scores[document_id] = weight
+        return scores
+
+    def stats(self) -> Dict[str, float]:
+        return {"documents": len(self._documents), "terms": len(self._vocabulary)}
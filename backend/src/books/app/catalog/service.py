@@ -0,0 +1,216 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.books.app.catalog.history import RankHistory
+from src.books.app.catalog.schemas import (
+    BookHistorySchema,
+    CatalogBookSchema,
+    CatalogListingSchema,
+    RankMoveSchema,
+)
+from src.books.app.catalog.search import SearchIndex
+from src.books.domain.schemas import BookListSchema, BookResultSchema, BookSchema
+
+# Separators between co-authors, e.g. "Colleen Hoover and Tarryn Fisher"
+AUTHOR_SEPARATORS = re.compile(r",|&|\band\b|\bwith\b")
+
+
+def normalize_isbn(isbn: str) -> str:
+    return re.sub(r"[\s-]", "", isbn).upper()
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def author_keys(author: str) -> Set[str]:
+    """The full author line plus each co-author, so either finds the book."""
+    keys = {normalize_name(author)}
+    keys.update(
+        normalize_name(part)
+        for part in AUTHOR_SEPARATORS.split(author.casefold())
+    )
+    keys.discard("")
+    return keys
+
+
+class BookCatalog:
+    """
+    In-process catalog of every book on the cached list pages, with hash
+    indexes on ISBN-13, ISBN-10, author and publisher.
+
+    Pages are indexed under their cache key; indexing a page again replaces
+    its previous contents, unless it is the `version` already indexed, and a
+    book is dropped once no indexed page lists it. Lookups are dictionary
+    hits and never touch Redis or NYT. A `SearchIndex` kept in step with the
+    books backs full-text `search`, and a `RankHistory`, which outlives the
+    pages, backs `history` and `movers`.
+    """
+
+    def __init__(self) -> None:
+        self._books: Dict[str, BookSchema] = {}
+        self._listings: Dict[str, Dict[str, CatalogListingSchema]] = {}
+        self._page_isbns: Dict[str, List[str]] = {}
+        self._page_versions: Dict[str, float] = {}
+        self._by_isbn10: Dict[str, str] = {}
+        self._by_author: Dict[str, Set[str]] = {}
+        self._by_publisher: Dict[str, Set[str]] = {}
+        self._search_index = SearchIndex()
+        self._history = RankHistory()
+
+    def index_page(
+        self, page_key: str, books: BookListSchema, version: Optional[float] = None
+    ) -> None:
+        if version is not None and self._page_versions.get(page_key) == version:
+            # Same copy read again, e.g. from Redis after a local expiry
+            return
+        self.remove_page(page_key)
+        if version is not None:
+            self._page_versions[page_key] = version
+        isbns = []
+        for result in books.results:
+            book = self._book_of(result)
+            if book is None:
+                continue
+            isbn13 = book.primary_isbn13
+            isbns.append(isbn13)
+            self._add_book(isbn13, book)
+            self._listings.setdefault(isbn13, {})[page_key] = CatalogListingSchema(
+                list_name=result.list_name,
+                display_name=result.display_name,
+                bestsellers_date=result.bestsellers_date,
+                published_date=result.published_date,
+                rank=result.rank,
+                rank_last_week=result.rank_last_week,
+                weeks_on_list=result.weeks_on_list,
+            )
+            self._history.record(
+                result.list_name,
+                result.published_date,
+                isbn13,
+                result.rank,
+                result.rank_last_week,
+                result.weeks_on_list,
+            )
+        self._page_isbns[page_key] = isbns
+
+    def remove_page(self, page_key: str) -> None:
+        self._page_versions.pop(page_key, None)
+        for isbn13 in self._page_isbns.pop(page_key, []):
+            listings = self._listings.get(isbn13)
+            if listings is None:
+                continue
+            listings.pop(page_key, None)
+            if not listings:
+                self._remove_book(isbn13)
+
+    def find_by_isbn(self, isbn: str) -> Optional[CatalogBookSchema]:
+        isbn = normalize_isbn(isbn)
+        isbn13 = isbn if isbn in self._books else self._by_isbn10.get(isbn)
+        if isbn13 is None:
+            return None
+        return self._entry(isbn13)
+
+    def find_by_author(self, author: str) -> List[CatalogBookSchema]:
+        return self._entries(self._by_author.get(normalize_name(author), ()))
+
+    def find_by_publisher(self, publisher: str) -> List[CatalogBookSchema]:
+        return self._entries(self._by_publisher.get(normalize_name(publisher), ()))
+
+    def search(self, query: str, limit: int = 20) -> List[CatalogBookSchema]:
+        return [
+            self._entry(isbn13)
+            for isbn13, _ in self._search_index.search(query, limit=limit)
+        ]
+
+    def history(
+        self, isbn: str, list_name: Optional[str] = None
+    ) -> Optional[BookHistorySchema]:
+        isbn = normalize_isbn(isbn)
+        isbn13 = self._by_isbn10.get(isbn, isbn)
+        ranks = self._history.history(isbn13, list_name=list_name)
+        if not ranks:
+            return None
+        return BookHistorySchema(
+            isbn13=isbn13, book=self._books.get(isbn13), ranks=ranks
+        )
+
+    def movers(
+        self, limit: int = 10, list_name: Optional[str] = None
+    ) -> List[RankMoveSchema]:
+        moves = self._history.movers(limit=limit, list_name=list_name)
+        for move in moves:
+            move.book = self._books.get(move.isbn13)
+        return moves
+
+    def stats(self) -> Dict[str, float]:
+        history_stats = self._history.stats()
+        return {
+            "books": len(self._books),
+            "pages": len(self._page_isbns),
+            "authors": len(self._by_author),
+            "publishers": len(self._by_publisher),
+            "search_terms": self._search_index.stats()["terms"],
+            "history_rows": history_stats["rows"],
+            "history_bytes": history_stats["bytes"],
+            "history_skipped": history_stats["skipped"],
+        }
+
+    @staticmethod
+    def _book_of(result: BookResultSchema) -> Optional[BookSchema]:
+        if not result.book_details:
+            return None
+        book = result.book_details[0]
+        if not book.primary_isbn13 and result.isbns:
+            book = book.model_copy(update={"primary_isbn13": result.isbns[0].isbn13})
+        if not book.primary_isbn13:
+            return None
+        return book
+
+    def _add_book(self, isbn13: str, book: BookSchema) -> None:
+        previous = self._books.get(isbn13)
+        if previous is not None:
+            # Keep the indexes in step with the latest details of the book
+            self._unindex(isbn13, previous)
+        self._books[isbn13] = book
+        if book.primary_isbn10:
+            self._by_isbn10[normalize_isbn(book.primary_isbn10)] = isbn13
+        for key in author_keys(book.author):
+            self._by_author.setdefault(key, set()).add(isbn13)
+        self._by_publisher.setdefault(normalize_name(book.publisher), set()).add(
+            isbn13
+        )
+        self._search_index.add(isbn13, book)
+
+    def _remove_book(self, isbn13: str) -> None:
+        self._listings.pop(isbn13, None)
+        book = self._books.pop(isbn13, None)
+        if book is not None:
+            self._unindex(isbn13, book)
+
+    def _unindex(self, isbn13: str, book: BookSchema) -> None:
+        if book.primary_isbn10:
+            self._by_isbn10.pop(normalize_isbn(book.primary_isbn10), None)
+        for key in author_keys(book.author):
+            self._discard(self._by_author, key, isbn13)
+        self._discard(self._by_publisher, normalize_name(book.publisher), isbn13)
+        self._search_index.remove(isbn13)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, isbn13: str) -> None:
+        isbns = index.get(key)
+        if isbns is not None:
+            isbns.discard(isbn13)
+            if not isbns:
+                del index[key]
+
+    def _entry(self, isbn13: str) -> CatalogBookSchema:
+        listings = sorted(
+            self._listings.get(isbn13, {}).values(),
+            key=lambda listing: (listing.published_date, listing.list_name),
+            reverse=True,
+        )
+        return CatalogBookSchema(book=self._books[isbn13], listings=listings)
+
+    def _entries(self, isbns: Iterable[str]) -> List[CatalogBookSchema]:
+        return [self._entry(isbn13) for isbn13 in sorted(isbns)]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 
 class BookServiceException(Exception):
@@ -59,3 +59,24 @@ class ExternalAPIException(BookServiceException):
 
     def __str__(self) -> str:
         return f"Error in external API {self.api_name}: {self.error_message}"
+
+
+class ServiceUnavailableException(BookServiceException):
+    """Exception raised when the external API is known to be unavailable
+    and calls to it are being rejected without trying.
+
+    `fallback` holds the last value known to be good for the request, if any.
+    """
+
+    def __init__(
+        self,
+        api_name: Optional[str] = None,
+        fallback: Optional[Any] = None,
+        *args,
+    ):
+        super().__init__(args)
+        self.api_name = api_name
+        self.fallback = fallback
+
+    def __str__(self) -> str:
+        return f"External API {self.api_name} is temporarily unavailable"
@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+from src.books.app import exceptions
+from src.books.app.service import BooksService
+from src.books.domain.schemas import DEFAULT_LIST_CODE, BooksSearchCriteriaSchema
+from src.core.domain.database.schemas import RedisProtocol
+
+logger = structlog.get_logger(module="genres", process="GenreIndex")
+
+
+class GenreIndex:
+    """
+    In-memory copy of the genres NYT knows about, indexed by list code, so
+    that listing them costs no network call and requests for an unknown
+    list are rejected without one.
+
+    The genres are loaded on first use, from the copy shared in Redis under
+    `redis_key` when there is one, from the genres endpoint otherwise, and
+    are due again every `refresh_interval` seconds. A due copy is still
+    served while it is reloaded in the background. The Redis copy is kept
+    for `redis_ttl` seconds, well past the refresh, so that it outlives an
+    NYT outage. An unknown code triggers an early reload from NYT at most
+    every `miss_refresh_interval` seconds, in case NYT added the list since.
+    While the genres cannot be loaded every code is accepted, leaving the
+    answer to NYT.
+    """
+
+    def __init__(
+        self,
+        books_service: BooksService,
+        refresh_interval: float = 86400.0,
+        miss_refresh_interval: float = 300.0,
+        redis_service: Optional[RedisProtocol] = None,
+        redis_key: str = "books:genres",
+        redis_ttl: int = 30 * 86400,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._books_service = books_service
+        self._refresh_interval = refresh_interval
+        self._miss_refresh_interval = miss_refresh_interval
+        self._redis_service = redis_service
+        self._redis_key = redis_key
+        self._redis_ttl = redis_ttl
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._genres: Optional[List[Dict[str, Any]]] = None
+        self._by_code: Dict[str, Dict[str, Any]] = {}
+        self._version: Optional[str] = None
+        self._refreshed_at = float("-inf")
+        self._refresh_at = 0.0
+        self._miss_refresh_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._shared_loads = 0
+        self._rejected = 0
+
+    async def validate(
+        self, criteria: BooksSearchCriteriaSchema
+    ) -> BooksSearchCriteriaSchema:
+        """
+        Returns the criteria normalized and with the default list filled in.
+
+        Raises:
+            GenreNotFoundException: if NYT has no list with that code.
+        """
+        criteria = criteria.normalized()
+        if criteria.list is None:
+            criteria = criteria.model_copy(update={"list": DEFAULT_LIST_CODE})
+        if not await self.contains(criteria.list):
+            self._rejected += 1
+            raise exceptions.GenreNotFoundException(criteria.list)
+        return criteria
+
+    async def contains(self, list_code: str) -> bool:
+        await self._ensure_loaded()
+        if self._genres is None or list_code in self._by_code:
+            return True
+        if self._clock() >= self._miss_refresh_at:
+            await self.refresh(force=True)
+            return self._genres is None or list_code in self._by_code
+        return False
+
+    async def genres(self) -> Optional[List[Dict[str, Any]]]:
+        """Every genre, or None while they cannot be loaded."""
+        await self._ensure_loaded()
+        return self._genres
+
+    @property
+    def version(self) -> Optional[str]:
+        """
+        A hash of the genres, the same in every process that loaded the same
+        list; None until they are loaded.
+        """
+        return self._version
+
+    async def _ensure_loaded(self) -> None:
+        if self._genres is None:
+            if self._clock() >= self._refresh_at:
+                await self.refresh()
+        elif self._clock() >= self._refresh_at:
+            self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.refresh())
+
+    async def refresh(self, force: bool = False) -> None:
+        """
+        Reloads the genres, from the Redis copy if it is not due yet, unless
+        `force`d to ask NYT.
+        """
+        requested_at = self._clock()
+        async with self._lock:
+            if self._refreshed_at > requested_at:
+                # Refreshed by someone else while waiting for the lock
+                return
+            shared = await self._load_shared()
+            if (
+                not force
+                and shared is not None
+                and shared["stored_at"] + self._refresh_interval > requested_at
+            ):
+                self._shared_loads += 1
+                self.update(shared["genres"], refreshed_at=shared["stored_at"])
+                return
+            try:
+                genres = await self._books_service.list_genres()
+            except Exception as e:
+                self._refresh_failures += 1
+                logger.warning("Could not load the genres", error=str(e))
+                if self._genres is None and shared is not None:
+                    # Better an old copy than accepting every code
+                    self.update(shared["genres"])
+                self._refreshed_at = self._clock()
+                self._refresh_at = self._refreshed_at + self._miss_refresh_interval
+                self._miss_refresh_at = self._refresh_at
+                return
+            self.update(genres)
+            await self._store_shared(genres)
+
+    def update(
+        self, genres: List[Dict[str, Any]], refreshed_at: Optional[float] = None
+    ) -> None:
+        """Replaces the known genres with those of a genres response."""
+        self._refreshed_at = self._clock() if refreshed_at is None else refreshed_at
+        self._genres = genres
+        self._by_code = {genre["code"]: genre for genre in genres}
+        self._version = hashlib.blake2b(
+            json.dumps(genres, sort_keys=True).encode(), digest_size=12
+        ).hexdigest()
+        self._refresh_at = self._refreshed_at + self._refresh_interval
+        self._miss_refresh_at = self._refreshed_at + self._miss_refresh_interval
+        self._refreshes += 1
+
+    async def _load_shared(self) -> Optional[Dict[str, Any]]:
+        if self._redis_service is None:
+            return None
+        try:
+            raw = await self._redis_service.get(self._redis_key)
+        except Exception as e:
+            logger.warning("Could not read the shared genres", error=str(e))
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _store_shared(self, genres: List[Dict[str, Any]]) -> None:
+        if self._redis_service is None:
+            return
+        payload = json.dumps({"stored_at": self._refreshed_at, "genres": genres})
+        try:
+            await self._redis_service.set(self._redis_key, payload, ttl=self._redis_ttl)
+        except Exception as e:
+            logger.warning("Could not share the genres", error=str(e))
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "codes": len(self._by_code),
+            "refreshes": self._refreshes,
+            "refresh_failures": self._refresh_failures,
+            "shared_loads": self._shared_loads,
+            "rejected": self._rejected,
+        }
@@ -0,0 +1,12 @@
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    books_genres_refresh_interval: float = 86400.0
+    # How soon an unknown list code may trigger another refresh, in case NYT
+    # added the list since; also the wait after a failed refresh
+    books_genres_miss_refresh_interval: float = 300.0
+    # Shared by every API worker, and kept long past the refresh so that it
+    # outlives an NYT outage
+    books_genres_redis_key: str = "books:genres"
+    books_genres_redis_ttl: int = 30 * 86400
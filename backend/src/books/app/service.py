@@ -1,5 +1,6 @@
-from typing import List
+from typing import Dict, List, Optional
 
+from src.books.app.use_cases.get_books_overview import GetBooksOverviewUseCase
 from src.books.app.use_cases.list_genres import ListGenresUseCase
 from src.books.app.use_cases.search_books import SearchBooksUseCase
 from src.books.domain.schemas import BookListSchema, BooksSearchCriteriaSchema
@@ -18,3 +19,8 @@ class BooksService:
         list_genres_use_case = ListGenresUseCase(self._searcher)
         return await list_genres_use_case()
 
+    async def get_books_overview(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        get_books_overview_use_case = GetBooksOverviewUseCase(self._searcher)
+        return await get_books_overview_use_case(published_date)
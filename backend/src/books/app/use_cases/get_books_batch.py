@@ -0,0 +1,159 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import structlog
+from pydantic import BaseModel
+
+from src.books.app import exceptions
+from src.books.app.cache.keys import build_books_cache_key
+from src.books.app.cache.refresh import BooksRefreshService
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.books.app.cache.service import BooksCacheService
+from src.books.app.genres.index import GenreIndex
+from src.books.domain.schemas import BookListSchema, BooksSearchCriteriaSchema
+from src.books.domain.searcher.protocols import BookSearcherProtocol
+
+logger = structlog.get_logger(module="searcher", process="GetBooksBatchUseCase")
+
+
+class BooksBatchResultSchema(BaseModel):
+    data: Optional[BookListSchema] = None
+    error: Optional[str] = None
+    stale: bool = False
+    age_seconds: Optional[float] = None
+
+
+class GetBooksBatchUseCase:
+    """
+    Resolves many list pages at once.
+
+    Every page is looked up in the cache with a single MGET, stale hits are
+    served and refreshed in the background, misses are fetched from the
+    searcher with at most `max_concurrency` calls in flight and written back
+    in a single pipeline. Queries for the same page are resolved once, and
+    queries for a list unknown to `genre_index`, or for a page NYT recently
+    confirmed it does not have, are rejected up front.
+    """
+
+    def __init__(
+        self,
+        books_service: BookSearcherProtocol,
+        books_cache: BooksCacheService,
+        books_refresh: BooksRefreshService,
+        genre_index: Optional[GenreIndex] = None,
+        max_concurrency: int = 4,
+    ):
+        self._books_service = books_service
+        self._books_cache = books_cache
+        self._books_refresh = books_refresh
+        self._genre_index = genre_index
+        self._max_concurrency = max_concurrency
+
+    async def __call__(
+        self, queries: Dict[str, BooksSearchCriteriaSchema]
+    ) -> Dict[str, BooksBatchResultSchema]:
+        names = list(queries)
+        rejected: Dict[str, BooksBatchResultSchema] = {}
+        if self._genre_index is not None:
+            valid = {}
+            for name, criteria in queries.items():
+                try:
+                    valid[name] = await self._genre_index.validate(criteria)
+                except exceptions.GenreNotFoundException as e:
+                    rejected[name] = BooksBatchResultSchema(error=str(e))
+            queries = valid
+
+        key_by_name = {
+            name: build_books_cache_key(criteria) for name, criteria in queries.items()
+        }
+        criteria_by_key: Dict[str, BooksSearchCriteriaSchema] = {}
+        for name, key in key_by_name.items():
+            criteria_by_key.setdefault(key, queries[name])
+        keys = list(criteria_by_key)
+
+        resolved: Dict[str, BooksBatchResultSchema] = {}
+        misses: List[str] = []
+        cached_pages = await self._books_cache.get_many(
+            [criteria_by_key[key] for key in keys]
+        )
+        for key, cached in zip(keys, cached_pages):
+            if cached is None:
+                misses.append(key)
+                continue
+            stale = cached.is_stale()
+            if stale:
+                await self._books_refresh.request_refresh(criteria_by_key[key])
+            resolved[key] = self._result(cached, stale)
+
+        if misses:
+            missing = await asyncio.gather(
+                *(self._books_cache.is_missing(criteria_by_key[key]) for key in misses)
+            )
+            for key, is_missing in zip(misses, missing):
+                if is_missing:
+                    resolved[key] = self._not_found(criteria_by_key[key])
+            misses = [key for key in misses if key not in resolved]
+        if misses:
+            resolved.update(await self._fetch(misses, criteria_by_key))
+
+        logger.info(
+            "Batch resolved",
+            queries=len(queries),
+            pages=len(keys),
+            misses=len(misses),
+        )
+        return {
+            name: rejected[name] if name in rejected else resolved[key_by_name[name]]
+            for name in names
+        }
+
+    async def _fetch(
+        self, keys: List[str], criteria_by_key: Dict[str, BooksSearchCriteriaSchema]
+    ) -> Dict[str, BooksBatchResultSchema]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(key: str) -> BookListSchema:
+            async with semaphore:
+                return await self._books_service.search_books(criteria_by_key[key])
+
+        outcomes = await asyncio.gather(
+            *(fetch(key) for key in keys), return_exceptions=True
+        )
+
+        resolved: Dict[str, BooksBatchResultSchema] = {}
+        fetched = []
+        for key, outcome in zip(keys, outcomes):
+            if isinstance(outcome, exceptions.BookNotFoundException):
+                await self._books_cache.set_missing(criteria_by_key[key])
+                resolved[key] = self._not_found(criteria_by_key[key])
+            elif isinstance(outcome, exceptions.ServiceUnavailableException) and (
+                outcome.fallback is not None
+            ):
+                resolved[key] = BooksBatchResultSchema(data=outcome.fallback, stale=True)
+            elif isinstance(outcome, Exception):
+                logger.error("Batch query failed", key=key, error=str(outcome))
+                resolved[key] = BooksBatchResultSchema(error=str(outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                fetched.append((key, outcome))
+
+        if fetched:
+            stored = await self._books_cache.set_many(
+                [(criteria_by_key[key], books) for key, books in fetched]
+            )
+            for (key, _), cached in zip(fetched, stored):
+                resolved[key] = self._result(cached, stale=False)
+        return resolved
+
+    @staticmethod
+    def _not_found(criteria: BooksSearchCriteriaSchema) -> BooksBatchResultSchema:
+        return BooksBatchResultSchema(
+            error=str(exceptions.BookNotFoundException(str(criteria)))
+        )
+
+    @staticmethod
+    def _result(cached: CachedBooksSchema, stale: bool) -> BooksBatchResultSchema:
+        return BooksBatchResultSchema(
+            data=cached.data, stale=stale, age_seconds=round(cached.age(), 3)
+        )
@@ -0,0 +1,32 @@
+from typing import Dict, Optional
+
+import structlog
+
+from src.books.app import exceptions
+from src.books.domain.schemas import BookListSchema
+from src.books.domain.searcher.protocols import BookSearcherProtocol
+
+logger = structlog.get_logger(module="searcher", process="GetBooksOverviewUseCase")
+
+
+class GetBooksOverviewUseCase:
+    def __init__(self, searcher: BookSearcherProtocol):
+        self._searcher = searcher
+
+    async def __call__(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        try:
+            overview = await self._searcher.get_books_overview(published_date)
+            if not overview:
+                logger.error("No lists found", published_date=published_date)
+                raise exceptions.BookNotFoundException(
+                    f"overview published_date={published_date}"
+                )
+            return overview
+        except exceptions.BookServiceException as e:
+            logger.error("BookServiceException occurred", error=str(e))
+            raise
+        except Exception as e:
+            logger.error("Unexpected error occurred", error=str(e))
+            raise exceptions.ExternalAPIException("NYT Books API", str(e))
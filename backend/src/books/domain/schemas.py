@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 
 
 class BookSchema(BaseModel):
@@ -47,11 +47,18 @@ class BookResultSchema(BaseModel):
 class BookListSchema(BaseModel):
     num_results: int
     results: List[BookResultSchema]
-    page_size: int = 0
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.page_size = len(self.results) if isinstance(self.results, List) else 0
+    @computed_field
+    @property
+    def page_size(self) -> int:
+        return len(self.results)
+
+
+# List served when a request does not name one
+DEFAULT_LIST_CODE = "hardcover-fiction"
+
+# NYT pages every list in blocks of this many results
+PAGE_SIZE = 20
 
 
 class BooksSearchCriteriaSchema(BaseModel):
@@ -60,6 +67,25 @@ class BooksSearchCriteriaSchema(BaseModel):
     published_date: Optional[str] = None
     offset: Optional[int] = 0
 
+    def normalized(self) -> "BooksSearchCriteriaSchema":
+        """
+        Returns an equivalent criteria with blank values dropped, the list
+        code lower-cased and the offset defaulted, so that two requests for
+        the same NYT page compare equal.
+        """
+
+        def clean(value: Optional[str]) -> Optional[str]:
+            value = value.strip() if value else None
+            return value or None
+
+        list_code = clean(self.list)
+        return BooksSearchCriteriaSchema(
+            list=list_code.lower() if list_code else None,
+            bestsellers_date=clean(self.bestsellers_date),
+            published_date=clean(self.published_date),
+            offset=self.offset or 0,
+        )
+
 
 class BookGenreSchema(BaseModel):
     code: str
@@ -1,4 +1,4 @@
-from typing import List, Protocol
+from typing import Dict, List, Optional, Protocol
 
 from src.books.domain.schemas import (
     BookGenreSchema,
@@ -23,7 +23,7 @@ class BookSearcherProtocol(Protocol):
             BookListSchema: A list of books matching the search criteria.
         """
 
-    async def list_genres(self) -> List[BookGenreSchema]:
+    async def get_books_genres(self) -> List[BookGenreSchema]:
         """
         Retrieve a list of available book genres.
 
@@ -31,3 +31,17 @@ class BookSearcherProtocol(Protocol):
             List[BookGenreSchema]: A list of book genres.
         """
         ...
+
+    async def get_books_overview(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        """
+        Retrieve every best-seller list for a publication date in one call.
+
+        Args:
+            published_date (Optional[str]): Publication date, the current one if None.
+
+        Returns:
+            Dict[str, BookListSchema]: The books of each list, keyed by list code.
+        """
+        ...
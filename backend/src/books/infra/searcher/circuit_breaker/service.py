@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from src.books.app.exceptions import ServiceUnavailableException
+from src.books.domain.schemas import (
+    BookGenreSchema,
+    BookListSchema,
+    BooksSearchCriteriaSchema,
+)
+from src.books.domain.searcher.protocols import BookSearcherProtocol
+from src.core.application.circuit_breaker.base import CircuitBreaker
+from src.core.application.circuit_breaker.exceptions import (
+    CircuitBreakerOpenException,
+)
+
+logger = structlog.get_logger(
+    module="bookSearcherService", process="CircuitBreakerBookSearcherService"
+)
+
+GENRES_FALLBACK_KEY = "genres"
+
+
+class CircuitBreakerBookSearcherService(BookSearcherProtocol):
+    """
+    Searcher decorator that routes every upstream call through a circuit
+    breaker.
+
+    The last good result of each request is kept in a bounded LRU; while the
+    circuit is open the call fails fast with ServiceUnavailableException,
+    carrying that last known good value as `fallback` when there is one.
+    """
+
+    def __init__(
+        self,
+        searcher: BookSearcherProtocol,
+        circuit_breaker: CircuitBreaker,
+        api_name: str = "NYT Books API",
+        fallback_size: int = 256,
+    ):
+        self._searcher = searcher
+        self._circuit_breaker = circuit_breaker
+        self._api_name = api_name
+        self._fallback_size = fallback_size
+        self._last_known_good: "OrderedDict[str, Any]" = OrderedDict()
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._last_known_good[key] = value
+        self._last_known_good.move_to_end(key)
+        while len(self._last_known_good) > self._fallback_size:
+            self._last_known_good.popitem(last=False)
+
+    async def _call(self, key: str, func) -> Any:
+        try:
+            value = await self._circuit_breaker.call(func)
+        except CircuitBreakerOpenException as e:
+            fallback = self._last_known_good.get(key)
+            logger.warning(
+                "Upstream call rejected by circuit breaker",
+                key=key,
+                retry_in=e.retry_in,
+                has_fallback=fallback is not None,
+            )
+            raise ServiceUnavailableException(self._api_name, fallback) from e
+        except ServiceUnavailableException as e:
+            # Rejected before reaching NYT, e.g. by the rate limiter
+            if e.fallback is None and key in self._last_known_good:
+                raise ServiceUnavailableException(
+                    self._api_name, self._last_known_good[key]
+                ) from e
+            raise
+        self._remember(key, value)
+        return value
+
+    async def search_books(self, criteria: BooksSearchCriteriaSchema) -> BookListSchema:
+        normalized = criteria.normalized()
+        return await self._call(
+            normalized.model_dump_json(),
+            lambda: self._searcher.search_books(normalized),
+        )
+
+    async def get_books_genres(self) -> List[BookGenreSchema]:
+        return await self._call(GENRES_FALLBACK_KEY, self._searcher.get_books_genres)
+
+    async def get_books_overview(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        try:
+            return await self._circuit_breaker.call(
+                lambda: self._searcher.get_books_overview(published_date)
+            )
+        except CircuitBreakerOpenException as e:
+            raise ServiceUnavailableException(self._api_name) from e
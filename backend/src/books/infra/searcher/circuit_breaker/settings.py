@@ -0,0 +1,10 @@
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    circuit_breaker_failure_rate_threshold: float = 0.5
+    circuit_breaker_window_size: int = 20
+    circuit_breaker_minimum_calls: int = 5
+    circuit_breaker_open_seconds: float = 30.0
+    circuit_breaker_half_open_max_calls: int = 1
+    circuit_breaker_fallback_size: int = 256
@@ -0,0 +1,62 @@
+from typing import Dict, List, Optional
+
+import structlog
+
+from src.books.domain.schemas import (
+    BookGenreSchema,
+    BookListSchema,
+    BooksSearchCriteriaSchema,
+)
+from src.books.domain.searcher.protocols import BookSearcherProtocol
+from src.core.application.single_flight.base import SingleFlight
+
+logger = structlog.get_logger(
+    module="bookSearcherService", process="CoalescingBookSearcherService"
+)
+
+GENRES_FLIGHT_KEY = "genres"
+
+
+class CoalescingBookSearcherService(BookSearcherProtocol):
+    """
+    Searcher decorator that shares one in-flight upstream call between
+    concurrent callers asking for the same normalized criteria.
+    """
+
+    def __init__(self, searcher: BookSearcherProtocol):
+        self._searcher = searcher
+        self._books_flight: SingleFlight[BookListSchema] = SingleFlight()
+        self._genres_flight: SingleFlight[List[BookGenreSchema]] = SingleFlight()
+        self._overview_flight: SingleFlight[Dict[str, BookListSchema]] = SingleFlight()
+
+    async def search_books(self, criteria: BooksSearchCriteriaSchema) -> BookListSchema:
+        normalized = criteria.normalized()
+        return await self._books_flight.do(
+            normalized.model_dump_json(),
+            lambda: self._searcher.search_books(normalized),
+        )
+
+    async def get_books_genres(self) -> List[BookGenreSchema]:
+        return await self._genres_flight.do(
+            GENRES_FLIGHT_KEY, self._searcher.get_books_genres
+        )
+
+    async def get_books_overview(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        return await self._overview_flight.do(
+            published_date,
+            lambda: self._searcher.get_books_overview(published_date),
+        )
+
+    def stats(self) -> Dict[str, float]:
+        flights = {
+            "search_books": self._books_flight,
+            "get_books_genres": self._genres_flight,
+            "get_books_overview": self._overview_flight,
+        }
+        return {
+            f"{method}_{name}": value
+            for method, flight in flights.items()
+            for name, value in flight.stats().items()
+        }
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 import structlog
 
@@ -59,3 +59,15 @@ class DummyBookSearcherService(BookSearcherProtocol):
             BookGenreSchema(code="DUMMY1", display_name="Género Dummy 1"),
             BookGenreSchema(code="DUMMY2", display_name="Género Dummy 2"),
         ]
+
+    async def get_books_overview(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        logger.info("Obteniendo resumen de listas en DummyBookSearcherService")
+        genres = await self.get_books_genres()
+        return {
+            genre.code: await self.search_books(
+                BooksSearchCriteriaSchema(list=genre.code, published_date=published_date)
+            )
+            for genre in genres
+        }
@@ -1,21 +1,58 @@
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
 
 import httpx
 import structlog
 from httpx import AsyncClient, HTTPStatusError, Limits, Timeout
 
-from src.books.domain.schemas import BookListSchema
+from src.books.domain.schemas import (
+    DEFAULT_LIST_CODE,
+    PAGE_SIZE,
+    BookListSchema,
+    BookResultSchema,
+    BookSchema,
+    ISBNSchema,
+    ReviewSchema,
+)
+from src.core.application.retry.base import RetryPolicy
+from src.core.domain.rate_limiter.exceptions import RateLimitExceededException
+from src.core.domain.rate_limiter.protocols import RateLimiterProtocol
+from src.core.domain.rate_limiter.schemas import RequestPriority
 
 from .exceptions import (
     NYTBooksException,
+    NYTBooksHTTP2UnavailableException,
     NYTBooksInvalidPayloadRequestException,
+    NYTBooksNotFoundException,
     NYTBooksTooManyRequestsException,
     NYTBooksUnexpectedStatusResponseException,
 )
+from .response_cache import ResponseCache
+from .retry import classify_http_error
+from .schemas import (
+    BOOK_LIST_ADAPTER,
+    GENRES_RESPONSE_ADAPTER,
+    OVERVIEW_RESPONSE_ADAPTER,
+    OverviewBookSchema,
+    OverviewListSchema,
+)
 
 logger = structlog.get_logger(module="searcher", process="NYTBooksClient")
 
+ParsedType = TypeVar("ParsedType")
+
 
 class Client:
     def __init__(
@@ -24,16 +61,149 @@ class Client:
         retries: int = 3,
         retry_delay: int = 1,
         base_url: str = "https://api.nytimes.com/svc/books/v3",
+        request_timeout: float = 10.0,
+        pool_timeout: float = 10.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[RateLimiterProtocol] = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        response_cache_size: int = 256,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         self._api_key = api_key
-        self._retries = retries
-        self._retry_delay = retry_delay
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_attempts=retries,
+            base_delay=retry_delay,
+            classifier=classify_http_error,
+        )
         self._base_url = base_url
-        self._client = AsyncClient(
-            base_url=self._base_url,
-            timeout=Timeout(10.0),
-            limits=Limits(max_keepalive_connections=5, max_connections=10),
+        self._timeout = Timeout(request_timeout, pool=pool_timeout)
+        self._limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
+        if http2:
+            self._require_h2()
+        self._http2 = http2
+        self._transport = transport
+        self._client: Optional[AsyncClient] = None
+        self._rate_limiter = rate_limiter
+        self._priority = priority
+        self._response_cache = (
+            ResponseCache(max_entries=response_cache_size)
+            if response_cache_size > 0
+            else None
+        )
+
+        # Requests wait here (and not inside httpcore) for a free connection,
+        # which lets us measure how long callers queue for the pool.
+        self._max_connections = max_connections
+        self._connection_slots = asyncio.Semaphore(max_connections)
+        self._requests_in_use = 0
+        self._requests_total = 0
+        self._pool_wait_seconds_total = 0.0
+        self._pool_wait_seconds_max = 0.0
+
+    async def connect(self) -> None:
+        """
+        Opens the underlying connection pool.
+
+        The pool is meant to live for the whole process: it is opened once at
+        startup and shared by every request until `close` is called.
+        """
+        if self._client is None:
+            self._client = AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self._http2,
+                transport=self._transport,
+            )
+            logger.info(
+                "NYT Books HTTP client opened",
+                max_connections=self._limits.max_connections,
+                max_keepalive_connections=self._limits.max_keepalive_connections,
+                http2=self._http2,
+            )
+
+    @staticmethod
+    def _require_h2() -> None:
+        # httpx only imports h2 when the first HTTP/2 connection is made;
+        # check here so a missing extra fails at startup, not on a request
+        try:
+            import h2  # noqa: F401
+        except ImportError as e:
+            raise NYTBooksHTTP2UnavailableException() from e
+
+    async def close(self) -> None:
+        """
+        Closes the underlying connection pool and every open socket.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("NYT Books HTTP client closed", **self.pool_stats())
+
+    async def __aenter__(self) -> "Client":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def pool_stats(self) -> Dict[str, float]:
+        """
+        Returns a snapshot of the connection pool usage.
+
+        `connections_open` and `connections_idle` come from the transport pool;
+        `pool_wait_*` measure the time requests spent waiting for a free slot.
+        """
+        connections = []
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        if pool is not None:
+            connections = list(getattr(pool, "connections", []))
+
+        return {
+            "connections_open": len(connections),
+            "connections_idle": sum(1 for conn in connections if conn.is_idle()),
+            "requests_in_use": self._requests_in_use,
+            "requests_total": self._requests_total,
+            "pool_wait_seconds_total": self._pool_wait_seconds_total,
+            "pool_wait_seconds_max": self._pool_wait_seconds_max,
+            "pool_wait_seconds_avg": (
+                self._pool_wait_seconds_total / self._requests_total
+                if self._requests_total
+                else 0.0
+            ),
+        }
+
+    def response_cache_stats(self) -> Dict[str, float]:
+        if self._response_cache is None:
+            return {}
+        return self._response_cache.stats()
+
+    @asynccontextmanager
+    async def _connection_slot(self) -> AsyncIterator[None]:
+        started_at = time.perf_counter()
+        try:
+            async with asyncio.timeout(self._timeout.pool):
+                await self._connection_slots.acquire()
+        except TimeoutError as exc:
+            raise httpx.PoolTimeout("Timed out waiting for a free connection") from exc
+        waited = time.perf_counter() - started_at
+        self._requests_total += 1
+        self._pool_wait_seconds_total += waited
+        self._pool_wait_seconds_max = max(self._pool_wait_seconds_max, waited)
+        self._requests_in_use += 1
+        try:
+            yield
+        finally:
+            self._requests_in_use -= 1
+            self._connection_slots.release()
 
     async def _do_request(
         self,
@@ -45,107 +215,297 @@ class Client:
         file: Optional[Dict] = None,
         data: Optional[Dict] = None,
     ) -> httpx.Response:
+        await self.connect()
         if not params:
             params = {}
         params["api-key"] = self._api_key
         # Filter out None parameters
         params = {k: v for k, v in params.items() if v is not None}
-        for attempt in range(self._retries):
+        call = self._retry_policy.new_call()
+        while True:
             try:
                 logger.debug(
-                    "Attempting request", method=method, path=path, attempt=attempt + 1
-                )
-                response = await self._client.request(
-                    method=method,
-                    url=path,
-                    headers=headers,
-                    json=json,
-                    params=params,
-                    files=file,
-                    data=data,
-                )
-                response.raise_for_status()
-                return response
-            except HTTPStatusError as exc:
-                logger.error(
-                    "HTTP Error occurred",
-                    status_code=exc.response.status_code,
+                    "Attempting request",
                     method=method,
                     path=path,
-                    exc_info=exc,
+                    attempt=call.attempt + 1,
                 )
-                if exc.response.status_code == 422:
-                    logger.error("Invalid payload request", exc_info=exc)
-                    raise NYTBooksInvalidPayloadRequestException(
-                        exc.response.json().get("detail", []), exc.response
-                    )
-                if exc.response.status_code == 429:
-                    retry_after = int(
-                        exc.response.headers.get("Retry-After", self._retry_delay)
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire(self._priority)
+                async with self._connection_slot():
+                    response = await self._client.request(
+                        method=method,
+                        url=path,
+                        headers=headers,
+                        json=json,
+                        params=params,
+                        files=file,
+                        data=data,
                     )
-                    logger.warning(
-                        "Too many requests, waiting to retry", retry_after=retry_after
-                    )
-                    await asyncio.sleep(retry_after)
-                    continue
-                if attempt == self._retries - 1:
-                    logger.error("Unexpected status response", exc_info=exc)
-                    raise NYTBooksUnexpectedStatusResponseException(exc.response)
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return response
+                response.raise_for_status()
+                return response
+            except RateLimitExceededException:
+                # Gave up waiting for a token: retrying would only wait again
+                raise
             except Exception as exc:
+                decision = self._retry_policy.classify(exc)
                 logger.error(
-                    "Unexpected exception occurred during request",
+                    "Request failed",
                     method=method,
                     path=path,
+                    kind=decision.kind.value,
+                    retryable=decision.retryable,
                     exc_info=exc,
                 )
-                if attempt == self._retries - 1:
-                    logger.error(
-                        "Maximum retries reached, raising NYTBooksException",
-                        exc_info=exc,
-                    )
-                    raise NYTBooksException(f"Error calling {method} {path}") from exc
+                delay = call.next_delay(exc)
+                if delay is None:
+                    raise self._to_client_exception(exc, method, path) from exc
+
+            if decision.retry_after is not None and self._rate_limiter is not None:
+                # Every caller sharing the quota waits in the limiter queue
+                # instead of sleeping here.
+                logger.warning(
+                    "Too many requests, blocking the rate limiter",
+                    retry_after=decision.retry_after,
+                )
+                await self._rate_limiter.penalize(decision.retry_after)
+                continue
 
             logger.info(
                 "Retrying request",
                 method=method,
                 path=path,
-                retry_delay=self._retry_delay,
+                retry_delay=delay,
             )
-            await asyncio.sleep(self._retry_delay)
-            self._retry_delay *= 2
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _to_client_exception(
+        exc: Exception, method: str, path: str
+    ) -> NYTBooksException:
+        if not isinstance(exc, HTTPStatusError):
+            return NYTBooksException(f"Error calling {method} {path}")
+        status_code = exc.response.status_code
+        if status_code == 422:
+            return NYTBooksInvalidPayloadRequestException(
+                exc.response.json().get("detail", []), exc.response
+            )
+        if status_code == 404:
+            return NYTBooksNotFoundException(exc.response)
+        if status_code == 429:
+            return NYTBooksTooManyRequestsException("Maximum number of retries exceeded")
+        return NYTBooksUnexpectedStatusResponseException(exc.response)
+
+    async def _get_revalidated(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        parse: Callable[[httpx.Response], ParsedType],
+    ) -> ParsedType:
+        """
+        GETs `path` revalidating a previous response when possible.
+
+        If a response for the same path and params was stored with an ETag or
+        Last-Modified validator, the request is made conditional and a 304
+        reuses the value parsed the first time instead of downloading and
+        parsing the body again.
+        """
+        if self._response_cache is None:
+            response = await self._do_request("GET", path, params=params)
+            return parse(response)
+
+        key = ResponseCache.key(path, params)
+        cached = self._response_cache.get(key)
+        headers = cached.conditional_headers() if cached is not None else None
+        response = await self._do_request("GET", path, headers=headers, params=params)
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            logger.debug("Response not modified, reusing cached value", path=path)
+            self._response_cache.mark_revalidated()
+            return cached.value
 
-        logger.error("Maximum number of retries exceeded")
-        raise NYTBooksTooManyRequestsException("Maximum number of retries exceeded")
+        value = parse(response)
+        self._response_cache.store(key, response, value)
+        return value
 
     async def search_books(self, criteria: Dict[str, Any]) -> BookListSchema:
         path = "/lists.json"
         offset = criteria.get("offset", 0)
         # Check if offset is a multiple of 20
-        if offset % 20 != 0:
+        if offset % PAGE_SIZE != 0:
             logger.error("Invalid offset value", offset=offset)
             raise NYTBooksException("Offset must be a multiple of 20")
 
         params = {
-            "list": criteria.get("list", "hardcover-fiction"),
+            "list": criteria.get("list") or DEFAULT_LIST_CODE,
             "bestsellers-date": criteria.get("bestsellers_date"),
             "published-date": criteria.get("published_date"),
             "offset": offset,
         }
 
         logger.info("Searching for books", criteria=criteria)
-        response = await self._do_request("GET", path, params=params)
-        data = response.json()
-        books = BookListSchema(**data)
-        return books
+        return await self._get_revalidated(path, params, self._parse_book_list)
+
+    async def iter_books(
+        self,
+        criteria: Dict[str, Any],
+        max_pages: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BookResultSchema]:
+        """
+        Iterates over every result of a list, page after page.
+
+        The first page is fetched alone to learn `num_results`; the remaining
+        pages are then requested ahead of the consumer, at most `concurrency`
+        at a time (the pool size by default), and still go through the
+        connection slots and the rate limiter. Results are yielded in rank
+        order and iteration stops as soon as `num_results` or `max_pages` is
+        reached. Pages requested ahead are cancelled if the caller stops
+        iterating early.
+        """
+        if max_pages is not None and max_pages <= 0:
+            return
+        window = max(1, concurrency or self._max_connections)
+        start = criteria.get("offset") or 0
+
+        first_page = await self.search_books({**criteria, "offset": start})
+        for result in first_page.results:
+            yield result
+        if not first_page.results:
+            return
+
+        end = first_page.num_results
+        if max_pages is not None:
+            end = min(end, start + max_pages * PAGE_SIZE)
+        offsets = iter(range(start + PAGE_SIZE, end, PAGE_SIZE))
+
+        pending: Deque[asyncio.Task[BookListSchema]] = deque()
+
+        def schedule() -> None:
+            while len(pending) < window:
+                offset = next(offsets, None)
+                if offset is None:
+                    return
+                pending.append(
+                    asyncio.create_task(
+                        self.search_books({**criteria, "offset": offset})
+                    )
+                )
+
+        try:
+            schedule()
+            while pending:
+                page = await pending.popleft()
+                if not page.results:
+                    return
+                schedule()
+                for result in page.results:
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    def _parse_book_list(response: httpx.Response) -> BookListSchema:
+        return BOOK_LIST_ADAPTER.validate_json(response.content)
 
     async def get_books_genres(self) -> List[Dict[str, str]]:
         path = "/lists/names.json"
-        response = await self._do_request("GET", path)
-        data = response.json()
+        return await self._get_revalidated(path, {}, self._parse_genres)
+
+    @staticmethod
+    def _parse_genres(response: httpx.Response) -> List[Dict[str, str]]:
+        data = GENRES_RESPONSE_ADAPTER.validate_json(response.content)
         return [
-            {
-                "code": result["list_name_encoded"],
-                "display_name": result["display_name"],
-            }
-            for result in data.get("results", [])
+            {"code": result.list_name_encoded, "display_name": result.display_name}
+            for result in data.results
+        ]
+
+    async def get_books_overview(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        """
+        Fetches every current best-seller list in a single call to the full
+        overview endpoint and splits it into one BookListSchema per list,
+        keyed by the encoded list name.
+
+        Unlike /lists/overview.json, which only carries the top five books of
+        each list, the full overview carries every book, so each list holds
+        all of its results and its length is the list's `num_results`.
+        """
+        path = "/lists/full-overview.json"
+        params = {"published_date": published_date}
+
+        logger.info("Fetching books overview", published_date=published_date)
+        return await self._get_revalidated(path, params, self._parse_overview)
+
+    @classmethod
+    def _parse_overview(cls, response: httpx.Response) -> Dict[str, BookListSchema]:
+        data = OVERVIEW_RESPONSE_ADAPTER.validate_json(response.content).results
+
+        overview = {}
+        for book_list in data.lists:
+            results = [
+                cls._overview_book_to_result(
+                    book, book_list, data.bestsellers_date, data.published_date
+                )
+                for book in book_list.books
+            ]
+            overview[book_list.list_name_encoded] = BookListSchema.model_construct(
+                num_results=len(results), results=results
+            )
+        return overview
+
+    @staticmethod
+    def _overview_book_to_result(
+        book: OverviewBookSchema,
+        book_list: OverviewListSchema,
+        bestsellers_date: str,
+        published_date: str,
+    ) -> BookResultSchema:
+        # The overview payload has already been validated, so the domain
+        # models are assembled with model_construct instead of validating
+        # every field a second time.
+        primary_isbn10 = book.primary_isbn10 or ""
+        primary_isbn13 = book.primary_isbn13 or ""
+        isbns = book.isbns or [
+            ISBNSchema.model_construct(isbn10=primary_isbn10, isbn13=primary_isbn13)
         ]
+        return BookResultSchema.model_construct(
+            list_name=book_list.list_name,
+            display_name=book_list.display_name,
+            bestsellers_date=bestsellers_date,
+            published_date=published_date,
+            rank=book.rank,
+            rank_last_week=book.rank_last_week,
+            weeks_on_list=book.weeks_on_list,
+            asterisk=book.asterisk,
+            dagger=book.dagger,
+            amazon_product_url=book.amazon_product_url,
+            isbns=isbns,
+            book_details=[
+                BookSchema.model_construct(
+                    title=book.title,
+                    description=book.description,
+                    contributor=book.contributor,
+                    author=book.author,
+                    contributor_note=book.contributor_note,
+                    price=book.price,
+                    age_group=book.age_group,
+                    publisher=book.publisher,
+                    primary_isbn13=primary_isbn13,
+                    primary_isbn10=primary_isbn10,
+                )
+            ],
+            reviews=[
+                ReviewSchema.model_construct(
+                    book_review_link=book.book_review_link,
+                    first_chapter_link=book.first_chapter_link,
+                    sunday_review_link=book.sunday_review_link,
+                    article_chapter_link=book.article_chapter_link,
+                )
+            ],
+        )
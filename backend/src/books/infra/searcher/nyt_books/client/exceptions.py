@@ -7,6 +7,18 @@ class NYTBooksException(Exception):
     """Base exception for the NYTBooks client"""
 
 
+class NYTBooksHTTP2UnavailableException(NYTBooksException):
+    """Exception raised when HTTP/2 is requested but the optional `h2`
+    package, which httpx needs to speak it, is not installed."""
+
+    def __str__(self) -> str:
+        return (
+            "HTTP/2 is enabled (NYT_HTTP2) but the 'h2' package is not "
+            "installed; install the 'http2' extra (httpx[http2]) or turn "
+            "NYT_HTTP2 off"
+        )
+
+
 class NYTBooksUnexpectedStatusResponseException(NYTBooksException):
     """Exception raised when a response with an unknown status code
     is received in a call to the NYTBooks API"""
@@ -32,6 +44,18 @@ class NYTBooksInvalidPayloadRequestException(NYTBooksException):
         return f"A validation error occurred on the data sent: {self.detail} during call to {self.response.request.method} {self.response.request.url}"
 
 
+class NYTBooksNotFoundException(NYTBooksException):
+    """Exception raised when a status code (404) is received indicating
+    that there is no list for the name and/or date requested."""
+
+    def __init__(self, response: httpx.Response, *args):
+        super().__init__(args)
+        self.response = response
+
+    def __str__(self) -> str:
+        return f"Nothing found during call to {self.response.request.method} {self.response.request.url}"
+
+
 class NYTBooksTooManyRequestsException(NYTBooksException):
     """Exception raised when too many requests are made to the NYTBooks API"""
 
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class CachedResponse:
+    """Validators of a previous response together with its parsed value."""
+
+    __slots__ = ("etag", "last_modified", "value")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], value: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.value = value
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU of parsed responses keyed by path and query params.
+
+    Only responses carrying an `ETag` or `Last-Modified` header are kept,
+    since those are the only ones that can be revalidated with a
+    conditional request.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._revalidated = 0
+        self._stored = 0
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        params = params or {}
+        return path, tuple(
+            sorted(
+                (name, str(value))
+                for name, value in params.items()
+                if value is not None and name != "api-key"
+            )
+        )
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: CacheKey, response: httpx.Response, value: Any) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = CachedResponse(etag, last_modified, value)
+        self._entries.move_to_end(key)
+        self._stored += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def mark_revalidated(self) -> None:
+        self._revalidated += 1
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "entries": len(self._entries),
+            "stored": self._stored,
+            "not_modified": self._revalidated,
+        }
@@ -0,0 +1,50 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
+
+from src.core.application.retry.dto import ErrorKind, RetryDecisionDTO
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def classify_http_error(error: BaseException) -> RetryDecisionDTO:
+    """
+    Classifies an error raised while calling the NYT API.
+
+    Connection and read errors are retried (every call is an idempotent GET),
+    as are 429 and 5xx responses. Any other status, 422 included, and any
+    other exception are not.
+    """
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return RetryDecisionDTO(retryable=True, kind=ErrorKind.CONNECT)
+    if isinstance(error, httpx.TransportError):
+        return RetryDecisionDTO(retryable=True, kind=ErrorKind.READ)
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return RetryDecisionDTO(
+            retryable=status_code in RETRYABLE_STATUS_CODES,
+            kind=ErrorKind.STATUS,
+            retry_after=(
+                parse_retry_after(error.response.headers.get("Retry-After"))
+                if status_code == 429
+                else None
+            ),
+        )
+    return RetryDecisionDTO(retryable=False, kind=ErrorKind.OTHER)
@@ -0,0 +1,62 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from src.books.domain.schemas import BookListSchema, ISBNSchema
+
+
+class GenreResultSchema(BaseModel):
+    list_name_encoded: str
+    display_name: str
+
+
+class GenresResponseSchema(BaseModel):
+    results: List[GenreResultSchema] = []
+
+
+class OverviewBookSchema(BaseModel):
+    rank: int = 0
+    rank_last_week: int = 0
+    weeks_on_list: int = 0
+    asterisk: int = 0
+    dagger: int = 0
+    title: str = ""
+    description: Optional[str] = None
+    contributor: str = ""
+    author: str = ""
+    contributor_note: Optional[str] = None
+    price: float = 0
+    age_group: Optional[str] = None
+    publisher: str = ""
+    primary_isbn13: Optional[str] = None
+    primary_isbn10: Optional[str] = None
+    amazon_product_url: str = ""
+    isbns: List[ISBNSchema] = []
+    book_review_link: Optional[str] = None
+    first_chapter_link: Optional[str] = None
+    sunday_review_link: Optional[str] = None
+    article_chapter_link: Optional[str] = None
+
+
+class OverviewListSchema(BaseModel):
+    list_name: str = ""
+    list_name_encoded: str
+    display_name: str = ""
+    books: List[OverviewBookSchema] = []
+
+
+class OverviewResultsSchema(BaseModel):
+    bestsellers_date: str = ""
+    published_date: str = ""
+    lists: List[OverviewListSchema] = []
+
+
+class OverviewResponseSchema(BaseModel):
+    results: OverviewResultsSchema = OverviewResultsSchema()
+
+
+# Adapters are built once at import time so every response is validated
+# straight from its raw bytes without rebuilding the validators.
+BOOK_LIST_ADAPTER = TypeAdapter(BookListSchema)
+GENRES_RESPONSE_ADAPTER = TypeAdapter(GenresResponseSchema)
+OVERVIEW_RESPONSE_ADAPTER = TypeAdapter(OverviewResponseSchema)
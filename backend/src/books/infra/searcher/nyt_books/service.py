@@ -1,12 +1,23 @@
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional
 
+from src.books.app.exceptions import (
+    BookNotFoundException,
+    ServiceUnavailableException,
+)
 from src.books.domain.schemas import (
     BookGenreSchema,
     BookListSchema,
+    BookResultSchema,
     BooksSearchCriteriaSchema,
 )
 from src.books.domain.searcher.protocols import BookSearcherProtocol
 from src.books.infra.searcher.nyt_books.client import NYTBooksClient
+from src.books.infra.searcher.nyt_books.client.exceptions import (
+    NYTBooksNotFoundException,
+)
+from src.core.domain.rate_limiter.exceptions import RateLimitExceededException
+
+API_NAME = "NYT Books API"
 
 
 class NYTBooksService(BookSearcherProtocol):
@@ -14,8 +25,31 @@ class NYTBooksService(BookSearcherProtocol):
         self._client = client
 
     async def search_books(self, criteria: BooksSearchCriteriaSchema) -> BookListSchema:
-        raw_results = await self._client.search_books(criteria.model_dump())
+        try:
+            raw_results = await self._client.search_books(criteria.model_dump())
+        except NYTBooksNotFoundException as e:
+            raise BookNotFoundException(str(criteria)) from e
+        except RateLimitExceededException as e:
+            raise ServiceUnavailableException(API_NAME) from e
         return raw_results
 
+    def iter_books(
+        self,
+        criteria: BooksSearchCriteriaSchema,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[BookResultSchema]:
+        return self._client.iter_books(criteria.model_dump(), max_pages=max_pages)
+
     async def get_books_genres(self) -> List[BookGenreSchema]:
-        return await self._client.get_books_genres()
+        try:
+            return await self._client.get_books_genres()
+        except RateLimitExceededException as e:
+            raise ServiceUnavailableException(API_NAME) from e
+
+    async def get_books_overview(
+        self, published_date: Optional[str] = None
+    ) -> Dict[str, BookListSchema]:
+        try:
+            return await self._client.get_books_overview(published_date)
+        except RateLimitExceededException as e:
+            raise ServiceUnavailableException(API_NAME) from e
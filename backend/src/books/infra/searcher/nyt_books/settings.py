@@ -6,6 +6,17 @@ class Settings(BaseSettings):
     base_url: str = "https://api.nytimes.com/svc/books/v3"
     retries: int = 3
     retry_delay: int = 3
+    retry_max_delay: float = 30.0
+    retry_budget_ratio: float = 0.2
+    retry_budget_min_per_second: float = 0.1
+    request_timeout: float = 10.0
+    pool_timeout: float = 10.0
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0
+    # Needs the optional `http2` extra (httpx[http2])
+    http2: bool = False
+    response_cache_size: int = 256
 
     class Config:
         env_prefix = "NYT_"
@@ -0,0 +1,3 @@
+from .app import create_app  # noqa
+from .faults import FaultInjector  # noqa
+from .settings import Settings as SimulatorSettings  # noqa
@@ -0,0 +1,8 @@
+import uvicorn
+
+from .app import create_app
+from .settings import Settings
+
+if __name__ == "__main__":
+    settings = Settings()
+    uvicorn.run(create_app(settings), host=settings.host, port=settings.port)
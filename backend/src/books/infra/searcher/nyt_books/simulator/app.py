@@ -0,0 +1,141 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import structlog
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from .faults import FaultInjector
+from .payloads import PayloadGenerator
+from .settings import Settings
+
+logger = structlog.get_logger(module="searcher", process="NYTBooksSimulator")
+
+
+def create_app(
+    settings: Optional[Settings] = None,
+    faults: Optional[FaultInjector] = None,
+) -> FastAPI:
+    """
+    Builds an ASGI app that answers like the NYT Books API.
+
+    It can be mounted in-process with `httpx.ASGITransport` or served with
+    uvicorn (see `__main__`) and targeted through `NYT_BASE_URL`.
+    """
+    settings = settings or Settings()
+    faults = faults or FaultInjector(settings)
+    payloads = PayloadGenerator(settings)
+
+    app = FastAPI(title="NYT Books API simulator", docs_url=None, redoc_url=None)
+    app.state.faults = faults
+
+    async def serve(
+        request: Request, build: Callable[[], Dict[str, Any]], status_code: int = 200
+    ) -> Response:
+        if "api-key" not in request.query_params:
+            return JSONResponse(
+                {
+                    "fault": {
+                        "faultstring": "Failed to resolve API Key variable",
+                        "detail": {"errorcode": "steps.oauth.v2.FailedToResolveAPIKey"},
+                    }
+                },
+                status_code=401,
+            )
+
+        await asyncio.sleep(faults.latency())
+
+        if faults.rate_limited():
+            return JSONResponse(
+                {
+                    "fault": {
+                        "faultstring": "Rate limit quota violation.",
+                        "detail": {"errorcode": "policies.ratelimit.QuotaViolation"},
+                    }
+                },
+                status_code=429,
+                headers={"Retry-After": str(faults.retry_after())},
+            )
+
+        error_status = faults.server_error()
+        if error_status is not None:
+            return JSONResponse(
+                {"status": "ERROR", "errors": ["Simulated upstream failure"]},
+                status_code=error_status,
+            )
+
+        body = json.dumps(build(), separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if status_code == 200 and request.headers.get("if-none-match") == etag:
+            faults.record_not_modified()
+            return Response(status_code=304, headers={"ETag": etag})
+
+        headers = {"ETag": etag}
+        if faults.slow_body():
+            return StreamingResponse(
+                trickle(body),
+                status_code=status_code,
+                media_type="application/json",
+                headers=headers,
+            )
+        return Response(
+            body,
+            status_code=status_code,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    async def trickle(body: bytes) -> AsyncIterator[bytes]:
+        chunk_size = max(1, settings.slow_body_chunk_size)
+        for start in range(0, len(body), chunk_size):
+            if start:
+                await asyncio.sleep(settings.slow_body_chunk_delay_ms / 1000)
+            yield body[start : start + chunk_size]
+
+    @app.get("/lists.json")
+    async def lists(request: Request) -> Response:
+        params = request.query_params
+        code = params.get("list", "")
+        offset = int(params.get("offset") or 0)
+        if offset % 20 != 0:
+            return JSONResponse(
+                {"status": "ERROR", "errors": ["offset must be a multiple of 20"]},
+                status_code=400,
+            )
+        if code not in payloads.list_codes():
+            return await serve(
+                request,
+                lambda: {
+                    "status": "ERROR",
+                    "errors": ["No list found for list name and/or date provided."],
+                    "results": [],
+                },
+                status_code=404,
+            )
+        return await serve(
+            request,
+            lambda: payloads.lists(code, params.get("published-date"), offset),
+        )
+
+    @app.get("/lists/names.json")
+    async def names(request: Request) -> Response:
+        return await serve(request, payloads.names)
+
+    @app.get("/lists/overview.json")
+    async def overview(request: Request) -> Response:
+        published_date = request.query_params.get("published_date")
+        return await serve(request, lambda: payloads.overview(published_date))
+
+    @app.get("/lists/full-overview.json")
+    async def full_overview(request: Request) -> Response:
+        published_date = request.query_params.get("published_date")
+        return await serve(request, lambda: payloads.full_overview(published_date))
+
+    @app.get("/_simulator/stats")
+    async def stats() -> Dict[str, int]:
+        return faults.stats()
+
+    logger.info("NYT Books simulator ready", **settings.model_dump())
+    return app
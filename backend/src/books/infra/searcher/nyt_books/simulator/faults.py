@@ -0,0 +1,113 @@
+import math
+import random
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+from .settings import Settings
+
+
+class FaultInjector:
+    """
+    Decides, request by request, which delays and failures the simulator
+    injects. Every decision comes from a seeded Random so that a run can be
+    reproduced.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        rng: Optional[random.Random] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._settings = settings
+        self._rng = rng or random.Random(settings.seed)
+        self._clock = clock
+        self._accepted: Deque[float] = deque()
+        self._burst_remaining = 0
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "rate_limited": 0,
+            "server_errors": 0,
+            "slow_bodies": 0,
+            "not_modified": 0,
+        }
+
+    def latency(self) -> float:
+        """
+        Returns the delay to apply before answering, in seconds.
+        """
+        mean = self._settings.latency_mean_ms
+        stddev = self._settings.latency_stddev_ms
+        distribution = self._settings.latency_distribution
+        if mean <= 0:
+            return 0.0
+        if distribution == "normal":
+            millis = self._rng.gauss(mean, stddev)
+        elif distribution == "lognormal":
+            # Parameters chosen so that the samples keep the configured mean
+            # and standard deviation.
+            sigma2 = math.log(1 + (stddev / mean) ** 2)
+            millis = self._rng.lognormvariate(
+                math.log(mean) - sigma2 / 2, math.sqrt(sigma2)
+            )
+        elif distribution == "exponential":
+            millis = self._rng.expovariate(1 / mean)
+        else:
+            millis = mean
+        return max(0.0, millis) / 1000
+
+    def rate_limited(self) -> bool:
+        """
+        Tells whether the request must be answered with a 429, either because
+        it exceeds the per-minute quota or by random injection.
+        """
+        self._stats["requests"] += 1
+        limited = self._rng.random() < self._settings.rate_limit_probability
+
+        per_minute = self._settings.rate_limit_per_minute
+        if not limited and per_minute > 0:
+            now = self._clock()
+            while self._accepted and now - self._accepted[0] >= 60:
+                self._accepted.popleft()
+            limited = len(self._accepted) >= per_minute
+            if not limited:
+                self._accepted.append(now)
+
+        if limited:
+            self._stats["rate_limited"] += 1
+        return limited
+
+    def retry_after(self) -> int:
+        per_minute = self._settings.rate_limit_per_minute
+        if per_minute > 0 and self._accepted:
+            wait = 60 - (self._clock() - self._accepted[0])
+            return max(self._settings.retry_after_seconds, math.ceil(wait))
+        return self._settings.retry_after_seconds
+
+    def server_error(self) -> Optional[int]:
+        """
+        Returns the status of an injected server error, or None.
+
+        Once an error is triggered the next `error_burst_length - 1` requests
+        fail as well, mimicking an upstream outage rather than isolated blips.
+        """
+        if self._burst_remaining == 0:
+            if self._rng.random() >= self._settings.error_probability:
+                return None
+            self._burst_remaining = max(1, self._settings.error_burst_length)
+        self._burst_remaining -= 1
+        self._stats["server_errors"] += 1
+        return self._settings.error_status
+
+    def slow_body(self) -> bool:
+        slow = self._rng.random() < self._settings.slow_body_probability
+        if slow:
+            self._stats["slow_bodies"] += 1
+        return slow
+
+    def record_not_modified(self) -> None:
+        self._stats["not_modified"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
@@ -0,0 +1,224 @@
+import random
+import zlib
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from .settings import Settings
+
+KNOWN_LISTS = [
+    ("combined-print-and-e-book-fiction", "Combined Print & E-Book Fiction"),
+    ("combined-print-and-e-book-nonfiction", "Combined Print & E-Book Nonfiction"),
+    ("hardcover-fiction", "Hardcover Fiction"),
+    ("hardcover-nonfiction", "Hardcover Nonfiction"),
+    ("trade-fiction-paperback", "Paperback Trade Fiction"),
+    ("paperback-nonfiction", "Paperback Nonfiction"),
+    ("advice-how-to-and-miscellaneous", "Advice, How-To & Miscellaneous"),
+    ("childrens-middle-grade-hardcover", "Children’s Middle Grade Hardcover"),
+    ("picture-books", "Children’s Picture Books"),
+    ("series-books", "Children’s Series"),
+    ("young-adult-hardcover", "Young Adult Hardcover"),
+    ("audio-fiction", "Audio Fiction"),
+    ("audio-nonfiction", "Audio Nonfiction"),
+    ("business-books", "Business"),
+    ("graphic-books-and-manga", "Graphic Books and Manga"),
+    ("mass-market-monthly", "Mass Market Monthly"),
+]
+
+WORDS = (
+    "night river garden house silent empire winter secret daughter war light "
+    "last city stone ocean fire memory queen dark summer road long island king "
+    "golden broken wild hidden promise little lost story"
+).split()
+
+FIRST_NAMES = "Ana Colleen Stephen Emily James Kristin Freida Rebecca John Sally".split()
+LAST_NAMES = "Hoover King Henry Patterson Hannah McFadden Yarros Grisham Rooney".split()
+PUBLISHERS = "Atria Scribner Knopf Putnam Penguin Doubleday Harper Entangled".split()
+
+
+class PayloadGenerator:
+    """
+    Builds deterministic, NYT-shaped payloads.
+
+    The same list code, date and offset always produce the same books, so
+    ETags and cached responses behave as they do against the real API.
+    """
+
+    def __init__(self, settings: Settings):
+        self._settings = settings
+        self._lists = self._build_lists(settings.genres)
+
+    @staticmethod
+    def _build_lists(count: int) -> List[Dict[str, str]]:
+        lists = [
+            {"code": code, "display_name": name} for code, name in KNOWN_LISTS[:count]
+        ]
+        for index in range(len(lists), count):
+            lists.append(
+                {"code": f"simulated-list-{index}", "display_name": f"Simulated {index}"}
+            )
+        return lists
+
+    def _rng(self, *parts: Any) -> random.Random:
+        key = ":".join(str(part) for part in (self._settings.seed, *parts))
+        return random.Random(zlib.crc32(key.encode()))
+
+    def list_codes(self) -> List[str]:
+        return [item["code"] for item in self._lists]
+
+    def display_name(self, code: str) -> str:
+        for item in self._lists:
+            if item["code"] == code:
+                return item["display_name"]
+        return code.replace("-", " ").title()
+
+    @staticmethod
+    def dates(published_date: Optional[str]) -> Dict[str, str]:
+        published = date.fromisoformat(published_date) if published_date else None
+        if published is None:
+            today = date.today()
+            published = today - timedelta(days=(today.weekday() + 1) % 7)
+        return {
+            "published_date": published.isoformat(),
+            "bestsellers_date": (published - timedelta(days=15)).isoformat(),
+        }
+
+    def _book(self, code: str, published_date: str, rank: int) -> Dict[str, Any]:
+        rng = self._rng(code, published_date, rank)
+        author = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        isbn13 = "978" + "".join(str(rng.randrange(10)) for _ in range(10))
+        isbn10 = isbn13[3:]
+        return {
+            "title": " ".join(rng.choice(WORDS) for _ in range(3)).upper(),
+            "description": " ".join(
+                rng.choice(WORDS) for _ in range(self._settings.description_words)
+            ).capitalize(),
+            "contributor": f"by {author}",
+            "author": author,
+            "contributor_note": "",
+            "price": "0.00",
+            "age_group": "",
+            "publisher": rng.choice(PUBLISHERS),
+            "primary_isbn13": isbn13,
+            "primary_isbn10": isbn10,
+            "rank": rank,
+            "rank_last_week": rng.randrange(0, self._settings.results_per_list + 1),
+            "weeks_on_list": rng.randrange(0, 120),
+            "asterisk": 0,
+            "dagger": 0,
+            "amazon_product_url": f"https://www.amazon.com/dp/{isbn10}?tag=NYTBSREV-20",
+            "isbns": [{"isbn10": isbn10, "isbn13": isbn13}],
+            "book_review_link": "",
+            "first_chapter_link": "",
+            "sunday_review_link": "",
+            "article_chapter_link": "",
+        }
+
+    def lists(
+        self, code: str, published_date: Optional[str], offset: int
+    ) -> Dict[str, Any]:
+        dates = self.dates(published_date)
+        total = self._settings.results_per_list
+        results = []
+        for rank in range(offset + 1, min(offset + 20, total) + 1):
+            book = self._book(code, dates["published_date"], rank)
+            results.append(
+                {
+                    "list_name": self.display_name(code),
+                    "display_name": self.display_name(code),
+                    "bestsellers_date": dates["bestsellers_date"],
+                    "published_date": dates["published_date"],
+                    "published_date_description": "latest",
+                    "rank": rank,
+                    "rank_last_week": book["rank_last_week"],
+                    "weeks_on_list": book["weeks_on_list"],
+                    "asterisk": 0,
+                    "dagger": 0,
+                    "amazon_product_url": book["amazon_product_url"],
+                    "isbns": book["isbns"],
+                    "book_details": [
+                        {
+                            key: book[key]
+                            for key in (
+                                "title",
+                                "description",
+                                "contributor",
+                                "author",
+                                "contributor_note",
+                                "price",
+                                "age_group",
+                                "publisher",
+                                "primary_isbn13",
+                                "primary_isbn10",
+                            )
+                        }
+                    ],
+                    "reviews": [
+                        {
+                            key: book[key]
+                            for key in (
+                                "book_review_link",
+                                "first_chapter_link",
+                                "sunday_review_link",
+                                "article_chapter_link",
+                            )
+                        }
+                    ],
+                }
+            )
+        return {
+            "status": "OK",
+            "copyright": "Copyright (c) The New York Times Company. (simulated)",
+            "num_results": total,
+            "last_modified": f"{dates['published_date']}T00:00:00-05:00",
+            "results": results,
+        }
+
+    def names(self) -> Dict[str, Any]:
+        today = date.today().isoformat()
+        return {
+            "status": "OK",
+            "copyright": "Copyright (c) The New York Times Company. (simulated)",
+            "num_results": len(self._lists),
+            "results": [
+                {
+                    "list_name": item["display_name"],
+                    "display_name": item["display_name"],
+                    "list_name_encoded": item["code"],
+                    "oldest_published_date": "2008-06-08",
+                    "newest_published_date": today,
+                    "updated": "WEEKLY",
+                }
+                for item in self._lists
+            ],
+        }
+
+    def overview(self, published_date: Optional[str]) -> Dict[str, Any]:
+        # Like NYT, only the top five books of each list
+        return self._overview(published_date, min(self._settings.results_per_list, 5))
+
+    def full_overview(self, published_date: Optional[str]) -> Dict[str, Any]:
+        return self._overview(published_date, self._settings.results_per_list)
+
+    def _overview(self, published_date: Optional[str], limit: int) -> Dict[str, Any]:
+        dates = self.dates(published_date)
+        return {
+            "status": "OK",
+            "copyright": "Copyright (c) The New York Times Company. (simulated)",
+            "num_results": limit * len(self._lists),
+            "results": {
+                **dates,
+                "lists": [
+                    {
+                        "list_name": item["display_name"],
+                        "list_name_encoded": item["code"],
+                        "display_name": item["display_name"],
+                        "updated": "WEEKLY",
+                        "books": [
+                            self._book(item["code"], dates["published_date"], rank)
+                            for rank in range(1, limit + 1)
+                        ],
+                    }
+                    for item in self._lists
+                ],
+            },
+        }
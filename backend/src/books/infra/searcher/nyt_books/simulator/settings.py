@@ -0,0 +1,40 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    seed: int = 42
+    host: str = "127.0.0.1"
+    port: int = 8100
+
+    # Payloads
+    genres: int = 59
+    results_per_list: int = 15
+    description_words: int = 30
+
+    # Latency, in milliseconds
+    latency_distribution: Literal["fixed", "normal", "lognormal", "exponential"] = (
+        "fixed"
+    )
+    latency_mean_ms: float = 0.0
+    latency_stddev_ms: float = 0.0
+
+    # 429 Too Many Requests
+    rate_limit_per_minute: int = 0
+    rate_limit_probability: float = 0.0
+    retry_after_seconds: int = 1
+
+    # 5xx bursts
+    error_probability: float = 0.0
+    error_burst_length: int = 1
+    error_status: int = 503
+
+    # Slow bodies
+    slow_body_probability: float = 0.0
+    slow_body_chunk_size: int = 1024
+    slow_body_chunk_delay_ms: float = 50.0
+
+    class Config:
+        env_prefix = "NYT_SIMULATOR_"
+        case_sensitive = False
@@ -0,0 +1,154 @@
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, TypeVar
+
+import structlog
+
+from src.core.application.circuit_breaker.dto import CircuitState
+from src.core.application.circuit_breaker.exceptions import (
+    CircuitBreakerOpenException,
+)
+
+logger = structlog.get_logger(module="circuitBreaker", process="CircuitBreaker")
+
+ResultType = TypeVar("ResultType")
+
+STATE_CODES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitBreaker:
+    """
+    Count-based circuit breaker.
+
+    While closed, the outcome of the last `window_size` calls is kept; once
+    at least `minimum_calls` have been recorded and the failure rate reaches
+    `failure_rate_threshold`, the circuit opens and every call fails fast
+    with CircuitBreakerOpenException. After `open_seconds` it moves to
+    half-open and lets `half_open_max_calls` trial calls through: if all of
+    them succeed it closes again, and any failure opens it again.
+
+    `is_failure` decides which exceptions count as failures; the others are
+    re-raised without affecting the circuit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = lambda error: True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_rate_threshold = failure_rate_threshold
+        self._minimum_calls = minimum_calls
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._is_failure = is_failure
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._transitions: Dict[CircuitState, int] = {s: 0 for s in CircuitState}
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self._state:
+            return
+        logger.warning(
+            "Circuit breaker state changed",
+            circuit=self.name,
+            previous_state=self._state.value,
+            state=state.value,
+            failure_rate=self.failure_rate,
+        )
+        self._state = state
+        self._transitions[state] += 1
+        self._outcomes.clear()
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+
+    def _before_call(self) -> None:
+        state = self.state
+        if state == CircuitState.OPEN or (
+            state == CircuitState.HALF_OPEN
+            and self._half_open_in_flight >= self._half_open_max_calls
+        ):
+            self._rejected += 1
+            retry_in = max(0.0, self._opened_at + self._open_seconds - self._clock())
+            raise CircuitBreakerOpenException(self.name, retry_in)
+        if state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight += 1
+
+    def _record(self, success: bool) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            if not success:
+                self._transition(CircuitState.OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self._half_open_max_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self._state != CircuitState.CLOSED:
+            return
+        self._outcomes.append(success)
+        if (
+            len(self._outcomes) >= self._minimum_calls
+            and self.failure_rate >= self._failure_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    async def call(self, func: Callable[[], Awaitable[ResultType]]) -> ResultType:
+        self._before_call()
+        try:
+            result = await func()
+        except Exception as error:
+            self._record(success=not self._is_failure(error))
+            raise
+        except BaseException:
+            # Cancelled calls say nothing about the upstream health.
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            raise
+        self._record(success=True)
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "state": STATE_CODES[self.state],
+            "failure_rate": self.failure_rate,
+            "rejected": self._rejected,
+            **{
+                f"transitions_to_{state.value}": count
+                for state, count in self._transitions.items()
+            },
+        }
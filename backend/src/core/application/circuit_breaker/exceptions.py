@@ -0,0 +1,10 @@
+class CircuitBreakerOpenException(Exception):
+    """Exception raised when a call is rejected because the circuit is open"""
+
+    def __init__(self, name: str, retry_in: float, *args):
+        super().__init__(args)
+        self.name = name
+        self.retry_in = retry_in
+
+    def __str__(self) -> str:
+        return f"Circuit {self.name} is open, retry in {self.retry_in:.1f} seconds"
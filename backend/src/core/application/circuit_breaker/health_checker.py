@@ -0,0 +1,25 @@
+from src.core.application.circuit_breaker.base import CircuitBreaker
+from src.core.application.health_checkers.base import Check
+from src.core.application.health_checkers.dto import CheckResultDTO
+
+
+class CircuitBreakerCheck(Check):
+    """
+    Reports the state of a circuit breaker in `details` without ever failing.
+
+    An open breaker means the upstream is down, not this process: the pod
+    still serves cached pages and the last known good copies, so it must
+    stay ready. Failing here would take every pod out of rotation at once.
+    """
+
+    def __init__(self, circuit_breaker: CircuitBreaker, name: str = "CircuitBreaker"):
+        self.__circuit_breaker = circuit_breaker
+        self.__name = name
+
+    async def __call__(self) -> CheckResultDTO:
+        state = self.__circuit_breaker.state
+        return CheckResultDTO(
+            name=self.__name,
+            passed=True,
+            details=f"state={state.value}",
+        )
@@ -0,0 +1,29 @@
+from typing import Callable, Dict
+
+from src.core.application.metrics.dto import MetricsReportDTO
+
+MetricsCollector = Callable[[], Dict[str, float]]
+
+
+class MetricsRegistry:
+    """
+    In-process registry of metric collectors.
+
+    Each long-lived component (HTTP clients, caches, breakers...) registers a
+    collector under a unique name; the registry calls every collector when a
+    snapshot is requested, so values are always read live.
+    """
+
+    def __init__(self) -> None:
+        self.__collectors: Dict[str, MetricsCollector] = {}
+
+    def register(self, name: str, collector: MetricsCollector) -> None:
+        self.__collectors[name] = collector
+
+    def unregister(self, name: str) -> None:
+        self.__collectors.pop(name, None)
+
+    def snapshot(self) -> MetricsReportDTO:
+        return MetricsReportDTO(
+            sources={name: collector() for name, collector in self.__collectors.items()}
+        )
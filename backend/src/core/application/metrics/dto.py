@@ -0,0 +1,7 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class MetricsReportDTO(BaseModel):
+    sources: Dict[str, Dict[str, float]]
@@ -0,0 +1,157 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from src.core.application.retry.dto import ErrorKind, RetryDecisionDTO
+
+ResultType = TypeVar("ResultType")
+ErrorClassifier = Callable[[BaseException], RetryDecisionDTO]
+
+
+def never_retry(error: BaseException) -> RetryDecisionDTO:
+    return RetryDecisionDTO(retryable=False, kind=ErrorKind.OTHER)
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the traffic.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws
+    one, so retries can never exceed `ratio` of the calls. A small allowance
+    of `min_retries_per_second` keeps low-traffic callers able to retry.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 0.1,
+        max_tokens: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ratio = ratio
+        self._min_retries_per_second = min_retries_per_second
+        self._max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._updated_at = clock()
+        self._requests = 0
+        self._retries = 0
+        self._exhausted = 0
+
+    def _deposit(self, tokens: float) -> None:
+        self._tokens = min(self._max_tokens, self._tokens + tokens)
+
+    def record_request(self) -> None:
+        self._requests += 1
+        self._deposit(self._ratio)
+
+    def try_spend(self) -> bool:
+        now = self._clock()
+        self._deposit((now - self._updated_at) * self._min_retries_per_second)
+        self._updated_at = now
+        if self._tokens < 1:
+            self._exhausted += 1
+            return False
+        self._tokens -= 1
+        self._retries += 1
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "tokens": self._tokens,
+            "requests": self._requests,
+            "retries": self._retries,
+            "exhausted": self._exhausted,
+        }
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed call is retried.
+
+    Delays follow exponential backoff with full jitter: a random value
+    between 0 and `min(max_delay, base_delay * 2 ** attempt)`. Errors are
+    classified by `classifier`; only retryable ones are retried, and only
+    while the optional shared `budget` allows it. A `retry_after` hint from
+    the classifier is used as a lower bound for the delay.
+
+    The policy holds no per-call state, so one instance can be shared by
+    every caller; use `new_call` to track the attempts of a single call.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        classifier: ErrorClassifier = never_retry,
+        budget: Optional[RetryBudget] = None,
+        rng: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._classifier = classifier
+        self._budget = budget
+        self._rng = rng
+
+    def classify(self, error: BaseException) -> RetryDecisionDTO:
+        return self._classifier(error)
+
+    def backoff(self, attempt: int) -> float:
+        return self._rng(0, min(self._max_delay, self._base_delay * 2**attempt))
+
+    def record_request(self) -> None:
+        if self._budget is not None:
+            self._budget.record_request()
+
+    def next_delay(self, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Returns the delay before retrying a call whose attempt number
+        `attempt` (starting at 0) failed with `error`, or None if the call
+        must not be retried.
+        """
+        decision = self.classify(error)
+        if not decision.retryable or attempt + 1 >= self.max_attempts:
+            return None
+        if self._budget is not None and not self._budget.try_spend():
+            return None
+        delay = self.backoff(attempt)
+        if decision.retry_after is not None:
+            delay = max(delay, decision.retry_after)
+        return delay
+
+    def new_call(self) -> "RetryState":
+        self.record_request()
+        return RetryState(self)
+
+    async def run(self, func: Callable[[], Awaitable[ResultType]]) -> ResultType:
+        call = self.new_call()
+        while True:
+            try:
+                return await func()
+            except Exception as error:
+                delay = call.next_delay(error)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, float]:
+        if self._budget is None:
+            return {}
+        return {f"budget_{name}": value for name, value in self._budget.stats().items()}
+
+
+class RetryState:
+    """Attempt counter of a single call made under a RetryPolicy."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._policy = policy
+        self.attempt = 0
+
+    def next_delay(self, error: BaseException) -> Optional[float]:
+        delay = self._policy.next_delay(self.attempt, error)
+        if delay is not None:
+            self.attempt += 1
+        return delay
@@ -0,0 +1,17 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ErrorKind(str, Enum):
+    CONNECT = "connect"
+    READ = "read"
+    STATUS = "status"
+    OTHER = "other"
+
+
+class RetryDecisionDTO(BaseModel):
+    retryable: bool
+    kind: ErrorKind = ErrorKind.OTHER
+    retry_after: Optional[float] = None
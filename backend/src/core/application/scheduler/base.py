@@ -0,0 +1,170 @@
+import asyncio
+import time
+from datetime import date, datetime, time as day_time, timedelta, timezone
+from typing import Awaitable, Callable, Dict, FrozenSet, Optional
+
+import structlog
+
+logger = structlog.get_logger(module="scheduler", process="ScheduledJob")
+
+# (minimum, maximum) of each field: minute, hour, day of month, month, day of week
+CRON_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+
+def _parse_cron_field(field: str, minimum: int, maximum: int) -> FrozenSet[int]:
+    values = set()
+    for part in field.split(","):
+        expression, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if expression == "*":
+            start, end = minimum, maximum
+        elif "-" in expression:
+            start_text, end_text = expression.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(expression)
+            end = maximum if step_text else start
+        if step < 1 or start > end:
+            raise ValueError(f"Invalid cron field: {field!r}")
+        values.update(range(start, end + 1, step))
+    if maximum == 6:
+        # Both 0 and 7 mean Sunday
+        values = {value % 7 for value in values}
+    if not values or min(values) < minimum or max(values) > maximum:
+        raise ValueError(f"Invalid cron field: {field!r}")
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    Five-field cron expression (minute, hour, day of month, month, day of
+    week, with Sunday as 0 or 7) evaluated in UTC.
+
+    Fields accept `*`, single values, ranges, lists and `/step`. As in cron,
+    when both the day of month and the day of week are restricted a day
+    matching either of them is enough.
+    """
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Expected five cron fields, got {expression!r}")
+        self.expression = expression
+        (
+            self._minutes,
+            self._hours,
+            self._days,
+            self._months,
+            self._weekdays,
+        ) = (
+            _parse_cron_field(field, minimum, maximum)
+            for field, (minimum, maximum) in zip(fields, CRON_FIELD_RANGES)
+        )
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Returns the first matching minute strictly after `moment`."""
+        moment = moment.astimezone(timezone.utc)
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.date()
+        # Any valid expression matches within a few years (29 February)
+        for _ in range(366 * 8):
+            if self._matches_day(day):
+                for hour in sorted(self._hours):
+                    for minute in sorted(self._minutes):
+                        candidate = datetime.combine(
+                            day, day_time(hour, minute), tzinfo=timezone.utc
+                        )
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
+
+    def _matches_day(self, day: date) -> bool:
+        if day.month not in self._months:
+            return False
+        day_matches = day.day in self._days
+        # date.weekday() counts from Monday, cron from Sunday
+        weekday_matches = (day.weekday() + 1) % 7 in self._weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day_matches or weekday_matches
+        return day_matches and weekday_matches
+
+
+class ScheduledJob:
+    """
+    Runs `job` in a background task at every occurrence of `schedule`.
+
+    A failed run is logged and counted but does not stop the schedule. Runs
+    never overlap: if one outlasts the next occurrence, that occurrence is
+    skipped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        schedule: CronSchedule,
+        job: Callable[[], Awaitable[None]],
+        run_on_start: bool = False,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.name = name
+        self._schedule = schedule
+        self._job = job
+        self._run_on_start = run_on_start
+        self._clock = clock
+        self._sleep = sleep
+        self._task: Optional[asyncio.Task] = None
+        self._next_run: Optional[datetime] = None
+        self._runs = 0
+        self._failures = 0
+        self._last_duration = 0.0
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self) -> None:
+        started_at = time.perf_counter()
+        logger.info("Running scheduled job", job=self.name)
+        try:
+            await self._job()
+        except Exception as exc:
+            self._failures += 1
+            logger.error("Scheduled job failed", job=self.name, error=str(exc))
+        finally:
+            self._runs += 1
+            self._last_duration = time.perf_counter() - started_at
+
+    async def _run(self) -> None:
+        if self._run_on_start:
+            await self.run_once()
+        while True:
+            now = self._clock()
+            self._next_run = self._schedule.next_after(now)
+            logger.info(
+                "Scheduled job waiting",
+                job=self.name,
+                next_run=self._next_run.isoformat(),
+            )
+            await self._sleep((self._next_run - now).total_seconds())
+            await self.run_once()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "runs": self._runs,
+            "failures": self._failures,
+            "last_duration_seconds": self._last_duration,
+            "next_run_timestamp": self._next_run.timestamp() if self._next_run else 0.0,
+        }
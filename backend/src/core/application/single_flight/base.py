@@ -0,0 +1,48 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+ResultType = TypeVar("ResultType")
+
+
+class SingleFlight(Generic[ResultType]):
+    """
+    Coalesces concurrent calls that share the same key.
+
+    The first caller for a key starts the work in its own task; every caller
+    that arrives while it is running awaits that same task and receives the
+    same result or exception. The work is shielded, so a cancelled caller
+    does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self.__in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.__calls = 0
+        self.__coalesced = 0
+
+    async def do(
+        self, key: Hashable, func: Callable[[], Awaitable[ResultType]]
+    ) -> ResultType:
+        self.__calls += 1
+        task = self.__in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self.__in_flight[key] = task
+            task.add_done_callback(lambda done: self.__forget(key, done))
+        else:
+            self.__coalesced += 1
+        return await asyncio.shield(task)
+
+    def __forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self.__in_flight.get(key) is task:
+            del self.__in_flight[key]
+        # Mark the exception as retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "calls": self.__calls,
+            "coalesced": self.__coalesced,
+            "executed": self.__calls - self.__coalesced,
+            "in_flight": len(self.__in_flight),
+        }
@@ -1,14 +1,15 @@
-from typing import Protocol, Any
+from typing import Any, Dict, List, Optional, Protocol
 
 
 class RedisProtocol(Protocol):
-    async def set(self, key: str, value: Any) -> None:
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
         Set a value for a given key in Redis.
 
         Args:
             key (str): The key to set.
             value (Any): The value to store.
+            ttl (Optional[int]): Seconds until the key expires, never if None.
         """
         ...
 
@@ -23,3 +24,105 @@ class RedisProtocol(Protocol):
             Any: The value associated with the key, or None if the key doesn't exist.
         """
         ...
+
+    async def get_many(self, keys: List[str]) -> List[Any]:
+        """
+        Get the values of several keys in a single round trip.
+
+        Args:
+            keys (List[str]): The keys to retrieve.
+
+        Returns:
+            List[Any]: The values in the same order as `keys`, None for missing keys.
+        """
+        ...
+
+    async def get_ttls(self, keys: List[str]) -> List[int]:
+        """
+        Get the remaining time to live of several keys in a single round trip.
+
+        Args:
+            keys (List[str]): The keys to inspect.
+
+        Returns:
+            List[int]: Seconds left for each key, in the same order as `keys`; -1 for keys that never expire and -2 for missing keys.
+        """
+        ...
+
+    async def scan_keys(self, pattern: str) -> List[str]:
+        """
+        Find the keys matching a glob pattern, iterating with SCAN so that
+        Redis is never blocked.
+
+        Args:
+            pattern (str): The glob pattern to match.
+
+        Returns:
+            List[str]: The matching keys, in no particular order.
+        """
+        ...
+
+    async def set_if_absent(
+        self, key: str, value: Any, ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set a value only if the key does not exist yet.
+
+        Args:
+            key (str): The key to set.
+            value (Any): The value to store.
+            ttl (Optional[int]): Seconds until the key expires, never if None.
+
+        Returns:
+            bool: True if the key was set, False if it already existed.
+        """
+        ...
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Dict[str, Optional[int]]] = None,
+    ) -> None:
+        """
+        Set several keys in a single round trip.
+
+        Args:
+            mapping (Dict[str, Any]): The values to store, by key.
+            ttl (Optional[int]): Seconds until the keys expire, never if None.
+            ttls (Optional[Dict[str, Optional[int]]]): Per-key TTLs overriding `ttl`.
+        """
+        ...
+
+    async def publish(self, channel: str, message: Any) -> None:
+        """
+        Publish a message on a pub/sub channel.
+
+        Args:
+            channel (str): The channel to publish on.
+            message (Any): The message to send.
+        """
+        ...
+
+    async def increment_scores(self, key: str, increments: Dict[str, float]) -> None:
+        """
+        Add to the scores of several members of a sorted set in a single
+        round trip, creating the set and the members as needed.
+
+        Args:
+            key (str): The sorted set to update.
+            increments (Dict[str, float]): The amount to add, by member.
+        """
+        ...
+
+    async def get_scores(self, key: str) -> Dict[str, float]:
+        """
+        Get every member of a sorted set with its score.
+
+        Args:
+            key (str): The sorted set to read.
+
+        Returns:
+            Dict[str, float]: The scores by member, highest first; empty if the key doesn't exist.
+        """
+        ...
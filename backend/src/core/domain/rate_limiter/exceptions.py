@@ -0,0 +1,11 @@
+class RateLimitExceededException(Exception):
+    """Exception raised when a caller gives up waiting for a rate limit
+    token, because the queue is full or the wait would be too long"""
+
+    def __init__(self, reason: str, waited: float, *args):
+        super().__init__(args)
+        self.reason = reason
+        self.waited = waited
+
+    def __str__(self) -> str:
+        return f"No rate limit token after {self.waited:.1f} seconds: {self.reason}"
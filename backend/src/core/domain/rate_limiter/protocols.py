@@ -0,0 +1,26 @@
+from typing import Protocol
+
+from src.core.domain.rate_limiter.schemas import RequestPriority
+
+
+class RateLimiterProtocol(Protocol):
+    async def acquire(
+        self, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> None:
+        """
+        Wait in the queue until a token is available and take it.
+
+        Args:
+            priority (RequestPriority): Priority of the caller in the queue.
+        """
+        ...
+
+    async def penalize(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for the given time, for instance after the
+        upstream answered with a 429 and a Retry-After header.
+
+        Args:
+            seconds (float): Time during which no token is granted.
+        """
+        ...
@@ -0,0 +1,13 @@
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority of a caller waiting for a rate limit token.
+
+    Lower values are served first: interactive API requests go ahead of
+    background work such as cache fills.
+    """
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
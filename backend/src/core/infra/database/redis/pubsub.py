@@ -0,0 +1,89 @@
+import asyncio
+from typing import Callable, Optional
+
+import structlog
+from redis.exceptions import RedisError
+
+from src.core.infra.database.redis.service import RedisClient
+
+logger = structlog.get_logger(module="database", process="RedisSubscriber")
+
+
+class RedisSubscriber:
+    """
+    Listens to a Redis pub/sub channel in a background task and hands every
+    message to `on_message`.
+
+    The subscription is re-established after connection errors. Messages
+    published while it was down are lost, so `on_subscribe` is called on
+    every (re)subscription to let the owner drop whatever state those
+    messages would have invalidated.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        channel: str,
+        on_message: Callable[[bytes], None],
+        on_subscribe: Optional[Callable[[], None]] = None,
+        poll_interval: float = 1.0,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self._redis_client = redis_client
+        self._channel = channel
+        self._on_message = on_message
+        self._on_subscribe = on_subscribe
+        self._poll_interval = poll_interval
+        self._reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except (RedisError, OSError) as exc:
+                logger.warning(
+                    "Redis subscription lost, retrying",
+                    channel=self._channel,
+                    error=str(exc),
+                )
+                await asyncio.sleep(self._reconnect_delay)
+
+    async def _listen(self) -> None:
+        await self._redis_client.connect()
+        pubsub = self._redis_client.connection.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self._channel)
+            logger.info("Subscribed to Redis channel", channel=self._channel)
+            if self._on_subscribe is not None:
+                self._on_subscribe()
+            while True:
+                # Polling with a timeout instead of blocking keeps the
+                # connection's socket timeout from firing on an idle channel.
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self._poll_interval
+                )
+                if message is not None:
+                    try:
+                        self._on_message(message["data"])
+                    except Exception as exc:
+                        logger.error(
+                            "Error handling Redis message",
+                            channel=self._channel,
+                            error=str(exc),
+                        )
+        finally:
+            await pubsub.aclose()
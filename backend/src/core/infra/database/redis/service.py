@@ -1,30 +1,166 @@
+from typing import Any, Dict, List, Optional
+
 import redis.asyncio as redis
-from typing import Any
+import structlog
+
 from src.core.domain.database.schemas import RedisProtocol
 
+logger = structlog.get_logger(module="database", process="RedisClient")
+
+
 class RedisClient:
-    def __init__(self):
-        self.connection = None
+    """
+    Owns the process-wide Redis connection pool.
+
+    The pool is opened once at startup and shared by every caller until
+    `close`; requests borrow a connection from it and wait up to
+    `pool_timeout` when all `max_connections` are busy.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://backend-redis:6379",
+        max_connections: int = 50,
+        pool_timeout: float = 5.0,
+        socket_timeout: Optional[float] = 5.0,
+        socket_connect_timeout: Optional[float] = 2.0,
+        health_check_interval: int = 30,
+    ):
+        self._url = url
+        self._max_connections = max_connections
+        self._pool_timeout = pool_timeout
+        self._socket_timeout = socket_timeout
+        self._socket_connect_timeout = socket_connect_timeout
+        self._health_check_interval = health_check_interval
+        self._pool: Optional[redis.BlockingConnectionPool] = None
+        self.connection: Optional[redis.Redis] = None
 
     async def connect(self):
-        self.connection = await redis.from_url("redis://backend-redis:6379")
+        if self.connection is None:
+            self._pool = redis.BlockingConnectionPool.from_url(
+                self._url,
+                max_connections=self._max_connections,
+                timeout=self._pool_timeout,
+                socket_timeout=self._socket_timeout,
+                socket_connect_timeout=self._socket_connect_timeout,
+                health_check_interval=self._health_check_interval,
+            )
+            self.connection = redis.Redis(connection_pool=self._pool)
+            logger.info(
+                "Redis connection pool opened",
+                max_connections=self._max_connections,
+            )
 
     async def close(self):
-        if self.connection:
-            await self.connection.close()
+        if self.connection is not None:
+            await self.connection.aclose()
+            await self._pool.disconnect()
+            logger.info("Redis connection pool closed", **self.pool_stats())
+            self.connection = None
+            self._pool = None
+
+    def pool_stats(self) -> Dict[str, float]:
+        """
+        Returns how many pooled connections exist and how many are borrowed.
+        """
+        if self._pool is None:
+            return {
+                "connections_open": 0,
+                "connections_in_use": 0,
+                "connections_idle": 0,
+                "max_connections": self._max_connections,
+            }
+        in_use = len(self._pool._in_use_connections)
+        idle = len(self._pool._available_connections)
+        return {
+            "connections_open": in_use + idle,
+            "connections_in_use": in_use,
+            "connections_idle": idle,
+            "max_connections": self._max_connections,
+        }
+
 
 class RedisService(RedisProtocol):
-    def __init__(self):
-        self.client = RedisClient()
+    def __init__(self, client: Optional[RedisClient] = None):
+        self.client = client or RedisClient()
 
     async def setup(self):
         await self.client.connect()
 
-    async def set(self, key: str, value: Any) -> None:
-        await self.client.connection.set(key, value)
+    async def _connection(self) -> redis.Redis:
+        if self.client.connection is None:
+            await self.client.connect()
+        return self.client.connection
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        connection = await self._connection()
+        await connection.set(key, value, ex=ttl)
 
     async def get(self, key: str) -> Any:
-        return await self.client.connection.get(key)
+        connection = await self._connection()
+        return await connection.get(key)
+
+    async def get_many(self, keys: List[str]) -> List[Any]:
+        if not keys:
+            return []
+        connection = await self._connection()
+        return await connection.mget(keys)
+
+    async def get_ttls(self, keys: List[str]) -> List[int]:
+        if not keys:
+            return []
+        connection = await self._connection()
+        async with connection.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.ttl(key)
+            return await pipe.execute()
+
+    async def scan_keys(self, pattern: str) -> List[str]:
+        connection = await self._connection()
+        return [
+            key.decode() if isinstance(key, bytes) else key
+            async for key in connection.scan_iter(match=pattern, count=500)
+        ]
+
+    async def set_if_absent(
+        self, key: str, value: Any, ttl: Optional[int] = None
+    ) -> bool:
+        connection = await self._connection()
+        return bool(await connection.set(key, value, ex=ttl, nx=True))
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Dict[str, Optional[int]]] = None,
+    ) -> None:
+        ttls = ttls or {}
+        connection = await self._connection()
+        async with connection.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ttls.get(key, ttl))
+            await pipe.execute()
+
+    async def publish(self, channel: str, message: Any) -> None:
+        connection = await self._connection()
+        await connection.publish(channel, message)
+
+    async def increment_scores(self, key: str, increments: Dict[str, float]) -> None:
+        if not increments:
+            return
+        connection = await self._connection()
+        async with connection.pipeline(transaction=False) as pipe:
+            for member, amount in increments.items():
+                pipe.zincrby(key, amount, member)
+            await pipe.execute()
+
+    async def get_scores(self, key: str) -> Dict[str, float]:
+        connection = await self._connection()
+        members = await connection.zrevrange(key, 0, -1, withscores=True)
+        return {
+            member.decode() if isinstance(member, bytes) else member: score
+            for member, score in members
+        }
 
     async def close(self):
         await self.client.close()
@@ -0,0 +1,145 @@
+import asyncio
+import heapq
+import itertools
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+from src.core.domain.rate_limiter.exceptions import RateLimitExceededException
+from src.core.domain.rate_limiter.schemas import RequestPriority
+
+logger = structlog.get_logger(module="rateLimiter", process="queue")
+
+
+class QueuedRateLimiter(ABC):
+    """
+    Base class for token bucket rate limiters with a local priority queue.
+
+    Callers wait in a heap ordered by (priority, arrival). Only the caller at
+    the head of the queue asks the backend for a token; when it is told to
+    wait, it sleeps until the token should be available (or until a caller
+    with higher priority arrives and takes its place at the head).
+
+    Interactive callers have someone waiting on them, so they give up with
+    `RateLimitExceededException` instead of queueing without end: when
+    `max_queue` of them are already waiting, or once they have waited
+    `max_wait` seconds, or as soon as the token is known to come later than
+    that. Background callers always wait for their turn.
+    """
+
+    def __init__(
+        self,
+        max_poll_interval: float = 1.0,
+        max_wait: Optional[float] = None,
+        max_queue: Optional[int] = None,
+    ) -> None:
+        self._max_poll_interval = max_poll_interval
+        self._max_wait = max_wait
+        self._max_queue = max_queue
+        self._condition = asyncio.Condition()
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._granted: Dict[RequestPriority, int] = {p: 0 for p in RequestPriority}
+        self._wait_seconds_total = 0.0
+        self._penalties = 0
+        self._rejected = 0
+
+    @abstractmethod
+    async def _try_acquire(self, priority: RequestPriority) -> float:
+        """
+        Take a token if one is available for the given priority.
+
+        Returns:
+            float: 0 when a token was taken, otherwise the number of seconds
+            until one should be available.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _block(self, seconds: float) -> None:
+        raise NotImplementedError()
+
+    async def acquire(
+        self, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> None:
+        """
+        Raises:
+            RateLimitExceededException: if an interactive caller gives up.
+        """
+        entry = (int(priority), next(self._sequence))
+        started_at = time.perf_counter()
+        deadline = None
+        if priority == RequestPriority.INTERACTIVE:
+            if self._max_queue is not None and (
+                self._waiting(priority) >= self._max_queue
+            ):
+                self._reject("queue is full", started_at)
+            if self._max_wait is not None:
+                deadline = started_at + self._max_wait
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            self._condition.notify_all()
+            try:
+                while True:
+                    timeout = self._max_poll_interval
+                    if deadline is not None:
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            self._reject("waited too long", started_at)
+                        timeout = min(timeout, remaining)
+                    if self._waiters[0] != entry:
+                        await self._wait(None if deadline is None else timeout)
+                        continue
+                    wait = await self._try_acquire(priority)
+                    if wait <= 0:
+                        break
+                    if deadline is not None and (
+                        time.perf_counter() + wait > deadline
+                    ):
+                        self._reject("next token is too far away", started_at)
+                    await self._wait(min(wait, timeout))
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+        self._granted[priority] += 1
+        self._wait_seconds_total += time.perf_counter() - started_at
+
+    async def _wait(self, timeout: Optional[float]) -> None:
+        """Waits for the queue to change, or at most `timeout` seconds."""
+        try:
+            await asyncio.wait_for(self._condition.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+
+    def _waiting(self, priority: RequestPriority) -> int:
+        return sum(1 for waiter, _ in self._waiters if waiter == priority)
+
+    def _reject(self, reason: str, started_at: float) -> None:
+        self._rejected += 1
+        waited = time.perf_counter() - started_at
+        logger.warning("Rate limit token not granted", reason=reason, waited=waited)
+        raise RateLimitExceededException(reason, waited)
+
+    async def penalize(self, seconds: float) -> None:
+        logger.warning("Rate limiter blocked", seconds=seconds)
+        self._penalties += 1
+        await self._block(seconds)
+        async with self._condition:
+            self._condition.notify_all()
+
+    async def close(self) -> None:
+        """Releases the resources held by the backend, if any."""
+
+    def stats(self) -> Dict[str, float]:
+        waiting = {p: self._waiting(p) for p in RequestPriority}
+        return {
+            **{f"waiting_{p.name.lower()}": count for p, count in waiting.items()},
+            **{f"granted_{p.name.lower()}": count for p, count in self._granted.items()},
+            "wait_seconds_total": self._wait_seconds_total,
+            "penalties": self._penalties,
+            "rejected": self._rejected,
+        }
@@ -0,0 +1,81 @@
+import time
+from typing import Callable, Optional
+
+from src.core.domain.rate_limiter.schemas import RequestPriority
+from src.core.infra.rate_limiter.base import QueuedRateLimiter
+
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_second: float, now: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+
+    def wait_time(self, needed: float) -> float:
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.refill_per_second
+
+
+class InMemoryRateLimiter(QueuedRateLimiter):
+    """
+    Per-minute and per-day token buckets kept in process memory.
+
+    Background callers must leave `background_reserve` (a fraction of each
+    bucket) untouched so interactive callers always find a token first.
+    """
+
+    def __init__(
+        self,
+        per_minute: int,
+        per_day: int,
+        background_reserve: float = 0.2,
+        max_poll_interval: float = 1.0,
+        max_wait: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            max_poll_interval=max_poll_interval,
+            max_wait=max_wait,
+            max_queue=max_queue,
+        )
+        self._clock = clock
+        now = clock()
+        self._buckets = (
+            TokenBucket(per_minute, per_minute / SECONDS_PER_MINUTE, now),
+            TokenBucket(per_day, per_day / SECONDS_PER_DAY, now),
+        )
+        self._background_reserve = background_reserve
+        self._blocked_until = 0.0
+
+    async def _try_acquire(self, priority: RequestPriority) -> float:
+        now = self._clock()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+
+        wait = 0.0
+        for bucket in self._buckets:
+            bucket.refill(now)
+            needed = 1.0
+            if priority != RequestPriority.INTERACTIVE:
+                needed += bucket.capacity * self._background_reserve
+            wait = max(wait, bucket.wait_time(needed))
+        if wait > 0:
+            return wait
+
+        for bucket in self._buckets:
+            bucket.tokens -= 1
+        return 0.0
+
+    async def _block(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
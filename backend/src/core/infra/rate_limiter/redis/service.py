@@ -0,0 +1,144 @@
+from typing import Dict, Optional
+
+import structlog
+from redis.exceptions import RedisError
+
+from src.core.domain.rate_limiter.schemas import RequestPriority
+from src.core.infra.database.redis.service import RedisClient
+from src.core.infra.rate_limiter.base import QueuedRateLimiter
+from src.core.infra.rate_limiter.memory.service import InMemoryRateLimiter
+
+logger = structlog.get_logger(module="rateLimiter", process="RedisRateLimiter")
+
+# KEYS: minute bucket, day bucket, blocked-until marker.
+# ARGV: minute capacity, day capacity, background reserve ratio, priority.
+# Uses the server clock so every process agrees on the time. The result is
+# returned as a string because Redis truncates Lua numbers to integers.
+ACQUIRE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local blocked_until = tonumber(redis.call('GET', KEYS[3]) or '0')
+if blocked_until > now then
+    return tostring(blocked_until - now)
+end
+
+local reserve = 0
+if tonumber(ARGV[4]) > 0 then
+    reserve = tonumber(ARGV[3])
+end
+
+local buckets = {
+    {KEYS[1], tonumber(ARGV[1]), tonumber(ARGV[1]) / 60, 120},
+    {KEYS[2], tonumber(ARGV[2]), tonumber(ARGV[2]) / 86400, 172800},
+}
+local wait = 0
+for _, bucket in ipairs(buckets) do
+    local state = redis.call('HMGET', bucket[1], 'tokens', 'updated_at')
+    local tokens = tonumber(state[1]) or bucket[2]
+    local updated_at = tonumber(state[2]) or now
+    tokens = math.min(bucket[2], tokens + math.max(0, now - updated_at) * bucket[3])
+    bucket[5] = tokens
+    local needed = 1 + bucket[2] * reserve
+    if tokens < needed then
+        wait = math.max(wait, (needed - tokens) / bucket[3])
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+
+for _, bucket in ipairs(buckets) do
+    redis.call('HSET', bucket[1], 'tokens', bucket[5] - 1, 'updated_at', now)
+    redis.call('EXPIRE', bucket[1], bucket[4])
+end
+return '0'
+"""
+
+
+class RedisRateLimiter(QueuedRateLimiter):
+    """
+    Token bucket rate limiter whose state lives in Redis, so every process
+    talking to the same upstream shares the per-minute and per-day quotas.
+
+    When Redis cannot be reached it falls back to an in-memory limiter with
+    the same quotas, which keeps the process within the limits on its own.
+    The Redis client is shared with the rest of the process and is closed by
+    its owner, not by the limiter.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        key: str,
+        per_minute: int,
+        per_day: int,
+        background_reserve: float = 0.2,
+        max_poll_interval: float = 1.0,
+        max_wait: Optional[float] = None,
+        max_queue: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            max_poll_interval=max_poll_interval,
+            max_wait=max_wait,
+            max_queue=max_queue,
+        )
+        self._redis_client = redis_client
+        self._keys = [f"{key}:minute", f"{key}:day", f"{key}:blocked_until"]
+        self._per_minute = per_minute
+        self._per_day = per_day
+        self._background_reserve = background_reserve
+        self._script = None
+        self._fallback = InMemoryRateLimiter(
+            per_minute=per_minute,
+            per_day=per_day,
+            background_reserve=background_reserve,
+            max_poll_interval=max_poll_interval,
+        )
+        self._fallbacks = 0
+
+    async def _get_script(self):
+        if self._redis_client.connection is None:
+            await self._redis_client.connect()
+        if self._script is None:
+            self._script = self._redis_client.connection.register_script(
+                ACQUIRE_SCRIPT
+            )
+        return self._script
+
+    async def _try_acquire(self, priority: RequestPriority) -> float:
+        try:
+            script = await self._get_script()
+            wait = await script(
+                keys=self._keys,
+                args=[
+                    self._per_minute,
+                    self._per_day,
+                    self._background_reserve,
+                    int(priority),
+                ],
+            )
+            return float(wait)
+        except (RedisError, OSError) as exc:
+            self._fallbacks += 1
+            logger.warning(
+                "Redis rate limiter unavailable, using in-memory fallback",
+                error=str(exc),
+            )
+            return await self._fallback._try_acquire(priority)
+
+    async def _block(self, seconds: float) -> None:
+        await self._fallback._block(seconds)
+        try:
+            if self._redis_client.connection is None:
+                await self._redis_client.connect()
+            connection = self._redis_client.connection
+            blocked_until: Optional[bytes] = await connection.get(self._keys[2])
+            time_seconds, time_micros = await connection.time()
+            until = time_seconds + time_micros / 1_000_000 + seconds
+            if blocked_until is None or float(blocked_until) < until:
+                await connection.set(self._keys[2], until, ex=int(seconds) + 1)
+        except (RedisError, OSError) as exc:
+            logger.warning("Could not store rate limit block in Redis", error=str(exc))
+
+    def stats(self) -> Dict[str, float]:
+        return {**super().stats(), "fallbacks": self._fallbacks}
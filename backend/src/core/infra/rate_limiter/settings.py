@@ -0,0 +1,17 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    rate_limit_backend: Literal["redis", "memory"] = "redis"
+    rate_limit_key: str = "rate_limit:nyt"
+    rate_limit_per_minute: int = 5
+    rate_limit_per_day: int = 500
+    rate_limit_background_reserve: float = 0.2
+    rate_limit_max_poll_interval: float = 1.0
+    # Interactive callers give up after waiting this long, or when this many
+    # are already queued, so that the API can answer stale or 503; 0 waits
+    # without limit
+    rate_limit_max_wait: float = 5.0
+    rate_limit_max_queue: int = 50
@@ -0,0 +1,124 @@
+import hashlib
+import struct
+import time
+import zlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.presentation.api.commons.conditional import etag_matches, not_modified
+from src.presentation.api.commons.response_model import (
+    BaseResponseModel,
+    ResponseMetadataModel,
+)
+
+# Fixed gzip member header: deflate, no flags, no mtime, unknown OS
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+# Pages that never go stale, such as past weeks' lists
+HISTORICAL_MAX_AGE = 86400
+
+
+class RenderedBody:
+    """
+    The JSON body of a `BaseResponseModel`, rendered once and reused.
+
+    Everything but `metadata` is kept as bytes; the metadata, which carries
+    the data's age, is appended per request. For gzip the rendered part is
+    deflated once and ended with a full flush, so each response only
+    compresses its own few tail bytes and patches the CRC and length.
+
+    `etag` is a hash of the rendered part, so it changes with the data and
+    the message. The metadata, which only reports how old the data is, is
+    left out of it, so the body is not byte for byte the same under one
+    `etag` and the tag is weak (`W/"..."`); the gzip variant shares it.
+    """
+
+    def __init__(self, response: BaseResponseModel, gzip_level: int = 6):
+        rendered = response.model_dump_json(exclude={"metadata"}).encode()
+        # Drop the closing brace: the metadata goes in before it
+        self._prefix = rendered[:-1]
+        self._gzip_level = gzip_level
+        compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self._deflated_prefix = compressor.compress(self._prefix) + compressor.flush(
+            zlib.Z_FULL_FLUSH
+        )
+        self._prefix_crc = zlib.crc32(self._prefix)
+        digest = hashlib.blake2b(self._prefix, digest_size=12).hexdigest()
+        self.etag = f'W/"{digest}"'
+
+    def _tail(self, metadata: ResponseMetadataModel) -> bytes:
+        return b',"metadata":' + metadata.model_dump_json().encode() + b"}"
+
+    def body(self, metadata: ResponseMetadataModel) -> bytes:
+        return self._prefix + self._tail(metadata)
+
+    def gzip_body(self, metadata: ResponseMetadataModel) -> bytes:
+        tail = self._tail(metadata)
+        compressor = zlib.compressobj(
+            self._gzip_level, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        deflated_tail = compressor.compress(tail) + compressor.flush()
+        crc = zlib.crc32(tail, self._prefix_crc)
+        size = (len(self._prefix) + len(tail)) & 0xFFFFFFFF
+        return (
+            GZIP_HEADER
+            + self._deflated_prefix
+            + deflated_tail
+            + struct.pack("<II", crc, size)
+        )
+
+
+def render_cached_books(cached: CachedBooksSchema, message: str) -> RenderedBody:
+    """
+    Returns the rendered body for a cached page, rendering it on first use.
+
+    The rendering is memoized on the cache entry itself, so it lives exactly
+    as long as the entry stays in the local cache tier.
+    """
+    rendered = cached.rendered.get(message)
+    if rendered is None:
+        rendered = RenderedBody(
+            BaseResponseModel(error=False, message=message, data=cached.data)
+        )
+        cached.rendered[message] = rendered
+    return rendered
+
+
+def cache_control_for(cached: CachedBooksSchema, now: Optional[float] = None) -> str:
+    """
+    Lets clients keep a page until it goes stale; past that they have to
+    revalidate, which costs a 304 when nothing changed.
+    """
+    if cached.fresh_until is None:
+        return f"public, max-age={HISTORICAL_MAX_AGE}"
+    now = time.time() if now is None else now
+    max_age = int(cached.fresh_until - now)
+    if max_age <= 0:
+        return "no-cache"
+    return f"public, max-age={max_age}"
+
+
+def rendered_response(
+    request: Request,
+    rendered: RenderedBody,
+    metadata: ResponseMetadataModel,
+    gzip_min_size: int = 1024,
+    cache_control: Optional[str] = None,
+) -> Response:
+    """
+    Sends a rendered body as is, gzipped when the client accepts it, or a
+    304 without any body when the client already has it.
+    """
+    headers = {"Vary": "Accept-Encoding", "ETag": rendered.etag}
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request, rendered.etag):
+        return not_modified(headers)
+    body = rendered.body(metadata)
+    accepts_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    if accepts_gzip and len(body) >= gzip_min_size:
+        body = rendered.gzip_body(metadata)
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,11 +1,19 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
+from pydantic import BaseModel
 from pydantic.generics import GenericModel
 
 DataType = TypeVar("DataType")
 
 
+class ResponseMetadataModel(BaseModel):
+    stale: bool = False
+    # Seconds since the data was fetched from the upstream API
+    age_seconds: Optional[float] = None
+
+
 class BaseResponseModel(GenericModel, Generic[DataType]):
     error: bool
     message: str
     data: DataType
+    metadata: Optional[ResponseMetadataModel] = None
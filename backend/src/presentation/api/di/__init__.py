@@ -1,14 +1,18 @@
 from fastapi import FastAPI
 
-from src.presentation.api.di.providers import (
-    get_settings,
-    readiness_health_check_executor,
-)
+from src.presentation.api.di.providers import get_settings
 from src.presentation.api.di.stub import (
     get_books_service_stub,
     readiness_health_check_executor_stub,
     get_broker_stub,
-    get_redis_stub
+    get_redis_stub,
+    get_books_batch_stub,
+    get_books_cache_stub,
+    get_books_refresh_stub,
+    get_metrics_registry_stub,
+    get_list_hit_counter_stub,
+    get_genre_index_stub,
+    get_book_catalog_stub,
 )
 
 from .providers import InfrastructureProvider
@@ -19,8 +23,31 @@ infra_provider = InfrastructureProvider(get_settings=get_settings)
 def setup_di(app: FastAPI) -> None:
     app.dependency_overrides[get_books_service_stub] = infra_provider.get_books_service
     app.dependency_overrides[readiness_health_check_executor_stub] = (
-        readiness_health_check_executor
+        infra_provider.readiness_health_check
     )
     app.dependency_overrides[get_broker_stub] = infra_provider.get_broker
     app.dependency_overrides[get_redis_stub] = infra_provider.get_redis_service
+    app.dependency_overrides[get_books_cache_stub] = (
+        infra_provider.get_books_cache_service
+    )
+    app.dependency_overrides[get_books_batch_stub] = (
+        infra_provider.get_books_batch_use_case
+    )
+    app.dependency_overrides[get_books_refresh_stub] = (
+        infra_provider.get_books_refresh_service
+    )
+    app.dependency_overrides[get_genre_index_stub] = infra_provider.get_genre_index
+    app.dependency_overrides[get_book_catalog_stub] = infra_provider.get_book_catalog
+    app.dependency_overrides[get_list_hit_counter_stub] = (
+        infra_provider.get_list_hit_counter
+    )
+    app.dependency_overrides[get_metrics_registry_stub] = (
+        infra_provider.get_metrics_registry
+    )
     app.state.broker = infra_provider.get_broker()
+    app.state.nyt_client = infra_provider.get_nyt_client()
+    app.state.rate_limiter = infra_provider.get_rate_limiter()
+    app.state.redis_client = infra_provider.get_redis_client()
+    app.state.books_cache_subscriber = infra_provider.get_books_cache_subscriber()
+    app.state.list_hit_counter = infra_provider.get_list_hit_counter()
+    app.state.genre_index = infra_provider.get_genre_index()
@@ -1,26 +1,35 @@
-from enum import Enum
 from functools import lru_cache
-from typing import Callable
+from typing import Any, Callable, Dict, Optional
 
+from src.books.app.cache.popularity import ListHitCounter
+from src.books.app.cache.refresh import BooksRefreshService
+from src.books.app.catalog.service import BookCatalog
+from src.books.app.genres.index import GenreIndex
+from src.books.app.genres.settings import Settings as BooksGenresSettings
 from src.books.app.service import BooksService
-from src.books.infra.searcher.nyt_books.client import NYTBooksClient
-from src.books.infra.searcher.nyt_books.service import NYTBooksService
-from src.books.infra.searcher.nyt_books.settings import Settings as NYTBooksSettings
+from src.books.app.use_cases.get_books_batch import GetBooksBatchUseCase
+from src.core.application.cache.base import LocalCache
+from src.core.application.circuit_breaker.health_checker import CircuitBreakerCheck
 from src.core.application.health_checkers.base import HealthCheckExecutor
+from src.core.application.health_checkers.dto import HealthCheckReportDTO
 from src.core.domain.broker.broker import BrokerProtocol
+from src.core.domain.rate_limiter.schemas import RequestPriority
 from src.core.infra.broker.rabbitmq.broker import RabbitMQBroker
 from src.core.infra.broker.rabbitmq.settings import Settings as RabbitMQSettings
+from src.core.infra.database.redis.pubsub import RedisSubscriber
 from src.presentation.api.settings import Settings as APISettings
-from src.core.infra.database.redis.service import RedisService
-from src.core.domain.database.schemas import RedisProtocol
-class APISearcherServiceEnum(str, Enum):
-    NYT = "nyt"
+from src.presentation.commons.di.providers import (
+    APISearcherServiceEnum,
+    SharedInfrastructureProvider,
+    SharedSettingsProvider,
+)
 
 
 class SettingsProvider(
     APISettings,
-    NYTBooksSettings,
     RabbitMQSettings,
+    BooksGenresSettings,
+    SharedSettingsProvider,
 ): ...
 
 
@@ -29,26 +38,49 @@ def get_settings() -> SettingsProvider:
     return SettingsProvider()
 
 
-class InfrastructureProvider:
+class InfrastructureProvider(SharedInfrastructureProvider):
+    # Someone is waiting on the other end of every API call to NYT
+    nyt_priority = RequestPriority.INTERACTIVE
+
     def __init__(
         self,
         get_settings: Callable[[], SettingsProvider],
     ) -> None:
-        self._get_settings = get_settings
+        super().__init__(get_settings)
+        self._books_cache_subscriber: Optional[RedisSubscriber] = None
+        self._books_refresh: Optional[BooksRefreshService] = None
+        self._list_hit_counter: Optional[ListHitCounter] = None
+        self._genre_index: Optional[GenreIndex] = None
+        self._book_catalog: Optional[BookCatalog] = None
 
     def get_books_service(self) -> BooksService:
         if self._get_settings().api_searcher_service == APISearcherServiceEnum.NYT:
-            client = NYTBooksClient(
-                api_key=self._get_settings().api_key,
-                retries=self._get_settings().retries,
-                retry_delay=self._get_settings().retry_delay,
-                base_url=self._get_settings().base_url,
-            )
-            return BooksService(NYTBooksService(client=client))
+            return BooksService(self.get_books_searcher())
         raise ValueError(
             f"Invalid searcher service: {self._get_settings().api_searcher_service}"
         )
 
+    def get_books_batch_use_case(self) -> GetBooksBatchUseCase:
+        return GetBooksBatchUseCase(
+            books_service=self.get_books_service(),
+            books_cache=self.get_books_cache_service(),
+            books_refresh=self.get_books_refresh_service(),
+            genre_index=self.get_genre_index(),
+            max_concurrency=self._get_settings().api_books_batch_max_concurrency,
+        )
+
+    def get_readiness_health_check_executor(self) -> HealthCheckExecutor:
+        return HealthCheckExecutor(
+            health_checkers=[
+                CircuitBreakerCheck(
+                    self.get_circuit_breaker(), name="NYT Books API circuit breaker"
+                ),
+            ]
+        )
+
+    async def readiness_health_check(self) -> HealthCheckReportDTO:
+        return await self.get_readiness_health_check_executor()()
+
     def get_broker(self) -> BrokerProtocol:
         return get_rabbitmq_broker(
             host=self._get_settings().rabbitmq_host,
@@ -57,11 +89,76 @@ class InfrastructureProvider:
             password=self._get_settings().rabbitmq_password,
             vhost=self._get_settings().rabbitmq_vhost,
         )
-    
-    async def get_redis_service(self) -> RedisProtocol:
-        redis_service = RedisService()
-        await redis_service.setup()
-        return redis_service
+
+    def _books_cache_local_tier(self) -> Dict[str, Any]:
+        settings = self._get_settings()
+        return {
+            "local_cache": LocalCache(
+                max_entries=settings.books_cache_local_max_entries,
+                ttl=settings.books_cache_local_ttl,
+            ),
+            "local_records": LocalCache(
+                max_entries=settings.books_cache_local_max_records,
+                ttl=settings.books_cache_local_ttl,
+            ),
+            "catalog": self.get_book_catalog(),
+        }
+
+    def get_book_catalog(self) -> BookCatalog:
+        if self._book_catalog is None:
+            book_catalog = BookCatalog()
+            self._metrics_registry.register("book_catalog", book_catalog.stats)
+            self._book_catalog = book_catalog
+        return self._book_catalog
+
+    def get_books_refresh_service(self) -> BooksRefreshService:
+        if self._books_refresh is None:
+            books_refresh = BooksRefreshService(
+                broker=self.get_broker(),
+                redis_service=self.get_redis_service(),
+                lock_ttl=self._get_settings().books_cache_refresh_lock_ttl,
+            )
+            self._metrics_registry.register("books_cache_refresh", books_refresh.stats)
+            self._books_refresh = books_refresh
+        return self._books_refresh
+
+    def get_genre_index(self) -> GenreIndex:
+        if self._genre_index is None:
+            settings = self._get_settings()
+            genre_index = GenreIndex(
+                books_service=self.get_books_service(),
+                refresh_interval=settings.books_genres_refresh_interval,
+                miss_refresh_interval=settings.books_genres_miss_refresh_interval,
+                redis_service=self.get_redis_service(),
+                redis_key=settings.books_genres_redis_key,
+                redis_ttl=settings.books_genres_redis_ttl,
+            )
+            self._metrics_registry.register("books_genre_index", genre_index.stats)
+            self._genre_index = genre_index
+        return self._genre_index
+
+    def get_list_hit_counter(self) -> ListHitCounter:
+        if self._list_hit_counter is None:
+            settings = self._get_settings()
+            list_hit_counter = ListHitCounter(
+                redis_service=self.get_redis_service(),
+                key=settings.books_cache_hits_key,
+                flush_interval=settings.books_cache_hits_flush_interval,
+            )
+            self._metrics_registry.register("books_list_hits", list_hit_counter.stats)
+            self._list_hit_counter = list_hit_counter
+        return self._list_hit_counter
+
+    def get_books_cache_subscriber(self) -> RedisSubscriber:
+        if self._books_cache_subscriber is None:
+            books_cache = self.get_books_cache_service()
+            self._books_cache_subscriber = RedisSubscriber(
+                redis_client=self.get_redis_client(),
+                channel=self._get_settings().books_cache_invalidation_channel,
+                on_message=books_cache.handle_invalidation,
+                on_subscribe=books_cache.resync,
+            )
+        return self._books_cache_subscriber
 
 
 @lru_cache
@@ -77,7 +174,3 @@ def get_rabbitmq_broker(
             rabbitmq_vhost=vhost,
         )
     )
-
-
-def readiness_health_check_executor() -> HealthCheckExecutor:
-    return HealthCheckExecutor(health_checkers=[])
@@ -12,3 +12,31 @@ def get_broker_stub():
 
 def get_redis_stub():
     raise NotImplementedError("Not implemented")
+
+
+def get_metrics_registry_stub():
+    raise NotImplementedError("Not implemented")
+
+
+def get_books_cache_stub():
+    raise NotImplementedError("Not implemented")
+
+
+def get_books_refresh_stub():
+    raise NotImplementedError("Not implemented")
+
+
+def get_books_batch_stub():
+    raise NotImplementedError("Not implemented")
+
+
+def get_list_hit_counter_stub():
+    raise NotImplementedError("Not implemented")
+
+
+def get_genre_index_stub():
+    raise NotImplementedError("Not implemented")
+
+
+def get_book_catalog_stub():
+    raise NotImplementedError("Not implemented")
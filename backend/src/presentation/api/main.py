@@ -16,6 +16,7 @@ from src.presentation.api.commons.response_model import BaseResponseModel
 from src.presentation.api.di import setup_di
 from src.presentation.api.resources.books.routes import books_router
 from src.presentation.api.resources.health_checkers.routes import health_checkers_router
+from src.presentation.api.resources.metrics.routes import metrics_router
 
 common_responses = {
     status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": BaseResponseModel[Dict]},
@@ -34,12 +35,35 @@ async def lifespan(app: FastAPI):
     broker = app.state.broker
     await broker.connect()
     logger.info("RabbitMQ broker connected")
+
+    # Abrir el pool de conexiones compartido con NYT
+    nyt_client = app.state.nyt_client
+    await nyt_client.connect()
+
+    # Abrir el pool de conexiones compartido con Redis
+    redis_client = app.state.redis_client
+    await redis_client.connect()
+
+    # Escuchar las invalidaciones de caché publicadas por otros procesos
+    books_cache_subscriber = app.state.books_cache_subscriber
+    await books_cache_subscriber.start()
+
+    # Volcar periódicamente a Redis los contadores de peticiones por lista
+    list_hit_counter = app.state.list_hit_counter
+    await list_hit_counter.start()
     
     yield
     
     # Limpieza al cierre
     await broker.close()
     logger.info("RabbitMQ broker disconnected")
+    await nyt_client.close()
+    await app.state.rate_limiter.close()
+    await books_cache_subscriber.close()
+    await list_hit_counter.close()
+    # Cancela una recarga de géneros en curso antes de cerrar Redis
+    await app.state.genre_index.close()
+    await redis_client.close()
 
 def create_application() -> FastAPI:
     app = FastAPI(
@@ -61,6 +85,7 @@ def create_application() -> FastAPI:
     }
     
     app.include_router(health_checkers_router, **common_router_args)
+    app.include_router(metrics_router, **common_router_args)
     app.include_router(books_router)
     
     app.add_exception_handler(Exception, handler=generic_exception_handler)
@@ -1,14 +1,36 @@
-from typing import Annotated, Dict, List
+from typing import Annotated, Dict, List, Literal, Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-import json
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 
+from src.books.app.cache.popularity import ListHitCounter
+from src.books.app.cache.refresh import BooksRefreshService
+from src.books.app.cache.service import BooksCacheService
+from src.books.app.catalog.schemas import (
+    BookHistorySchema,
+    CatalogBookSchema,
+    RankMoveSchema,
+)
+from src.books.app.catalog.service import BookCatalog
 from src.books.app.exceptions import (
     BookNotFoundException,
     ExternalAPIException,
     GenreNotFoundException,
     InvalidSearchCriteriaException,
+    ServiceUnavailableException,
+)
+from src.books.app.genres.index import GenreIndex
+from src.books.app.use_cases.get_books_batch import (
+    BooksBatchResultSchema,
+    GetBooksBatchUseCase,
 )
 from src.books.domain.schemas import (
     BookGenreSchema,
@@ -18,48 +40,101 @@ from src.books.domain.schemas import (
 from src.books.domain.searcher.protocols import BookSearcherProtocol
 from src.core.domain.broker.broker import BrokerProtocol
 from src.core.domain.broker.schemas import MessageSchema
-from src.presentation.api.commons.response_model import BaseResponseModel
-from src.presentation.api.di.stub import get_books_service_stub, get_broker_stub, get_redis_stub
-from src.core.domain.database.schemas import RedisProtocol
+from src.presentation.api.commons.conditional import etag_matches, not_modified
+from src.presentation.api.commons.rendered_response import (
+    RenderedBody,
+    cache_control_for,
+    render_cached_books,
+    rendered_response,
+)
+from src.presentation.api.commons.response_model import (
+    BaseResponseModel,
+    ResponseMetadataModel,
+)
+from src.presentation.api.di.stub import (
+    get_book_catalog_stub,
+    get_books_batch_stub,
+    get_books_cache_stub,
+    get_books_refresh_stub,
+    get_books_service_stub,
+    get_broker_stub,
+    get_genre_index_stub,
+    get_list_hit_counter_stub,
+)
+from src.presentation.api.resources.books.schemas import BooksBatchRequestModel
 
 logger = structlog.get_logger(module="api", process="books")
 
 books_router = APIRouter(prefix="/books", tags=["books"])
 
+# Los géneros cambian unas pocas veces al año
+GENRES_CACHE_CONTROL = "public, max-age=3600"
+
 
 @books_router.get(
     "/",
     responses={
         status.HTTP_200_OK: {"model": BaseResponseModel[BookListSchema]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"},
         status.HTTP_400_BAD_REQUEST: {"model": BaseResponseModel[Dict]},
         status.HTTP_404_NOT_FOUND: {"model": BaseResponseModel[Dict]},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": BaseResponseModel[Dict]},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": BaseResponseModel[Dict]},
     },
 )
 async def get_books(
+    request: Request,
     filter_query: Annotated[BooksSearchCriteriaSchema, Query()],
     books_service: BookSearcherProtocol = Depends(get_books_service_stub),
-    redis_service: RedisProtocol = Depends(get_redis_stub),
+    books_cache: BooksCacheService = Depends(get_books_cache_stub),
+    books_refresh: BooksRefreshService = Depends(get_books_refresh_stub),
+    list_hit_counter: ListHitCounter = Depends(get_list_hit_counter_stub),
+    genre_index: GenreIndex = Depends(get_genre_index_stub),
 ):
     try:
-        # Intentamos obtener los libros desde Redis
-        books_json = await redis_service.get(filter_query.list)
-        if books_json:
-            # Deserializamos la cadena JSON a un objeto Python
-            books = json.loads(books_json)
-            message = "Libros encontrados en caché"
-        else:
-            # Si no están en Redis, los buscamos en el servicio
-            books = await books_service.search_books(filter_query)
-            # Almacenamos los libros en Redis para futuras consultas
-            await redis_service.set(filter_query.list, books.model_dump_json())
-            message = "Libros encontrados satisfactoriamente"
+        # Las listas desconocidas se rechazan sin llamar a NYT
+        filter_query = await genre_index.validate(filter_query)
+        # Las listas más consultadas se precalientan antes en el consumidor
+        list_hit_counter.record(filter_query)
 
-        return BaseResponseModel(
-            error=False, message=message, data=books
+        # Intentamos obtener los libros desde la caché
+        cached = await books_cache.get(filter_query)
+        if cached is not None:
+            stale = cached.is_stale()
+            if stale:
+                # Servimos la copia vencida al instante y la refrescamos en
+                # segundo plano a través del consumidor
+                await books_refresh.request_refresh(filter_query)
+            # Camino rápido: el cuerpo ya está renderizado, se envían los
+            # bytes sin pasar por pydantic ni por la serialización de FastAPI,
+            # o un 304 vacío si el cliente ya tiene esta versión (ETag)
+            return rendered_response(
+                request,
+                render_cached_books(cached, "Libros encontrados en caché"),
+                ResponseMetadataModel(stale=stale, age_seconds=round(cached.age(), 3)),
+                cache_control=cache_control_for(cached),
+            )
+
+        # NYT ya confirmó hace poco que esta página no existe
+        if await books_cache.is_missing(filter_query):
+            raise BookNotFoundException(str(filter_query))
+
+        # Si no están en caché (o pasaron la expiración dura), los buscamos
+        # en el servicio y los almacenamos para futuras consultas
+        try:
+            books = await books_service.search_books(filter_query)
+        except BookNotFoundException:
+            await books_cache.set_missing(filter_query)
+            raise
+        cached = await books_cache.set(filter_query, books)
+        return rendered_response(
+            request,
+            render_cached_books(cached, "Libros encontrados satisfactoriamente"),
+            ResponseMetadataModel(stale=False, age_seconds=round(cached.age(), 3)),
+            cache_control=cache_control_for(cached),
         )
 
-    except BookNotFoundException as e:
+    except (BookNotFoundException, GenreNotFoundException) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
         )
@@ -67,30 +142,197 @@ async def get_books(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         )
+    except ServiceUnavailableException as e:
+        if e.fallback is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+            )
+        # NYT no está disponible: servimos la última versión válida conocida,
+        # que el cliente debe revalidar en cuanto NYT vuelva
+        return rendered_response(
+            request,
+            RenderedBody(
+                BaseResponseModel(
+                    error=False,
+                    message="Libros servidos desde la última copia válida",
+                    data=e.fallback,
+                )
+            ),
+            ResponseMetadataModel(stale=True),
+            cache_control="no-cache",
+        )
     except ExternalAPIException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         )
 
 
+@books_router.post(
+    "/batch",
+    responses={
+        status.HTTP_200_OK: {
+            "model": BaseResponseModel[Dict[str, BooksBatchResultSchema]]
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": BaseResponseModel[List]},
+    },
+)
+async def get_books_batch(
+    batch: BooksBatchRequestModel,
+    get_books_batch_use_case: GetBooksBatchUseCase = Depends(get_books_batch_stub),
+    list_hit_counter: ListHitCounter = Depends(get_list_hit_counter_stub),
+):
+    for criteria in batch.queries.values():
+        list_hit_counter.record(criteria)
+    # Cada consulta se resuelve por separado: un fallo no invalida el lote
+    results = await get_books_batch_use_case(batch.queries)
+    return BaseResponseModel(
+        error=False, message="Lote de libros resuelto", data=results
+    )
+
+
+@books_router.get(
+    "/isbn/{isbn}",
+    responses={
+        status.HTTP_200_OK: {"model": BaseResponseModel[CatalogBookSchema]},
+        status.HTTP_404_NOT_FOUND: {"model": BaseResponseModel[Dict]},
+    },
+)
+async def get_book_by_isbn(
+    isbn: str,
+    book_catalog: BookCatalog = Depends(get_book_catalog_stub),
+):
+    # Se responde desde el catálogo en memoria, sin Redis ni NYT
+    book = book_catalog.find_by_isbn(isbn)
+    if book is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No hay ningún libro con ISBN {isbn} en las listas en caché",
+        )
+    return BaseResponseModel(
+        error=False, message="Libro encontrado en el catálogo", data=book
+    )
+
+
+@books_router.get(
+    "/by-author",
+    responses={
+        status.HTTP_200_OK: {"model": BaseResponseModel[List[CatalogBookSchema]]},
+    },
+)
+async def get_books_by_author(
+    author: str = Query(..., min_length=1),
+    book_catalog: BookCatalog = Depends(get_book_catalog_stub),
+):
+    return BaseResponseModel(
+        error=False,
+        message="Libros del autor en el catálogo",
+        data=book_catalog.find_by_author(author),
+    )
+
+
+@books_router.get(
+    "/by-publisher",
+    responses={
+        status.HTTP_200_OK: {"model": BaseResponseModel[List[CatalogBookSchema]]},
+    },
+)
+async def get_books_by_publisher(
+    publisher: str = Query(..., min_length=1),
+    book_catalog: BookCatalog = Depends(get_book_catalog_stub),
+):
+    return BaseResponseModel(
+        error=False,
+        message="Libros de la editorial en el catálogo",
+        data=book_catalog.find_by_publisher(publisher),
+    )
+
+
+@books_router.get(
+    "/search",
+    responses={
+        status.HTTP_200_OK: {"model": BaseResponseModel[List[CatalogBookSchema]]},
+    },
+)
+async def search_books(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    book_catalog: BookCatalog = Depends(get_book_catalog_stub),
+):
+    # Búsqueda por prefijo sobre título, autor, editorial y descripción de
+    # todas las listas en caché, con los mejores resultados primero
+    return BaseResponseModel(
+        error=False,
+        message="Resultados de la búsqueda en el catálogo",
+        data=book_catalog.search(q, limit=limit),
+    )
+
+
+@books_router.get(
+    "/movers",
+    responses={
+        status.HTTP_200_OK: {"model": BaseResponseModel[List[RankMoveSchema]]},
+    },
+)
+async def get_biggest_movers(
+    limit: int = Query(10, ge=1, le=100),
+    list_name: Optional[str] = Query(None),
+    book_catalog: BookCatalog = Depends(get_book_catalog_stub),
+):
+    # Cambios de puesto respecto a la semana anterior en la última semana
+    # de cada lista, calculados en memoria
+    return BaseResponseModel(
+        error=False,
+        message="Libros que más han cambiado de puesto esta semana",
+        data=book_catalog.movers(limit=limit, list_name=list_name),
+    )
+
+
 @books_router.get(
     "/genres",
     responses={
         status.HTTP_200_OK: {"model": BaseResponseModel[List[BookGenreSchema]]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"},
         status.HTTP_404_NOT_FOUND: {"model": BaseResponseModel[Dict]},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": BaseResponseModel[Dict]},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": BaseResponseModel[Dict]},
     },
 )
 async def list_genres(
+    request: Request,
+    response: Response,
     books_service: BookSearcherProtocol = Depends(get_books_service_stub),
+    genre_index: GenreIndex = Depends(get_genre_index_stub),
 ):
     try:
-        genres = await books_service.list_genres()
+        # Se sirven desde memoria; solo se llama a NYT si no hay copia alguna,
+        # ni en el proceso ni en Redis
+        genres = await genre_index.genres()
+        if genres is None:
+            genres = await books_service.list_genres()
+            genre_index.update(genres)
+        headers = {
+            "ETag": f'"{genre_index.version}"',
+            "Cache-Control": GENRES_CACHE_CONTROL,
+        }
+        if etag_matches(request, headers["ETag"]):
+            return not_modified(headers)
+        response.headers.update(headers)
         return BaseResponseModel(
             error=False, message="Genres listed successfully", data=genres
         )
     except GenreNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ServiceUnavailableException as e:
+        if e.fallback is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+            )
+        return BaseResponseModel(
+            error=False,
+            message="Genres listed from the last known good copy",
+            data=e.fallback,
+            metadata=ResponseMetadataModel(stale=True),
+        )
     except ExternalAPIException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -101,8 +343,29 @@ async def list_genres(
 async def fill_books(
     broker: BrokerProtocol = Depends(get_broker_stub),
     books_service: BookSearcherProtocol = Depends(get_books_service_stub),
+    genre_index: GenreIndex = Depends(get_genre_index_stub),
+    mode: Literal["bulk", "per_genre"] = Query("bulk"),
+    published_date: Optional[str] = Query(None),
 ):
-    genres = await books_service.list_genres()
+    if mode == "bulk":
+        # Un único mensaje: el consumidor trae todas las listas con una sola
+        # llamada al endpoint de overview y las guarda en un solo lote.
+        message = MessageSchema(
+            payload={"overview": {"published_date": published_date}},
+            queue_name=broker.books_queue.name,
+        )
+        try:
+            await broker.publish(message, broker.books_queue.name)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+        return {"message": "Books filled successfully"}
+
+    genres = await genre_index.genres()
+    if genres is None:
+        genres = await books_service.list_genres()
+        genre_index.update(genres)
     for genre in genres:
         logger.info(f"Género: {genre}")
         criteria = BooksSearchCriteriaSchema(list=genre["code"])
@@ -119,3 +382,28 @@ async def fill_books(
             )
         
     return {"message": "Books filled successfully"}
+
+
+# Va después de las rutas fijas para que "/books/isbn/..." y similares no
+# se interpreten como un ISBN
+@books_router.get(
+    "/{isbn}/history",
+    responses={
+        status.HTTP_200_OK: {"model": BaseResponseModel[BookHistorySchema]},
+        status.HTTP_404_NOT_FOUND: {"model": BaseResponseModel[Dict]},
+    },
+)
+async def get_book_history(
+    isbn: str,
+    list_name: Optional[str] = Query(None),
+    book_catalog: BookCatalog = Depends(get_book_catalog_stub),
+):
+    history = book_catalog.history(isbn, list_name=list_name)
+    if history is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No hay historial de puestos para el ISBN {isbn}",
+        )
+    return BaseResponseModel(
+        error=False, message="Historial de puestos del libro", data=history
+    )
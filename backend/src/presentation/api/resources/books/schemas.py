@@ -0,0 +1,14 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+MAX_BATCH_QUERIES = 50
+
+
+class BooksBatchRequestModel(BaseModel):
+    # Client-chosen names; the response uses the same names as keys
+    queries: Dict[str, BooksSearchCriteriaSchema] = Field(
+        min_length=1, max_length=MAX_BATCH_QUERIES
+    )
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, status
+
+from src.core.application.metrics.base import MetricsRegistry
+from src.core.application.metrics.dto import MetricsReportDTO
+from src.presentation.api.commons.response_model import BaseResponseModel
+from src.presentation.api.di.stub import get_metrics_registry_stub
+
+metrics_router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@metrics_router.get(
+    "/",
+    responses={
+        status.HTTP_200_OK: {"model": BaseResponseModel[MetricsReportDTO]},
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def get_metrics(
+    metrics_registry: MetricsRegistry = Depends(get_metrics_registry_stub),
+) -> BaseResponseModel[MetricsReportDTO]:
+    return BaseResponseModel(
+        error=False,
+        message="Successful call to metrics",
+        data=metrics_registry.snapshot(),
+    )
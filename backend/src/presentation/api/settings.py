@@ -5,3 +5,4 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     api_searcher_service: Literal["nyt"] = "nyt"
+    api_books_batch_max_concurrency: int = 4
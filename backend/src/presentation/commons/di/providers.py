@@ -0,0 +1,244 @@
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from src.books.app.cache.codec import BooksCacheCodec
+from src.books.app.cache.service import BooksCacheService
+from src.books.app.cache.settings import Settings as BooksCacheSettings
+from src.books.app.cache.ttl import BooksCacheTTLPolicy
+from src.books.app.exceptions import (
+    BookNotFoundException,
+    ServiceUnavailableException,
+)
+from src.books.domain.searcher.protocols import BookSearcherProtocol
+from src.books.infra.searcher.circuit_breaker.service import (
+    CircuitBreakerBookSearcherService,
+)
+from src.books.infra.searcher.circuit_breaker.settings import (
+    Settings as CircuitBreakerSettings,
+)
+from src.books.infra.searcher.coalescing.service import CoalescingBookSearcherService
+from src.books.infra.searcher.nyt_books.client import NYTBooksClient
+from src.books.infra.searcher.nyt_books.client.exceptions import (
+    NYTBooksInvalidPayloadRequestException,
+)
+from src.books.infra.searcher.nyt_books.client.retry import classify_http_error
+from src.books.infra.searcher.nyt_books.service import NYTBooksService
+from src.books.infra.searcher.nyt_books.settings import Settings as NYTBooksSettings
+from src.core.application.circuit_breaker.base import CircuitBreaker
+from src.core.application.metrics.base import MetricsRegistry
+from src.core.application.retry.base import RetryBudget, RetryPolicy
+from src.core.domain.database.schemas import RedisProtocol
+from src.core.domain.rate_limiter.schemas import RequestPriority
+from src.core.infra.database.redis.service import RedisClient, RedisService
+from src.core.infra.database.redis.settings import Settings as RedisSettings
+from src.core.infra.rate_limiter.base import QueuedRateLimiter
+from src.core.infra.rate_limiter.memory.service import InMemoryRateLimiter
+from src.core.infra.rate_limiter.redis.service import RedisRateLimiter
+from src.core.infra.rate_limiter.settings import Settings as RateLimiterSettings
+
+
+class APISearcherServiceEnum(str, Enum):
+    NYT = "nyt"
+
+
+class SharedSettingsProvider(
+    NYTBooksSettings,
+    RateLimiterSettings,
+    RedisSettings,
+    CircuitBreakerSettings,
+    BooksCacheSettings,
+): ...
+
+
+class SharedInfrastructureProvider:
+    """
+    The infrastructure both the API and the consumer build the same way:
+    Redis, the NYT client behind its rate limiter, retry policy and circuit
+    breaker, and the books cache. Each process extends it with its own
+    providers.
+
+    The NYT client asks the rate limiter for tokens with `nyt_priority`. The
+    books cache keeps no local tier unless `_books_cache_local_tier` adds
+    one.
+    """
+
+    nyt_priority = RequestPriority.INTERACTIVE
+
+    def __init__(
+        self,
+        get_settings: Callable[[], SharedSettingsProvider],
+    ) -> None:
+        self._get_settings = get_settings
+        self._metrics_registry = MetricsRegistry()
+        self._redis_client: Optional[RedisClient] = None
+        self._redis_service: Optional[RedisService] = None
+        self._books_cache: Optional[BooksCacheService] = None
+        self._rate_limiter: Optional[QueuedRateLimiter] = None
+        self._nyt_retry_policy: Optional[RetryPolicy] = None
+        self._nyt_client: Optional[NYTBooksClient] = None
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        self._books_searcher: Optional[BookSearcherProtocol] = None
+
+    def get_metrics_registry(self) -> MetricsRegistry:
+        return self._metrics_registry
+
+    def get_redis_client(self) -> RedisClient:
+        if self._redis_client is None:
+            settings = self._get_settings()
+            redis_client = RedisClient(
+                url=settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                pool_timeout=settings.redis_pool_timeout,
+                socket_timeout=settings.redis_socket_timeout,
+                socket_connect_timeout=settings.redis_socket_connect_timeout,
+                health_check_interval=settings.redis_health_check_interval,
+            )
+            self._metrics_registry.register("redis_pool", redis_client.pool_stats)
+            self._redis_client = redis_client
+        return self._redis_client
+
+    def get_redis_service(self) -> RedisProtocol:
+        if self._redis_service is None:
+            self._redis_service = RedisService(client=self.get_redis_client())
+        return self._redis_service
+
+    def get_rate_limiter(self) -> QueuedRateLimiter:
+        if self._rate_limiter is None:
+            settings = self._get_settings()
+            if settings.rate_limit_backend == "redis":
+                rate_limiter = RedisRateLimiter(
+                    redis_client=self.get_redis_client(),
+                    key=settings.rate_limit_key,
+                    per_minute=settings.rate_limit_per_minute,
+                    per_day=settings.rate_limit_per_day,
+                    background_reserve=settings.rate_limit_background_reserve,
+                    max_poll_interval=settings.rate_limit_max_poll_interval,
+                    max_wait=settings.rate_limit_max_wait or None,
+                    max_queue=settings.rate_limit_max_queue or None,
+                )
+            else:
+                rate_limiter = InMemoryRateLimiter(
+                    per_minute=settings.rate_limit_per_minute,
+                    per_day=settings.rate_limit_per_day,
+                    background_reserve=settings.rate_limit_background_reserve,
+                    max_poll_interval=settings.rate_limit_max_poll_interval,
+                    max_wait=settings.rate_limit_max_wait or None,
+                    max_queue=settings.rate_limit_max_queue or None,
+                )
+            self._metrics_registry.register("nyt_rate_limiter", rate_limiter.stats)
+            self._rate_limiter = rate_limiter
+        return self._rate_limiter
+
+    def get_nyt_retry_policy(self) -> RetryPolicy:
+        if self._nyt_retry_policy is None:
+            settings = self._get_settings()
+            retry_policy = RetryPolicy(
+                max_attempts=settings.retries,
+                base_delay=settings.retry_delay,
+                max_delay=settings.retry_max_delay,
+                classifier=classify_http_error,
+                budget=RetryBudget(
+                    ratio=settings.retry_budget_ratio,
+                    min_retries_per_second=settings.retry_budget_min_per_second,
+                ),
+            )
+            self._metrics_registry.register("nyt_retry_policy", retry_policy.stats)
+            self._nyt_retry_policy = retry_policy
+        return self._nyt_retry_policy
+
+    def get_nyt_client(self) -> NYTBooksClient:
+        if self._nyt_client is None:
+            settings = self._get_settings()
+            self._nyt_client = NYTBooksClient(
+                api_key=settings.api_key,
+                base_url=settings.base_url,
+                request_timeout=settings.request_timeout,
+                pool_timeout=settings.pool_timeout,
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+                http2=settings.http2,
+                response_cache_size=settings.response_cache_size,
+                retry_policy=self.get_nyt_retry_policy(),
+                rate_limiter=self.get_rate_limiter(),
+                priority=self.nyt_priority,
+            )
+            self._metrics_registry.register(
+                "nyt_client_pool", self._nyt_client.pool_stats
+            )
+            self._metrics_registry.register(
+                "nyt_response_cache", self._nyt_client.response_cache_stats
+            )
+        return self._nyt_client
+
+    def get_circuit_breaker(self) -> CircuitBreaker:
+        if self._circuit_breaker is None:
+            settings = self._get_settings()
+            circuit_breaker = CircuitBreaker(
+                name="nyt_books",
+                failure_rate_threshold=settings.circuit_breaker_failure_rate_threshold,
+                window_size=settings.circuit_breaker_window_size,
+                minimum_calls=settings.circuit_breaker_minimum_calls,
+                open_seconds=settings.circuit_breaker_open_seconds,
+                half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+                # A rejected payload is our fault, a missing list a confirmed
+                # answer, and a call the rate limiter gave up on never reached
+                # NYT; none is a sign of NYT being down
+                is_failure=lambda error: not isinstance(
+                    error,
+                    (
+                        NYTBooksInvalidPayloadRequestException,
+                        BookNotFoundException,
+                        ServiceUnavailableException,
+                    ),
+                ),
+            )
+            self._metrics_registry.register(
+                "nyt_circuit_breaker", circuit_breaker.stats
+            )
+            self._circuit_breaker = circuit_breaker
+        return self._circuit_breaker
+
+    def get_books_searcher(self) -> BookSearcherProtocol:
+        if self._books_searcher is None:
+            coalescing_searcher = CoalescingBookSearcherService(
+                CircuitBreakerBookSearcherService(
+                    NYTBooksService(client=self.get_nyt_client()),
+                    circuit_breaker=self.get_circuit_breaker(),
+                    fallback_size=self._get_settings().circuit_breaker_fallback_size,
+                )
+            )
+            self._metrics_registry.register(
+                "books_searcher_coalescing", coalescing_searcher.stats
+            )
+            self._books_searcher = coalescing_searcher
+        return self._books_searcher
+
+    def get_books_cache_service(self) -> BooksCacheService:
+        if self._books_cache is None:
+            settings = self._get_settings()
+            books_cache = BooksCacheService(
+                redis_service=self.get_redis_service(),
+                ttl_policy=BooksCacheTTLPolicy(
+                    current_ttl=settings.books_cache_current_ttl,
+                    historical_ttl=settings.books_cache_historical_ttl or None,
+                    stale_ttl=settings.books_cache_stale_ttl,
+                    update_weekday=settings.books_cache_update_weekday,
+                    update_hour_utc=settings.books_cache_update_hour_utc,
+                ),
+                invalidation_channel=settings.books_cache_invalidation_channel,
+                codec=BooksCacheCodec(
+                    compression=settings.books_cache_compression,
+                    level=settings.books_cache_compression_level,
+                    min_size=settings.books_cache_compression_min_size,
+                ),
+                negative_ttl=settings.books_cache_negative_ttl,
+                **self._books_cache_local_tier(),
+            )
+            self._metrics_registry.register("books_cache", books_cache.stats)
+            self._books_cache = books_cache
+        return self._books_cache
+
+    def _books_cache_local_tier(self) -> Dict[str, Any]:
+        """Extra `BooksCacheService` arguments for a process that reads."""
+        return {}
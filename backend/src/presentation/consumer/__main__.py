@@ -7,7 +7,7 @@ from src.core.infra.broker.rabbitmq.settings import Settings as RabbitMQSettings
 from src.presentation.consumer.settings import Settings as ConsumerSettings
 
 from src.presentation.consumer.broker import get_broker
-from src.presentation.consumer.di import setup_di
+from src.presentation.consumer.di import infra_provider, setup_di
 from src.presentation.consumer.handlers.books import handlers
 
 logger = structlog.get_logger(module="consumer", process="main")
@@ -21,6 +21,24 @@ async def init_consumer() -> None:
     setup_di()
     logger.info("DI configurado")
 
+    nyt_client = infra_provider.get_nyt_client()
+    await nyt_client.connect()
+    logger.info("Pool de conexiones NYT abierto")
+
+    redis_client = infra_provider.get_redis_client()
+    await redis_client.connect()
+    logger.info("Pool de conexiones Redis abierto")
+
+    # Precalentar la caché tras cada publicación semanal de NYT
+    warmer_job = None
+    if consumer_settings.consumer_warmer_enabled:
+        warmer_job = infra_provider.get_books_cache_warmer_job()
+        await warmer_job.start()
+        logger.info(
+            "Precalentamiento de caché programado",
+            schedule=consumer_settings.consumer_warmer_schedule,
+        )
+
     broker =  get_broker(
         consumer_settings=consumer_settings,
         rabbitmq_settings=rabbitmq_settings,
@@ -56,6 +74,13 @@ async def init_consumer() -> None:
 
     # Cerrar el broker
     await broker.close()
+    if warmer_job is not None:
+        await warmer_job.close()
+    metrics = infra_provider.get_metrics_registry().snapshot()
+    logger.info("Métricas del consumidor", **metrics.model_dump())
+    await nyt_client.close()
+    await infra_provider.get_rate_limiter().close()
+    await redis_client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+import httpx
+
+from src.books.app.exceptions import (
+    BookNotFoundException,
+    GenreNotFoundException,
+    InvalidSearchCriteriaException,
+)
+from src.books.infra.searcher.nyt_books.client.retry import classify_http_error
+from src.core.application.retry.dto import ErrorKind, RetryDecisionDTO
+
+NON_RETRYABLE_ERRORS = (
+    BookNotFoundException,
+    GenreNotFoundException,
+    InvalidSearchCriteriaException,
+)
+
+
+def classify_message_error(error: BaseException) -> RetryDecisionDTO:
+    """
+    Classifies an error raised while processing a message.
+
+    The exception chain is walked down to its root cause: "not found" and
+    invalid criteria errors are final, HTTP errors from the NYT call follow
+    the client classification (422 is never retried, 429 and 5xx are) and
+    any other error (Redis, broker...) is retried.
+    """
+    cause = error
+    while cause is not None:
+        if isinstance(cause, NON_RETRYABLE_ERRORS):
+            return RetryDecisionDTO(retryable=False, kind=ErrorKind.OTHER)
+        if isinstance(cause, httpx.HTTPError):
+            return classify_http_error(cause)
+        cause = cause.__cause__ or cause.__context__
+    return RetryDecisionDTO(retryable=True, kind=ErrorKind.OTHER)
@@ -4,7 +4,11 @@ from src.presentation.consumer.di.providers import (
     InfrastructureProvider,
     get_settings,
 )
-from src.presentation.consumer.di.stub import get_books_service_stub, get_redis_stub
+from src.presentation.consumer.di.stub import (
+    get_books_cache_stub,
+    get_books_service_stub,
+    get_redis_stub,
+)
 
 infra_provider = InfrastructureProvider(get_settings=get_settings)
 
@@ -14,3 +18,6 @@ def setup_di() -> None:
         get_books_service_stub
     ] = infra_provider.get_books_service
     dependency_provider.dependency_overrides[get_redis_stub] = infra_provider.get_redis_service
+    dependency_provider.dependency_overrides[
+        get_books_cache_stub
+    ] = infra_provider.get_books_cache_service
@@ -1,45 +1,66 @@
-from enum import Enum
 from functools import lru_cache
-from typing import Callable
+from typing import Callable, Optional
 
+from src.books.app.cache.popularity import ListHitCounter
+from src.books.app.cache.warmer import BooksCacheWarmer
 from src.books.app.service import BooksService
-from src.books.infra.searcher.nyt_books.service import NYTBooksClient, NYTBooksService
-from src.books.infra.searcher.nyt_books.settings import Settings as NYTBooksSettings
+from src.core.application.scheduler.base import CronSchedule, ScheduledJob
+from src.core.domain.rate_limiter.schemas import RequestPriority
+from src.presentation.commons.di.providers import (
+    APISearcherServiceEnum,
+    SharedInfrastructureProvider,
+    SharedSettingsProvider,
+)
 from src.presentation.consumer.settings import Settings as ConsumerSettings
-from src.core.infra.database.redis.service import RedisService
-from src.core.domain.database.schemas import RedisProtocol
-import asyncio
-
-class APISearcherServiceEnum(str, Enum):
-    NYT = "nyt"
 
 
 class SettingsProvider(
     ConsumerSettings,
-    NYTBooksSettings,
+    SharedSettingsProvider,
 ): ...
 
 
-class InfrastructureProvider:
+class InfrastructureProvider(SharedInfrastructureProvider):
+    # Refreshes and warm-ups can wait; they never take the tokens kept for
+    # the API
+    nyt_priority = RequestPriority.BACKGROUND
+
     def __init__(
         self,
         get_settings: Callable[[], SettingsProvider],
     ) -> None:
-        self._get_settings = get_settings
+        super().__init__(get_settings)
+        self._books_cache_warmer_job: Optional[ScheduledJob] = None
 
     def get_books_service(self) -> BooksService:
         if self._get_settings().consumer_book_service == APISearcherServiceEnum.NYT:
-            client = NYTBooksClient(
-                api_key=self._get_settings().api_key,
-                retries=self._get_settings().retries,
-                retry_delay=self._get_settings().retry_delay,
-                base_url=self._get_settings().base_url,
+            return BooksService(self.get_books_searcher())
+
+    def get_books_cache_warmer_job(self) -> ScheduledJob:
+        if self._books_cache_warmer_job is None:
+            settings = self._get_settings()
+            books_cache_warmer = BooksCacheWarmer(
+                books_service=self.get_books_service(),
+                books_cache=self.get_books_cache_service(),
+                # Only read here: the API workers are the ones recording hits
+                hit_counter=ListHitCounter(
+                    redis_service=self.get_redis_service(),
+                    key=settings.books_cache_hits_key,
+                ),
+                window_seconds=settings.consumer_warmer_window_seconds,
             )
-            return BooksService(NYTBooksService(client=client))
-    def get_redis_service(self) -> RedisProtocol:
-        redis_service = RedisService()
-        asyncio.run(redis_service.setup())
-        return redis_service
+            warmer_job = ScheduledJob(
+                name="books_cache_warmer",
+                schedule=CronSchedule(settings.consumer_warmer_schedule),
+                job=books_cache_warmer,
+                run_on_start=settings.consumer_warmer_run_on_start,
+            )
+            self._metrics_registry.register("books_cache_warmer", books_cache_warmer.stats)
+            self._metrics_registry.register("books_cache_warmer_job", warmer_job.stats)
+            self._books_cache_warmer_job = warmer_job
+        return self._books_cache_warmer_job
+
+
 @lru_cache
 def get_settings() -> SettingsProvider:
     return SettingsProvider()
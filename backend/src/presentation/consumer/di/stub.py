@@ -4,3 +4,7 @@ def get_books_service_stub():
 
 def get_redis_stub():
     raise NotImplementedError("Not implemented")
+
+
+def get_books_cache_stub():
+    raise NotImplementedError("Not implemented")
@@ -6,12 +6,17 @@ from fast_depends import Depends, inject
 from faststream.exceptions import AckMessage
 from faststream.rabbit import RabbitMessage
 
+from src.books.app.cache.service import BooksCacheService
 from src.books.domain.schemas import BooksSearchCriteriaSchema
 from src.books.domain.searcher.protocols import BookSearcherProtocol
-from src.core.domain.database.schemas import RedisProtocol
+from src.core.application.retry.base import RetryBudget, RetryPolicy
 from src.core.infra.broker.rabbitmq.settings import Settings as RabbitMQSettings
 from src.presentation.consumer.broker import get_broker
-from src.presentation.consumer.di.stub import get_books_service_stub, get_redis_stub
+from src.presentation.consumer.commons.retry import classify_message_error
+from src.presentation.consumer.di.stub import (
+    get_books_cache_stub,
+    get_books_service_stub,
+)
 from src.presentation.consumer.settings import Settings as ConsumerSettings
 import random
 
@@ -82,6 +87,30 @@ broker = get_broker(
     rabbitmq_settings=rabbitmq_settings,
 )
 
+retry_policy = RetryPolicy(
+    max_attempts=consumer_settings.consumer_max_retries + 1,
+    base_delay=consumer_settings.consumer_retry_base_delay,
+    max_delay=consumer_settings.consumer_retry_max_delay,
+    classifier=classify_message_error,
+    budget=RetryBudget(),
+)
+
+
+async def refresh_overview(
+    payload: dict,
+    books_service: BookSearcherProtocol,
+    books_cache: BooksCacheService,
+) -> None:
+    """Refresca todas las listas con una sola llamada y una sola escritura en lote."""
+    published_date = payload["overview"].get("published_date")
+    overview = await books_service.get_books_overview(published_date)
+    await books_cache.set_overview(overview, published_date)
+    logger.info(
+        "Listas refrescadas en lote",
+        lists=len(overview),
+        published_date=published_date,
+    )
+
 
 # Modifica tus decoradores para usar una función en lugar del broker directamente
 
@@ -93,13 +122,12 @@ broker = get_broker(
 async def get_books_handler(
     message: RabbitMessage,
     books_service: BookSearcherProtocol = Depends(get_books_service_stub),
-    redis_service: RedisProtocol = Depends(get_redis_stub),
+    books_cache: BooksCacheService = Depends(get_books_cache_stub),
 ):
-    max_retries = 3
-    delay_seconds = 5
-
     headers = message.headers or {}
     retries = headers.get("retries", 0)
+    if retries == 0:
+        retry_policy.record_request()
     logger.info(
         f"Procesando mensaje, intento número {retries + 1}",
         message_id=message.message_id,
@@ -107,6 +135,10 @@ async def get_books_handler(
 
     try:
         data = json.loads(message.body)
+        if "overview" in data["payload"]:
+            await refresh_overview(data["payload"], books_service, books_cache)
+            await message.ack()
+            return
         criteria = BooksSearchCriteriaSchema(**data["payload"]["criteria"])
         result = await books_service.search_books(criteria)
         logger.info(
@@ -114,19 +146,20 @@ async def get_books_handler(
             result=result.model_dump(),
             message_id=message.message_id,
         )
-        await redis_service.set(criteria.list, result.model_dump())
+        await books_cache.set(criteria, result)
         await message.ack()
     except Exception as e:
         logger.error(
             f"Error al procesar el mensaje: {e}", message_id=message.message_id
         )
 
-        if retries < max_retries:
+        delay_seconds = retry_policy.next_delay(retries, e)
+        if delay_seconds is not None:
             new_headers = message.headers.copy()
             new_headers["retries"] = retries + 1
 
             logger.info(
-                f"Programando reintento {retries + 1} con retraso de {delay_seconds} segundos"
+                f"Programando reintento {retries + 1} con retraso de {delay_seconds:.2f} segundos"
             )
 
             await asyncio.sleep(delay_seconds)
@@ -145,7 +178,7 @@ async def get_books_handler(
             )
         else:
             logger.warning(
-                f"Mensaje {message.message_id} agotó los reintentos. Enviando a DLQ."
+                f"Mensaje {message.message_id} agotó los reintentos o no es reintentable. Enviando a DLQ."
             )
             await broker.publish(message.body, broker.dlq_queue.name)
             await message.ack()
@@ -158,17 +191,21 @@ async def get_books_handler(
 async def dead_letter_handler(
     message: RabbitMessage,
     books_service: BookSearcherProtocol = Depends(get_books_service_stub),
-    redis_service: RedisProtocol = Depends(get_redis_stub),
+    books_cache: BooksCacheService = Depends(get_books_cache_stub),
 ):
     random_number = random.randint(10, 30)
     logger.error(f"Mensaje en cola de letras muertas: {message.body}")
     await asyncio.sleep(random_number)
     data = json.loads(message.body)
+    if "overview" in data["payload"]:
+        await refresh_overview(data["payload"], books_service, books_cache)
+        await message.ack()
+        return
     criteria = BooksSearchCriteriaSchema(**data["payload"]["criteria"])
     result = await books_service.search_books(criteria)
     logger.info("libro antes de guardar en redis", result=result.model_dump())
     logger.info("criteria", criteria=criteria)
-    await redis_service.set(criteria.list, result.model_dump_json())
+    await books_cache.set(criteria, result)
     logger.info(
         "Libro procesado exitosamente",
         result=result.model_dump(),
@@ -8,3 +8,11 @@ class Settings(BaseSettings):
     consumer_book_service: Literal["nyt", "dummy"] = "nyt"
     consumer_max_retries: int = 3
     consumer_ms_delay: int = 1
+    consumer_retry_base_delay: float = 5.0
+    consumer_retry_max_delay: float = 60.0
+    consumer_warmer_enabled: bool = True
+    # Cron expression in UTC; by default shortly after NYT publishes the new
+    # lists on Wednesday evening
+    consumer_warmer_schedule: str = "15 23 * * 3"
+    consumer_warmer_window_seconds: float = 1800.0
+    consumer_warmer_run_on_start: bool = False
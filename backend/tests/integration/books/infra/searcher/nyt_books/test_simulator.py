@@ -0,0 +1,159 @@
+import random
+
+import httpx
+import pytest
+
+from src.books.infra.searcher.nyt_books.client import NYTBooksClient
+from src.books.infra.searcher.nyt_books.client.exceptions import (
+    NYTBooksTooManyRequestsException,
+)
+from src.books.infra.searcher.nyt_books.simulator import (
+    FaultInjector,
+    SimulatorSettings,
+    create_app,
+)
+
+
+def simulated_client(settings: SimulatorSettings, **kwargs) -> NYTBooksClient:
+    app = create_app(settings)
+    client = NYTBooksClient(
+        api_key="simulated",
+        base_url="http://nyt.simulator",
+        retry_delay=0,
+        transport=httpx.ASGITransport(app=app),
+        **kwargs,
+    )
+    client.simulator = app.state.faults
+    return client
+
+
+@pytest.mark.asyncio
+async def test_client_parses_generated_lists_and_genres():
+    client = simulated_client(SimulatorSettings(genres=5, results_per_list=45))
+
+    async with client:
+        genres = await client.get_books_genres()
+        ranks = [
+            result.rank
+            async for result in client.iter_books({"list": "hardcover-fiction"})
+        ]
+        overview = await client.get_books_overview()
+
+    assert [genre["code"] for genre in genres][:3] == [
+        "combined-print-and-e-book-fiction",
+        "combined-print-and-e-book-nonfiction",
+        "hardcover-fiction",
+    ]
+    assert ranks == list(range(1, 46))
+    assert len(overview) == 5
+    assert overview["hardcover-fiction"].num_results == 45
+
+
+@pytest.mark.asyncio
+async def test_overview_keeps_every_book_of_lists_longer_than_the_top_five():
+    settings = SimulatorSettings(genres=5, results_per_list=25)
+    client = simulated_client(settings)
+    simulator = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app(settings)),
+        base_url="http://nyt.simulator",
+    )
+
+    async with client, simulator:
+        top = await simulator.get(
+            "/lists/overview.json", params={"api-key": "simulated"}
+        )
+        overview = await client.get_books_overview()
+        first_page = await client.search_books({"list": "hardcover-fiction"})
+
+    # The plain overview only carries the top of each list
+    assert len(top.json()["results"]["lists"][2]["books"]) == 5
+    fiction = overview["hardcover-fiction"]
+    assert fiction.num_results == first_page.num_results == 25
+    assert [result.rank for result in fiction.results] == list(range(1, 26))
+
+
+@pytest.mark.asyncio
+async def test_payloads_are_deterministic_and_revalidated():
+    client = simulated_client(SimulatorSettings())
+
+    async with client:
+        first = await client.search_books({"list": "hardcover-fiction"})
+        second = await client.search_books({"list": "hardcover-fiction"})
+
+    assert second is first
+    assert client.simulator.stats()["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_requests_are_retried():
+    settings = SimulatorSettings(rate_limit_probability=1.0, retry_after_seconds=0)
+    client = simulated_client(settings, retries=3)
+
+    async with client:
+        with pytest.raises(NYTBooksTooManyRequestsException):
+            await client.get_books_genres()
+
+    assert client.simulator.stats()["rate_limited"] == 3
+
+
+class ScriptedRandom(random.Random):
+    def __init__(self, draws):
+        super().__init__(0)
+        self._draws = list(draws)
+
+    def random(self):
+        return self._draws.pop(0) if self._draws else 0.99
+
+
+@pytest.mark.asyncio
+async def test_server_error_burst_is_absorbed_by_retries():
+    settings = SimulatorSettings(error_probability=0.5, error_burst_length=2)
+    # Draws per request: rate limit, then server error unless a burst is
+    # running. The second draw opens a burst of two failures.
+    faults = FaultInjector(settings, rng=ScriptedRandom([0.99, 0.1]))
+    app = create_app(settings, faults=faults)
+    client = NYTBooksClient(
+        api_key="simulated",
+        base_url="http://nyt.simulator",
+        retries=3,
+        retry_delay=0,
+        transport=httpx.ASGITransport(app=app),
+    )
+
+    async with client:
+        genres = await client.get_books_genres()
+
+    assert genres
+    assert faults.stats()["requests"] == 3
+    assert faults.stats()["server_errors"] == 2
+
+
+def test_latency_distributions_keep_the_configured_mean():
+    for distribution in ("fixed", "normal", "lognormal", "exponential"):
+        settings = SimulatorSettings(
+            latency_distribution=distribution,
+            latency_mean_ms=100,
+            latency_stddev_ms=30,
+        )
+        faults = FaultInjector(settings)
+
+        samples = [faults.latency() for _ in range(5000)]
+
+        assert min(samples) >= 0
+        assert sum(samples) / len(samples) == pytest.approx(0.1, rel=0.1)
+
+
+@pytest.mark.asyncio
+async def test_slow_bodies_are_streamed_in_chunks():
+    settings = SimulatorSettings(
+        slow_body_probability=1.0,
+        slow_body_chunk_size=256,
+        slow_body_chunk_delay_ms=1,
+    )
+    client = simulated_client(settings)
+
+    async with client:
+        books = await client.search_books({"list": "hardcover-fiction"})
+
+    assert books.page_size == 15
+    assert client.simulator.stats()["slow_bodies"] == 1
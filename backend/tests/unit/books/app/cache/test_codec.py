@@ -0,0 +1,81 @@
+import pytest
+
+from src.books.app.cache.codec import BooksCacheCodec, CacheCodecError
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.books.domain.schemas import (
+    BookListSchema,
+    BookResultSchema,
+    BookSchema,
+    ISBNSchema,
+    ReviewSchema,
+)
+
+
+@pytest.fixture
+def cached():
+    result = BookResultSchema(
+        list_name="Hardcover Fiction",
+        display_name="Hardcover Fiction",
+        bestsellers_date="2024-01-06",
+        published_date="2024-01-21",
+        rank=1,
+        rank_last_week=0,
+        weeks_on_list=1,
+        asterisk=0,
+        dagger=0,
+        amazon_product_url="https://www.amazon.com/dp/1234567890",
+        isbns=[ISBNSchema(isbn10="1234567890", isbn13="9781234567890")],
+        book_details=[
+            BookSchema(
+                title="A TITLE",
+                description="A description of the book. " * 5,
+                contributor="by An Author",
+                author="An Author",
+                price=0,
+                publisher="Publisher",
+                primary_isbn13="9781234567890",
+                primary_isbn10="1234567890",
+            )
+        ],
+        reviews=[ReviewSchema()],
+    )
+    books = BookListSchema(
+        num_results=15,
+        results=[result.model_copy(update={"rank": rank}) for rank in range(1, 16)],
+    )
+    return CachedBooksSchema(data=books, stored_at=1000.0, fresh_until=1600.0)
+
+
+def test_round_trip_is_smaller_than_json(cached):
+    codec = BooksCacheCodec(compression="zlib")
+
+    encoded = codec.encode(cached)
+
+    assert encoded[:4] == b"BC\x01\x01"
+    assert len(encoded) < len(cached.model_dump_json()) / 3
+    assert codec.decode(encoded, CachedBooksSchema) == cached
+
+
+def test_small_payloads_are_not_compressed(cached):
+    codec = BooksCacheCodec(compression="zlib", min_size=10**6)
+
+    encoded = codec.encode(cached)
+
+    assert encoded[3] == 0
+    assert codec.decode(encoded, CachedBooksSchema) == cached
+
+
+def test_entries_stay_readable_after_changing_compression(cached):
+    encoded = BooksCacheCodec(compression="zlib").encode(cached)
+
+    decoded = BooksCacheCodec(compression="none").decode(encoded, CachedBooksSchema)
+    assert decoded == cached
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b'{"data": {}}', b"BC\x09\x00{}", b"BC\x01\x07{}", b"BC\x01\x01garbage"],
+)
+def test_unreadable_payloads_raise_codec_error(raw):
+    with pytest.raises(CacheCodecError):
+        BooksCacheCodec().decode(raw, CachedBooksSchema)
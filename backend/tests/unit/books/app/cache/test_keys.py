@@ -0,0 +1,27 @@
+from src.books.app.cache.keys import CACHE_SCHEMA_VERSION, build_books_cache_key
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+
+def test_equivalent_criteria_share_a_key():
+    first = BooksSearchCriteriaSchema(list=" Hardcover-Fiction ", offset=None)
+    second = BooksSearchCriteriaSchema(list="hardcover-fiction", published_date="")
+
+    assert build_books_cache_key(first) == build_books_cache_key(second)
+
+
+def test_every_criterion_is_part_of_the_key():
+    base = BooksSearchCriteriaSchema(list="hardcover-fiction")
+    variants = [
+        base,
+        base.model_copy(update={"offset": 20}),
+        base.model_copy(update={"published_date": "2024-01-21"}),
+        base.model_copy(update={"bestsellers_date": "2024-01-06"}),
+        base.model_copy(update={"list": "hardcover-nonfiction"}),
+        BooksSearchCriteriaSchema(),
+    ]
+
+    keys = {build_books_cache_key(criteria) for criteria in variants}
+
+    assert len(keys) == len(variants)
+    assert all(key.startswith(f"books:v{CACHE_SCHEMA_VERSION}:") for key in keys)
+    assert "None" not in build_books_cache_key(BooksSearchCriteriaSchema())
@@ -0,0 +1,63 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.books.app.cache.keys import build_books_refresh_lock_key
+from src.books.app.cache.refresh import BooksRefreshService
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+
+@pytest.fixture
+def broker():
+    broker = MagicMock()
+    broker.books_queue.name = "book.queue"
+    broker.publish = AsyncMock()
+    return broker
+
+
+@pytest.fixture
+def redis_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def books_refresh(broker, redis_service):
+    return BooksRefreshService(broker=broker, redis_service=redis_service, lock_ttl=30)
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_published_once_per_lock(
+    books_refresh, broker, redis_service
+):
+    # Arrange
+    criteria = BooksSearchCriteriaSchema(list="Hardcover-Fiction")
+    redis_service.set_if_absent.side_effect = [True, False]
+
+    # Act
+    first = await books_refresh.request_refresh(criteria)
+    second = await books_refresh.request_refresh(criteria)
+
+    # Assert
+    assert (first, second) == (True, False)
+    broker.publish.assert_awaited_once()
+    message, queue_name = broker.publish.await_args.args
+    assert queue_name == "book.queue"
+    assert message.payload["criteria"]["list"] == "hardcover-fiction"
+    redis_service.set_if_absent.assert_awaited_with(
+        build_books_refresh_lock_key(criteria), "1", ttl=30
+    )
+    assert books_refresh.stats() == {"requested": 1, "deduplicated": 1, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_refresh_failures_are_not_raised(books_refresh, broker, redis_service):
+    # Arrange
+    redis_service.set_if_absent.return_value = True
+    broker.publish.side_effect = ConnectionError("broker down")
+
+    # Act
+    scheduled = await books_refresh.request_refresh(BooksSearchCriteriaSchema())
+
+    # Assert
+    assert scheduled is False
+    assert books_refresh.stats()["failed"] == 1
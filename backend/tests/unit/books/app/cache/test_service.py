@@ -0,0 +1,439 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.books.app.cache.codec import BooksCacheCodec
+from src.books.app.cache.keys import (
+    build_book_record_key,
+    build_books_cache_key,
+    build_books_missing_key,
+)
+from src.books.app.cache.normalized import split_page
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.books.app.cache.service import BooksCacheService
+from src.books.app.cache.ttl import BooksCacheTTLPolicy
+from src.books.app.catalog.service import BookCatalog
+from src.books.domain.schemas import (
+    BookListSchema,
+    BookResultSchema,
+    BookSchema,
+    BooksSearchCriteriaSchema,
+)
+from src.core.application.cache.base import LocalCache
+
+CHANNEL = "books:cache:invalidations"
+
+
+@pytest.fixture
+def redis_service():
+    redis_service = AsyncMock()
+    redis_service.get_many.side_effect = lambda keys: [None] * len(keys)
+    redis_service.get_ttls.side_effect = lambda keys: [-2] * len(keys)
+    return redis_service
+
+
+def store_in_redis(redis_service, pages):
+    """Serves the normalized form of `pages`, by key, from the mocked MGET."""
+    codec = BooksCacheCodec()
+    stored = {}
+    for key, cached in pages.items():
+        page, records = split_page(cached)
+        stored[key] = codec.encode(page)
+        for isbn13, record in records.items():
+            stored[build_book_record_key(isbn13)] = codec.encode(record)
+    redis_service.get_many.side_effect = lambda keys: [stored.get(k) for k in keys]
+    return stored
+
+
+def result(isbn13: str, rank: int, list_name: str) -> BookResultSchema:
+    return BookResultSchema(
+        list_name=list_name,
+        display_name=list_name,
+        bestsellers_date="2024-01-06",
+        published_date="2024-01-21",
+        rank=rank,
+        rank_last_week=0,
+        weeks_on_list=1,
+        asterisk=0,
+        dagger=0,
+        amazon_product_url="",
+        isbns=[],
+        book_details=[
+            BookSchema(
+                title=f"Title {isbn13}",
+                contributor="by Someone",
+                author="Someone",
+                price=0.0,
+                publisher="Scribner",
+                primary_isbn13=isbn13,
+                primary_isbn10=isbn13[3:],
+            )
+        ],
+        reviews=[],
+    )
+
+
+@pytest.fixture
+def books_cache(redis_service):
+    return BooksCacheService(
+        redis_service=redis_service,
+        ttl_policy=BooksCacheTTLPolicy(current_ttl=600, stale_ttl=3600),
+        local_cache=LocalCache(max_entries=10, ttl=60),
+        invalidation_channel=CHANNEL,
+        clock=lambda: 1000.0,
+    )
+
+
+@pytest.fixture
+def criteria():
+    return BooksSearchCriteriaSchema(list="hardcover-fiction")
+
+
+@pytest.fixture
+def books():
+    return BookListSchema(
+        num_results=1,
+        results=[
+            BookResultSchema(
+                list_name="Hardcover Fiction",
+                display_name="Hardcover Fiction",
+                bestsellers_date="2024-01-06",
+                published_date="2024-01-21",
+                rank=1,
+                rank_last_week=0,
+                weeks_on_list=1,
+                asterisk=0,
+                dagger=0,
+                amazon_product_url="",
+                isbns=[],
+                book_details=[],
+                reviews=[],
+            )
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_is_served_locally_afterwards(
+    books_cache, redis_service, criteria, books
+):
+    # Arrange
+    cached = CachedBooksSchema(data=books, stored_at=1000.0, fresh_until=1600.0)
+    store_in_redis(redis_service, {build_books_cache_key(criteria): cached})
+
+    # Act
+    first = await books_cache.get(criteria)
+    second = await books_cache.get(criteria)
+
+    # Assert
+    assert first == cached
+    assert second is first
+    redis_service.get_many.assert_awaited_once_with(
+        [build_books_cache_key(criteria)]
+    )
+    stats = books_cache.stats()
+    assert stats["local_hits"] == 1
+    assert stats["local_misses"] == 1
+    assert stats["redis_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_publishes_an_invalidation(
+    books_cache, redis_service, criteria, books
+):
+    # Act
+    cached = await books_cache.set(criteria, books)
+
+    # Assert
+    channel, message = redis_service.publish.await_args.args
+    assert channel == CHANNEL
+    assert json.loads(message)["keys"] == [build_books_cache_key(criteria)]
+    assert await books_cache.get(criteria) is cached
+
+
+@pytest.mark.asyncio
+async def test_invalidation_from_another_process_evicts_local_copy(
+    books_cache, redis_service, criteria, books
+):
+    # Arrange
+    cached = await books_cache.set(criteria, books)
+    own_message = redis_service.publish.await_args.args[1]
+    other_message = json.dumps(
+        {"origin": "other", "keys": [build_books_cache_key(criteria)]}
+    )
+
+    # Act
+    books_cache.handle_invalidation(own_message)
+    cached_after_own = await books_cache.get(criteria)
+    books_cache.handle_invalidation(other_message)
+    cached_after_other = await books_cache.get(criteria)
+
+    # Assert
+    assert cached_after_own is cached
+    assert cached_after_other is None
+    assert books_cache.stats()["invalidations_received"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entry_is_fresh_until_soft_expiry_and_kept_until_hard_expiry(
+    books_cache, redis_service, criteria, books
+):
+    # Act
+    cached = await books_cache.set(criteria, books)
+
+    # Assert
+    assert cached.stored_at == 1000.0
+    assert cached.fresh_until == 1600.0
+    assert not cached.is_stale(now=1599.0)
+    assert cached.is_stale(now=1600.0)
+    assert cached.age(now=1600.0) == 600.0
+    ttls = redis_service.set_many.await_args.kwargs["ttls"]
+    assert ttls[build_books_cache_key(criteria)] == 600 + 3600
+
+
+@pytest.mark.asyncio
+async def test_get_many_reads_local_misses_with_a_single_mget(
+    books_cache, redis_service, books
+):
+    # Arrange
+    local = BooksSearchCriteriaSchema(list="local")
+    remote = BooksSearchCriteriaSchema(list="remote")
+    missing = BooksSearchCriteriaSchema(list="missing")
+    local_cached = await books_cache.set(local, books)
+    remote_cached = CachedBooksSchema(data=books, stored_at=1000.0)
+    store_in_redis(redis_service, {build_books_cache_key(remote): remote_cached})
+
+    # Act
+    results = await books_cache.get_many([local, remote, missing])
+
+    # Assert
+    assert results == [local_cached, remote_cached, None]
+    redis_service.get_many.assert_awaited_once_with(
+        [build_books_cache_key(remote), build_books_cache_key(missing)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_many_writes_one_pipeline_with_per_key_ttls(
+    books_cache, redis_service, books
+):
+    # Arrange
+    current = BooksSearchCriteriaSchema(list="current")
+    historical = BooksSearchCriteriaSchema(list="old", published_date="2010-01-03")
+
+    # Act
+    await books_cache.set_many([(current, books), (historical, books)])
+
+    # Assert
+    redis_service.set_many.assert_awaited_once()
+    ttls = redis_service.set_many.await_args.kwargs["ttls"]
+    assert ttls[build_books_cache_key(current)] is not None
+    assert ttls[build_books_cache_key(historical)] is None
+    redis_service.publish.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_overview_is_cut_into_the_pages_of_the_lists_endpoint(
+    books_cache, redis_service
+):
+    # Arrange
+    results = [
+        result(f"9780000000{rank:03d}", rank, "Fiction") for rank in range(1, 26)
+    ]
+    overview = {"fiction": BookListSchema(num_results=25, results=results)}
+    first = BooksSearchCriteriaSchema(list="fiction")
+    second = BooksSearchCriteriaSchema(list="fiction", offset=20)
+
+    # Act
+    await books_cache.set_overview(overview, None)
+    mapping = redis_service.set_many.await_args.args[0]
+    redis_service.get_many.side_effect = lambda keys: [mapping.get(k) for k in keys]
+    books_cache.clear_local()
+    pages = await books_cache.get_many([first, second])
+
+    # Assert
+    assert [page.data.num_results for page in pages] == [25, 25]
+    assert [len(page.data.results) for page in pages] == [20, 5]
+    assert pages[1].data.results[0].rank == 21
+
+
+@pytest.mark.asyncio
+async def test_empty_page_is_kept_only_for_the_negative_ttl(
+    books_cache, redis_service, criteria
+):
+    # Act
+    cached = await books_cache.set(criteria, BookListSchema(num_results=0, results=[]))
+
+    # Assert
+    assert cached.fresh_until == 1300.0
+    ttls = redis_service.set_many.await_args.kwargs["ttls"]
+    assert ttls == {build_books_cache_key(criteria): 300}
+
+
+@pytest.mark.asyncio
+async def test_missing_page_is_remembered_in_process(
+    books_cache, redis_service, criteria
+):
+    # Arrange
+    redis_service.get.return_value = None
+
+    # Act
+    before = await books_cache.is_missing(criteria)
+    await books_cache.set_missing(criteria)
+    after = await books_cache.is_missing(criteria)
+
+    # Assert
+    assert (before, after) == (False, True)
+    redis_service.set.assert_awaited_once_with(
+        build_books_missing_key(criteria), b"1", ttl=300
+    )
+    redis_service.get.assert_awaited_once()
+    assert books_cache.stats()["missing_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_page_marked_by_another_process_is_read_from_redis(
+    books_cache, redis_service, criteria
+):
+    # Arrange
+    redis_service.get.return_value = b"1"
+
+    # Act
+    first = await books_cache.is_missing(criteria)
+    second = await books_cache.is_missing(criteria)
+
+    # Assert
+    assert first and second
+    redis_service.get.assert_awaited_once_with(build_books_missing_key(criteria))
+
+
+@pytest.mark.asyncio
+async def test_catalog_loads_pages_written_by_other_processes(
+    redis_service, criteria, books
+):
+    # Arrange
+    catalog = BookCatalog()
+    books_cache = BooksCacheService(
+        redis_service=redis_service,
+        ttl_policy=BooksCacheTTLPolicy(),
+        invalidation_channel=CHANNEL,
+        catalog=catalog,
+    )
+    key = build_books_cache_key(criteria)
+    cached = CachedBooksSchema(data=books, stored_at=1000.0)
+    store_in_redis(redis_service, {key: cached})
+    redis_service.scan_keys.return_value = [key, f"{key}:missing"]
+
+    # Act
+    books_cache.handle_invalidation(json.dumps({"origin": "other", "keys": [key]}))
+    await books_cache._catalog_task
+    after_invalidation = catalog.stats()["pages"]
+    catalog.remove_page(key)
+    books_cache.resync()
+    await books_cache._catalog_task
+
+    # Assert
+    assert after_invalidation == 1
+    assert catalog.stats()["pages"] == 1
+    redis_service.get_many.assert_awaited_with([key])
+
+
+@pytest.mark.asyncio
+async def test_page_the_catalog_cannot_index_is_still_served(
+    redis_service, criteria, books
+):
+    # Arrange
+    catalog = MagicMock()
+    catalog.index_page.side_effect = ValueError("Invalid isoformat string: ''")
+    books_cache = BooksCacheService(
+        redis_service=redis_service,
+        ttl_policy=BooksCacheTTLPolicy(),
+        catalog=catalog,
+    )
+    cached = CachedBooksSchema(data=books, stored_at=1000.0)
+    store_in_redis(redis_service, {build_books_cache_key(criteria): cached})
+
+    # Act
+    result = await books_cache.get(criteria)
+
+    # Assert
+    assert result == cached
+    catalog.index_page.assert_called_once_with(
+        build_books_cache_key(criteria), books, version=1000.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_book_on_several_lists_is_stored_once(books_cache, redis_service):
+    # Arrange
+    fiction = BooksSearchCriteriaSchema(list="fiction")
+    historical = BooksSearchCriteriaSchema(list="old", published_date="2010-01-03")
+    shared = result("9780000000001", 1, "Fiction")
+    only_fiction = result("9780000000002", 2, "Fiction")
+
+    # Act
+    await books_cache.set_many(
+        [
+            (fiction, BookListSchema(num_results=2, results=[shared, only_fiction])),
+            (
+                historical,
+                BookListSchema(
+                    num_results=1,
+                    results=[shared.model_copy(update={"list_name": "Old"})],
+                ),
+            ),
+        ]
+    )
+
+    # Assert
+    mapping = redis_service.set_many.await_args.args[0]
+    ttls = redis_service.set_many.await_args.kwargs["ttls"]
+    record_keys = [key for key in mapping if ":book:" in key]
+    assert sorted(record_keys) == [
+        build_book_record_key("9780000000001"),
+        build_book_record_key("9780000000002"),
+    ]
+    # Shared with a historical page kept forever, so kept forever as well
+    assert ttls[build_book_record_key("9780000000001")] is None
+    assert ttls[build_book_record_key("9780000000002")] == ttls[
+        build_books_cache_key(fiction)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_record_ttl_is_never_shortened(books_cache, redis_service, criteria):
+    # Arrange
+    redis_service.get_ttls.side_effect = lambda keys: [-1]
+    books = BookListSchema(
+        num_results=1, results=[result("9780000000001", 1, "Fiction")]
+    )
+
+    # Act
+    await books_cache.set(criteria, books)
+
+    # Assert
+    ttls = redis_service.set_many.await_args.kwargs["ttls"]
+    assert ttls[build_book_record_key("9780000000001")] is None
+
+
+@pytest.mark.asyncio
+async def test_page_with_an_expired_record_reads_as_a_miss(
+    books_cache, redis_service, criteria
+):
+    # Arrange
+    books = BookListSchema(
+        num_results=1, results=[result("9780000000001", 1, "Fiction")]
+    )
+    stored = store_in_redis(
+        redis_service,
+        {build_books_cache_key(criteria): CachedBooksSchema(data=books, stored_at=0)},
+    )
+    del stored[build_book_record_key("9780000000001")]
+
+    # Act
+    cached = await books_cache.get(criteria)
+
+    # Assert
+    assert cached is None
+    assert books_cache.stats()["dangling_pages"] == 1
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.books.app.cache.ttl import BooksCacheTTLPolicy
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+# A Monday; the weekly update is on Wednesday at 23:00 UTC
+NOW = datetime(2024, 1, 22, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def policy():
+    return BooksCacheTTLPolicy(
+        current_ttl=7 * 24 * 3600,
+        historical_ttl=None,
+        update_weekday=2,
+        update_hour_utc=23,
+        clock=lambda: NOW,
+    )
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        BooksSearchCriteriaSchema(list="hardcover-fiction"),
+        BooksSearchCriteriaSchema(published_date="current"),
+        BooksSearchCriteriaSchema(published_date="2024-01-21"),
+        BooksSearchCriteriaSchema(published_date="not-a-date"),
+    ],
+)
+def test_current_lists_expire_at_the_next_weekly_update(policy, criteria):
+    assert policy.ttl_for(criteria) == (2 * 24 + 11) * 3600
+
+
+def test_current_ttl_caps_the_expiry(policy):
+    policy = BooksCacheTTLPolicy(current_ttl=600, clock=lambda: NOW)
+
+    assert policy.ttl_for(BooksSearchCriteriaSchema()) == 600
+
+
+def test_update_already_passed_this_week_moves_to_next_week(policy):
+    thursday = datetime(2024, 1, 25, 0, 0, tzinfo=timezone.utc)
+
+    assert policy.seconds_until_next_update(thursday) == (6 * 24 + 23) * 3600
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        BooksSearchCriteriaSchema(published_date="2023-06-04"),
+        BooksSearchCriteriaSchema(bestsellers_date="2024-01-06"),
+    ],
+)
+def test_historical_lists_never_expire(policy, criteria):
+    assert policy.ttl_for(criteria) is None
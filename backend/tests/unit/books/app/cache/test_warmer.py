@@ -0,0 +1,123 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.books.app.cache.popularity import ListHitCounter
+from src.books.app.cache.warmer import BooksCacheWarmer
+from src.books.domain.schemas import BookListSchema, BooksSearchCriteriaSchema
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def books_service():
+    books_service = AsyncMock()
+    books_service.list_genres.return_value = [
+        {"code": "hardcover-fiction", "display_name": "Hardcover Fiction"},
+        {"code": "manga", "display_name": "Manga"},
+        {"code": "audio-fiction", "display_name": "Audio Fiction"},
+    ]
+    books_service.search_books.return_value = BookListSchema(num_results=0, results=[])
+    return books_service
+
+
+@pytest.fixture
+def redis_service():
+    redis_service = AsyncMock()
+    redis_service.get_scores.return_value = {"manga": 12.0, "audio-fiction": 3.0}
+    return redis_service
+
+
+@pytest.mark.asyncio
+async def test_most_requested_lists_are_warmed_first(books_service, redis_service):
+    # Arrange
+    clock = FakeClock()
+    books_cache = AsyncMock()
+    warmer = BooksCacheWarmer(
+        books_service=books_service,
+        books_cache=books_cache,
+        hit_counter=ListHitCounter(redis_service),
+        window_seconds=30,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    # Act
+    await warmer()
+
+    # Assert
+    warmed = [call.args[0].list for call in books_cache.set.await_args_list]
+    assert warmed == ["manga", "audio-fiction", "hardcover-fiction"]
+    # Three lists spread over 30 seconds
+    assert clock.now == 20.0
+    assert warmer.stats() == {"refreshed": 3, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_failed_list_does_not_stop_the_warm_up(books_service, redis_service):
+    # Arrange
+    books_service.search_books.side_effect = [
+        ConnectionError("nyt down"),
+        BookListSchema(num_results=0, results=[]),
+        BookListSchema(num_results=0, results=[]),
+    ]
+    redis_service.get_scores.side_effect = ConnectionError("redis down")
+    books_cache = AsyncMock()
+    warmer = BooksCacheWarmer(
+        books_service=books_service,
+        books_cache=books_cache,
+        hit_counter=ListHitCounter(redis_service),
+        window_seconds=0,
+    )
+
+    # Act
+    await warmer()
+
+    # Assert
+    assert books_cache.set.await_count == 2
+    assert warmer.stats() == {"refreshed": 2, "failed": 1}
+
+
+@pytest.mark.asyncio
+async def test_hits_are_flushed_in_one_batch(redis_service):
+    # Arrange
+    hit_counter = ListHitCounter(redis_service, key="hits")
+    hit_counter.record(BooksSearchCriteriaSchema(list="Manga"))
+    hit_counter.record(BooksSearchCriteriaSchema(list="manga "))
+    hit_counter.record(BooksSearchCriteriaSchema(list="audio-fiction"))
+    hit_counter.record(BooksSearchCriteriaSchema())
+
+    # Act
+    await hit_counter.flush()
+    await hit_counter.flush()
+
+    # Assert
+    redis_service.increment_scores.assert_awaited_once_with(
+        "hits", {"manga": 2, "audio-fiction": 1}
+    )
+
+
+@pytest.mark.asyncio
+async def test_hits_are_kept_when_a_flush_fails(redis_service):
+    # Arrange
+    redis_service.increment_scores.side_effect = [ConnectionError("down"), None]
+    hit_counter = ListHitCounter(redis_service, key="hits")
+    hit_counter.record(BooksSearchCriteriaSchema(list="manga"))
+
+    # Act
+    await hit_counter.flush()
+    hit_counter.record(BooksSearchCriteriaSchema(list="manga"))
+    await hit_counter.flush()
+
+    # Assert
+    redis_service.increment_scores.assert_awaited_with("hits", {"manga": 2})
+    assert hit_counter.stats()["flush_errors"] == 1
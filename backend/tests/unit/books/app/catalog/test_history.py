@@ -0,0 +1,83 @@
+from src.books.app.catalog.history import RankHistory
+
+
+def test_history_is_ordered_by_week_and_filtered_by_list():
+    # Arrange
+    history = RankHistory()
+    history.record("Hardcover Fiction", "2024-01-21", "9781", 2, 5, 3)
+    history.record("Hardcover Fiction", "2024-01-14", "9781", 5, 0, 2)
+    history.record("Combined Print", "2024-01-14", "9781", 1, 1, 9)
+    history.record("Hardcover Fiction", "2024-01-21", "9782", 1, 1, 1)
+
+    # Act
+    all_lists = history.history("9781")
+    fiction = history.history("9781", list_name="Hardcover Fiction")
+
+    # Assert
+    assert [(p.published_date, p.list_name) for p in all_lists] == [
+        ("2024-01-14", "Combined Print"),
+        ("2024-01-14", "Hardcover Fiction"),
+        ("2024-01-21", "Hardcover Fiction"),
+    ]
+    assert [point.rank for point in fiction] == [5, 2]
+    assert history.history("9781", list_name="Unknown") == []
+    assert history.history("9789") == []
+
+
+def test_recording_a_week_again_overwrites_its_ranks():
+    # Arrange
+    history = RankHistory()
+    history.record("Hardcover Fiction", "2024-01-21", "9781", 2, 5, 3)
+
+    # Act
+    history.record("Hardcover Fiction", "2024-01-21", "9781", 4, 5, 3)
+
+    # Assert
+    assert [point.rank for point in history.history("9781")] == [4]
+    assert history.stats() == {
+        "rows": 1,
+        "lists": 1,
+        "books": 1,
+        "bytes": 16,
+        "skipped": 0,
+    }
+
+
+def test_ranks_without_a_valid_week_are_skipped():
+    # Arrange
+    history = RankHistory()
+
+    # Act
+    history.record("Hardcover Fiction", "", "9781", 1, 0, 1)
+    history.record("Hardcover Fiction", "last week", "9781", 1, 0, 1)
+    history.record("Hardcover Fiction", "2024-01-21", "9782", 1, 0, 1)
+
+    # Assert
+    assert history.history("9781") == []
+    assert history.stats()["rows"] == 1
+    assert history.stats()["skipped"] == 2
+
+
+def test_movers_compare_the_newest_week_of_each_list():
+    # Arrange
+    history = RankHistory()
+    # Older weeks are ignored even if they moved more
+    history.record("Hardcover Fiction", "2024-01-14", "9780", 1, 15, 2)
+    history.record("Hardcover Fiction", "2024-01-21", "9781", 2, 9, 3)
+    history.record("Hardcover Fiction", "2024-01-21", "9782", 8, 3, 4)
+    history.record("Hardcover Fiction", "2024-01-21", "9783", 1, 0, 1)
+    history.record("Hardcover Fiction", "2024-01-21", "9784", 5, 5, 6)
+    history.record("Combined Print", "2024-01-14", "9785", 3, 4, 2)
+
+    # Act
+    movers = history.movers()
+    fiction = history.movers(limit=1, list_name="Hardcover Fiction")
+
+    # Assert
+    assert [(move.isbn13, move.change) for move in movers] == [
+        ("9781", 7),
+        ("9782", -5),
+        ("9785", 1),
+    ]
+    assert [move.isbn13 for move in fiction] == ["9781"]
+    assert history.movers(list_name="Unknown") == []
@@ -0,0 +1,71 @@
+import pytest
+
+from src.books.app.catalog.search import SearchIndex, tokenize
+from src.books.domain.schemas import BookSchema
+
+
+def book(title: str, author: str = "Someone", description: str = "") -> BookSchema:
+    return BookSchema(
+        title=title,
+        description=description,
+        contributor=f"by {author}",
+        author=author,
+        price=0.0,
+        publisher="Publisher",
+        primary_isbn13="",
+        primary_isbn10="",
+    )
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.add(
+        "verity", book("VERITY", "Colleen Hoover", "A writer finds a manuscript.")
+    )
+    index.add("it-ends", book("IT ENDS WITH US", "Colleen Hoover"))
+    index.add(
+        "fourth", book("FOURTH WING", "Rebecca Yarros", "Violet enters a war college.")
+    )
+    return index
+
+
+def test_tokenize_strips_accents_and_punctuation():
+    assert tokenize("Cien años, de Soledad!") == ["cien", "anos", "de", "soledad"]
+
+
+def test_every_term_must_match(index):
+    assert [doc for doc, _ in index.search("hoover verity")] == ["verity"]
+    assert index.search("hoover yarros") == []
+
+
+def test_prefixes_match_and_rank_below_whole_words(index):
+    # Arrange
+    index.add("hoo", book("HOO", "Nobody"))
+
+    # Act
+    results = index.search("hoo")
+
+    # Assert
+    assert [doc for doc, _ in results] == ["hoo", "it-ends", "verity"]
+
+
+def test_title_matches_rank_above_description_matches(index):
+    # Arrange
+    index.add("college", book("COLLEGE DAYS"))
+
+    # Act
+    results = index.search("college")
+
+    # Assert
+    assert [doc for doc, _ in results] == ["college", "fourth"]
+
+
+def test_removed_documents_and_their_terms_are_forgotten(index):
+    # Act
+    index.remove("fourth")
+
+    # Assert
+    assert index.search("yarros") == []
+    assert index.search("wing") == []
+    assert index.stats()["documents"] == 2
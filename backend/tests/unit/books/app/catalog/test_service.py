@@ -0,0 +1,186 @@
+import pytest
+
+from src.books.app.catalog.service import BookCatalog, author_keys
+from src.books.domain.schemas import (
+    BookListSchema,
+    BookResultSchema,
+    BookSchema,
+    ISBNSchema,
+)
+
+
+def result(
+    isbn13: str, isbn10: str, author: str, rank: int = 1, **book
+) -> BookResultSchema:
+    return BookResultSchema(
+        list_name="Hardcover Fiction",
+        display_name="Hardcover Fiction",
+        bestsellers_date="2024-01-06",
+        published_date="2024-01-21",
+        rank=rank,
+        rank_last_week=0,
+        weeks_on_list=1,
+        asterisk=0,
+        dagger=0,
+        amazon_product_url="",
+        isbns=[ISBNSchema(isbn10=isbn10, isbn13=isbn13)],
+        book_details=[
+            BookSchema(
+                title=book.get("title", "A TITLE"),
+                contributor=f"by {author}",
+                author=author,
+                price=0.0,
+                publisher=book.get("publisher", "Scribner"),
+                primary_isbn13=isbn13,
+                primary_isbn10=isbn10,
+            )
+        ],
+        reviews=[],
+    )
+
+
+def page(*results: BookResultSchema) -> BookListSchema:
+    return BookListSchema(num_results=len(results), results=list(results))
+
+
+@pytest.fixture
+def catalog():
+    return BookCatalog()
+
+
+def test_indexing_the_same_version_again_is_skipped(catalog):
+    # Arrange
+    first = page(result("9781668001226", "1668001225", "Colleen Hoover"))
+    second = page(result("9780593321201", "0593321200", "Lucy Foley"))
+    catalog.index_page("fiction", first, version=1000.0)
+
+    # Act
+    catalog.index_page("fiction", second, version=1000.0)
+    after_same_version = catalog.find_by_isbn("9780593321201")
+    catalog.index_page("fiction", second, version=2000.0)
+
+    # Assert
+    assert after_same_version is None
+    assert catalog.find_by_isbn("9780593321201") is not None
+    assert catalog.find_by_isbn("9781668001226") is None
+
+
+def test_book_is_found_by_either_isbn(catalog):
+    # Arrange
+    catalog.index_page(
+        "fiction", page(result("9781668001226", "1668001225", "Colleen Hoover"))
+    )
+
+    # Act
+    by_isbn13 = catalog.find_by_isbn("978-1-66800-122-6")
+    by_isbn10 = catalog.find_by_isbn("1668001225")
+
+    # Assert
+    assert by_isbn13 == by_isbn10
+    assert by_isbn13.book.author == "Colleen Hoover"
+    assert [listing.rank for listing in by_isbn13.listings] == [1]
+    assert catalog.find_by_isbn("0000000000") is None
+
+
+def test_co_authors_and_publishers_are_indexed(catalog):
+    # Arrange
+    catalog.index_page(
+        "fiction",
+        page(
+            result("9781", "1", "Colleen Hoover and Tarryn Fisher", publisher="Atria"),
+            result("9782", "2", "Colleen Hoover", rank=2, publisher="atria "),
+        ),
+    )
+
+    # Act
+    by_author = catalog.find_by_author("colleen  HOOVER")
+    by_full_author = catalog.find_by_author("Colleen Hoover and Tarryn Fisher")
+    by_publisher = catalog.find_by_publisher("Atria")
+
+    # Assert
+    assert [entry.book.primary_isbn13 for entry in by_author] == ["9781", "9782"]
+    assert [entry.book.primary_isbn13 for entry in by_full_author] == ["9781"]
+    assert len(by_publisher) == 2
+
+
+def test_book_listed_on_several_pages_is_stored_once(catalog):
+    # Arrange
+    book = result("9781", "1", "Author")
+
+    # Act
+    catalog.index_page("fiction", page(book))
+    catalog.index_page("combined", page(book.model_copy(update={"rank": 4})))
+
+    # Assert
+    listings = catalog.find_by_isbn("9781").listings
+    assert sorted(listing.rank for listing in listings) == [1, 4]
+    assert catalog.stats()["books"] == 1
+
+
+def test_reindexing_a_page_drops_books_no_longer_listed(catalog):
+    # Arrange
+    catalog.index_page("fiction", page(result("9781", "1", "Old Author")))
+
+    # Act
+    catalog.index_page("fiction", page(result("9782", "2", "New Author")))
+
+    # Assert
+    assert catalog.find_by_isbn("9781") is None
+    assert catalog.find_by_isbn("1") is None
+    assert catalog.find_by_author("Old Author") == []
+    assert catalog.stats() == {
+        "books": 1,
+        "pages": 1,
+        "authors": 1,
+        "publishers": 1,
+        # "a", "title", "new", "author" and "scribner"
+        "search_terms": 5,
+        # The history keeps the ranks of the old book as well
+        "history_rows": 2,
+        "history_bytes": 32,
+        "history_skipped": 0,
+    }
+
+
+def test_author_keys():
+    assert author_keys("Ina Garten with Jane Doe, and Ann Roe") == {
+        "ina garten with jane doe, and ann roe",
+        "ina garten",
+        "jane doe",
+        "ann roe",
+    }
+
+
+def test_search_returns_catalog_entries(catalog):
+    # Arrange
+    catalog.index_page(
+        "fiction",
+        page(
+            result("9781", "1", "Rebecca Yarros", title="FOURTH WING"),
+            result("9782", "2", "Rebecca Yarros", rank=2, title="IRON FLAME"),
+        ),
+    )
+
+    # Act
+    results = catalog.search("yarros iron")
+
+    # Assert
+    assert [entry.book.title for entry in results] == ["IRON FLAME"]
+    assert results[0].listings[0].rank == 2
+
+
+def test_history_outlives_the_page_and_is_found_by_isbn10(catalog):
+    # Arrange
+    catalog.index_page("fiction", page(result("9781", "1", "Some Author", rank=3)))
+
+    # Act
+    while_listed = catalog.history("1")
+    catalog.remove_page("fiction")
+    after_removal = catalog.history("9781")
+
+    # Assert
+    assert while_listed.isbn13 == "9781"
+    assert while_listed.book.author == "Some Author"
+    assert after_removal.book is None
+    assert [point.rank for point in after_removal.ranks] == [3]
+    assert catalog.history("9789") is None
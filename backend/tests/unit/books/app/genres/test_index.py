@@ -0,0 +1,210 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.books.app.exceptions import GenreNotFoundException
+from src.books.app.genres.index import GenreIndex
+from src.books.domain.schemas import BooksSearchCriteriaSchema
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def books_service():
+    books_service = AsyncMock()
+    books_service.list_genres.return_value = [
+        {"code": "hardcover-fiction", "display_name": "Hardcover Fiction"},
+        {"code": "manga", "display_name": "Manga"},
+    ]
+    return books_service
+
+
+@pytest.fixture
+def genre_index(books_service, clock):
+    return GenreIndex(
+        books_service=books_service,
+        refresh_interval=3600,
+        miss_refresh_interval=60,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_known_code_is_normalized_and_genres_loaded_once(
+    genre_index, books_service
+):
+    # Act
+    first = await genre_index.validate(BooksSearchCriteriaSchema(list=" Manga "))
+    second = await genre_index.validate(BooksSearchCriteriaSchema(list="manga"))
+
+    # Assert
+    assert first.list == second.list == "manga"
+    books_service.list_genres.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_missing_list_defaults_explicitly(genre_index):
+    # Act
+    criteria = await genre_index.validate(BooksSearchCriteriaSchema())
+
+    # Assert
+    assert criteria.list == "hardcover-fiction"
+
+
+@pytest.mark.asyncio
+async def test_unknown_code_is_rejected_without_reloading_too_often(
+    genre_index, books_service, clock
+):
+    # Arrange
+    await genre_index.validate(BooksSearchCriteriaSchema(list="manga"))
+
+    # Act
+    for _ in range(3):
+        with pytest.raises(GenreNotFoundException):
+            await genre_index.validate(BooksSearchCriteriaSchema(list="nope"))
+
+    # Assert
+    books_service.list_genres.assert_awaited_once()
+    assert genre_index.stats()["rejected"] == 3
+
+
+@pytest.mark.asyncio
+async def test_unknown_code_reloads_once_the_miss_interval_passed(
+    genre_index, books_service, clock
+):
+    # Arrange
+    await genre_index.validate(BooksSearchCriteriaSchema(list="manga"))
+    books_service.list_genres.return_value = [
+        {"code": "graphic-books", "display_name": "Graphic Books"}
+    ]
+    clock.now = 61
+
+    # Act
+    criteria = await genre_index.validate(BooksSearchCriteriaSchema(list="graphic-books"))
+
+    # Assert
+    assert criteria.list == "graphic-books"
+    assert books_service.list_genres.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_every_code_is_accepted_while_genres_cannot_be_loaded(
+    genre_index, books_service
+):
+    # Arrange
+    books_service.list_genres.side_effect = ConnectionError("nyt down")
+
+    # Act
+    criteria = await genre_index.validate(BooksSearchCriteriaSchema(list="anything"))
+
+    # Assert
+    assert criteria.list == "anything"
+    assert genre_index.stats()["refresh_failures"] == 1
+
+
+@pytest.fixture
+def redis_service():
+    redis_service = AsyncMock()
+    redis_service.get.return_value = None
+    return redis_service
+
+
+@pytest.fixture
+def shared_genre_index(books_service, redis_service, clock):
+    return GenreIndex(
+        books_service=books_service,
+        refresh_interval=3600,
+        miss_refresh_interval=60,
+        redis_service=redis_service,
+        redis_key="books:genres",
+        redis_ttl=86400,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_genres_from_nyt_are_shared_through_redis(
+    shared_genre_index, books_service, redis_service
+):
+    # Act
+    genres = await shared_genre_index.genres()
+
+    # Assert
+    key, payload = redis_service.set.await_args.args
+    assert key == "books:genres"
+    assert json.loads(payload) == {"stored_at": 0.0, "genres": genres}
+    assert redis_service.set.await_args.kwargs["ttl"] == 86400
+    books_service.list_genres.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shared_copy_is_used_until_due(
+    shared_genre_index, books_service, redis_service, clock
+):
+    # Arrange
+    genres = [{"code": "manga", "display_name": "Manga"}]
+    redis_service.get.return_value = json.dumps(
+        {"stored_at": -3000.0, "genres": genres}
+    )
+
+    # Act
+    loaded = await shared_genre_index.genres()
+    clock.now = 601
+    due = await shared_genre_index.genres()
+    await asyncio.sleep(0)
+
+    # Assert
+    assert loaded == due == genres
+    assert shared_genre_index.stats()["shared_loads"] == 1
+    # Served at once while NYT is asked in the background
+    books_service.list_genres.assert_awaited_once()
+    assert await shared_genre_index.genres() == books_service.list_genres.return_value
+
+
+@pytest.mark.asyncio
+async def test_old_shared_copy_is_used_while_nyt_is_down(
+    shared_genre_index, books_service, redis_service
+):
+    # Arrange
+    genres = [{"code": "manga", "display_name": "Manga"}]
+    redis_service.get.return_value = json.dumps(
+        {"stored_at": -86000.0, "genres": genres}
+    )
+    books_service.list_genres.side_effect = ConnectionError("nyt down")
+
+    # Act
+    rejected = not await shared_genre_index.contains("anything")
+
+    # Assert
+    assert rejected
+    assert await shared_genre_index.genres() == genres
+    redis_service.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_version_changes_with_the_genres(genre_index, books_service):
+    # Act
+    before = genre_index.version
+    await genre_index.genres()
+    loaded = genre_index.version
+    genre_index.update(list(books_service.list_genres.return_value))
+    same = genre_index.version
+    genre_index.update([{"code": "manga", "display_name": "Manga"}])
+
+    # Assert
+    assert before is None
+    assert loaded == same
+    assert genre_index.version not in (None, loaded)
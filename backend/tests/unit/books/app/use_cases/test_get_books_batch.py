@@ -0,0 +1,205 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.books.app.exceptions import (
+    BookNotFoundException,
+    ExternalAPIException,
+    GenreNotFoundException,
+    ServiceUnavailableException,
+)
+from src.books.app.use_cases.get_books_batch import GetBooksBatchUseCase
+from src.books.domain.schemas import BookListSchema, BooksSearchCriteriaSchema
+
+
+def books(num_results: int) -> BookListSchema:
+    return BookListSchema(num_results=num_results, results=[])
+
+
+def cached(num_results: int, fresh_until=None) -> CachedBooksSchema:
+    return CachedBooksSchema(
+        data=books(num_results), stored_at=0.0, fresh_until=fresh_until
+    )
+
+
+@pytest.fixture
+def books_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def books_cache():
+    books_cache = AsyncMock()
+    books_cache.is_missing.return_value = False
+    books_cache.set_many.side_effect = lambda entries: [
+        cached(page.num_results) for _, page in entries
+    ]
+    return books_cache
+
+
+@pytest.fixture
+def books_refresh():
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(books_service, books_cache, books_refresh):
+    return GetBooksBatchUseCase(
+        books_service=books_service,
+        books_cache=books_cache,
+        books_refresh=books_refresh,
+        max_concurrency=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_hits_and_misses_are_resolved_in_bulk(
+    use_case, books_service, books_cache, books_refresh
+):
+    # Arrange
+    queries = {
+        "fiction": BooksSearchCriteriaSchema(list="hardcover-fiction"),
+        "same-fiction": BooksSearchCriteriaSchema(list="Hardcover-Fiction "),
+        "advice": BooksSearchCriteriaSchema(list="advice-how-to-and-miscellaneous"),
+        "stale": BooksSearchCriteriaSchema(list="picture-books"),
+    }
+    books_cache.get_many.return_value = [cached(1), None, cached(3, fresh_until=0.0)]
+    books_service.search_books.return_value = books(2)
+
+    # Act
+    results = await use_case(queries)
+
+    # Assert
+    assert len(books_cache.get_many.await_args.args[0]) == 3
+    books_service.search_books.assert_awaited_once_with(queries["advice"])
+    books_cache.set_many.assert_awaited_once()
+    books_refresh.request_refresh.assert_awaited_once_with(queries["stale"])
+    assert results["fiction"].data.num_results == 1
+    assert results["same-fiction"] == results["fiction"]
+    assert results["advice"].data.num_results == 2
+    assert results["stale"].stale is True
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_per_query(use_case, books_service, books_cache):
+    # Arrange
+    queries = {
+        "broken": BooksSearchCriteriaSchema(list="broken"),
+        "fallback": BooksSearchCriteriaSchema(list="fallback"),
+        "ok": BooksSearchCriteriaSchema(list="ok"),
+    }
+    books_cache.get_many.return_value = [None, None, None]
+
+    async def search_books(criteria):
+        if criteria.list == "broken":
+            raise ExternalAPIException("NYT Books API", "boom")
+        if criteria.list == "fallback":
+            raise ServiceUnavailableException("NYT Books API", fallback=books(7))
+        return books(5)
+
+    books_service.search_books.side_effect = search_books
+
+    # Act
+    results = await use_case(queries)
+
+    # Assert
+    assert results["broken"].data is None
+    assert "boom" in results["broken"].error
+    assert results["fallback"].data.num_results == 7
+    assert results["fallback"].stale is True
+    assert results["ok"].data.num_results == 5
+    assert len(books_cache.set_many.await_args.args[0]) == 1
+
+
+@pytest.mark.asyncio
+async def test_pages_nyt_does_not_have_are_remembered(
+    use_case, books_service, books_cache
+):
+    # Arrange
+    queries = {
+        "known-missing": BooksSearchCriteriaSchema(list="gone", offset=40),
+        "new-missing": BooksSearchCriteriaSchema(list="gone", offset=60),
+    }
+    books_cache.get_many.return_value = [None, None]
+    books_cache.is_missing.side_effect = lambda criteria: criteria.offset == 40
+    books_service.search_books.side_effect = BookNotFoundException("gone")
+
+    # Act
+    results = await use_case(queries)
+
+    # Assert
+    books_service.search_books.assert_awaited_once_with(queries["new-missing"])
+    books_cache.set_missing.assert_awaited_once_with(queries["new-missing"])
+    books_cache.set_many.assert_not_awaited()
+    assert results["known-missing"].data is None
+    assert "No book found" in results["known-missing"].error
+    assert "No book found" in results["new-missing"].error
+
+
+@pytest.mark.asyncio
+async def test_misses_are_fetched_under_the_concurrency_limit(
+    use_case, books_service, books_cache
+):
+    # Arrange
+    queries = {
+        str(index): BooksSearchCriteriaSchema(list=f"list-{index}")
+        for index in range(6)
+    }
+    books_cache.get_many.return_value = [None] * 6
+    in_flight = 0
+    max_in_flight = 0
+
+    async def search_books(criteria):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return books(1)
+
+    books_service.search_books.side_effect = search_books
+
+    # Act
+    results = await use_case(queries)
+
+    # Assert
+    assert len(results) == 6
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_lists_are_rejected_before_any_lookup(
+    books_service, books_cache, books_refresh
+):
+    # Arrange
+    genre_index = AsyncMock()
+    genre_index.validate.side_effect = [
+        GenreNotFoundException("nope"),
+        BooksSearchCriteriaSchema(list="manga"),
+    ]
+    use_case = GetBooksBatchUseCase(
+        books_service=books_service,
+        books_cache=books_cache,
+        books_refresh=books_refresh,
+        genre_index=genre_index,
+    )
+    books_cache.get_many.return_value = [cached(4)]
+
+    # Act
+    results = await use_case(
+        {
+            "unknown": BooksSearchCriteriaSchema(list="nope"),
+            "manga": BooksSearchCriteriaSchema(list="Manga"),
+        }
+    )
+
+    # Assert
+    assert list(results) == ["unknown", "manga"]
+    assert results["unknown"].error == "Genre not found: nope"
+    assert results["manga"].data.num_results == 4
+    assert books_cache.get_many.await_args.args[0] == [
+        BooksSearchCriteriaSchema(list="manga")
+    ]
+    books_service.search_books.assert_not_awaited()
@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from src.books.app.exceptions import BookNotFoundException, ExternalAPIException
+from src.books.app.use_cases.get_books_overview import GetBooksOverviewUseCase
+from src.books.domain.schemas import BookListSchema
+
+
+@pytest.fixture
+def mock_searcher():
+    return AsyncMock()
+
+
+@pytest.fixture
+def get_books_overview_use_case(mock_searcher):
+    return GetBooksOverviewUseCase(mock_searcher)
+
+
+@pytest.mark.asyncio
+async def test_get_books_overview_success(get_books_overview_use_case, mock_searcher):
+    # Arrange
+    expected_overview = {
+        "hardcover-fiction": BookListSchema(num_results=0, results=[]),
+    }
+    mock_searcher.get_books_overview.return_value = expected_overview
+
+    # Act
+    result = await get_books_overview_use_case("2024-01-07")
+
+    # Assert
+    assert result == expected_overview
+    mock_searcher.get_books_overview.assert_called_once_with("2024-01-07")
+
+
+@pytest.mark.asyncio
+async def test_get_books_overview_empty_result(
+    get_books_overview_use_case, mock_searcher
+):
+    # Arrange
+    mock_searcher.get_books_overview.return_value = {}
+
+    # Act & Assert
+    with pytest.raises(BookNotFoundException):
+        await get_books_overview_use_case()
+
+
+@pytest.mark.asyncio
+async def test_get_books_overview_unexpected_exception(
+    get_books_overview_use_case, mock_searcher
+):
+    # Arrange
+    mock_searcher.get_books_overview.side_effect = ValueError("Unexpected error")
+
+    # Act & Assert
+    with pytest.raises(ExternalAPIException):
+        await get_books_overview_use_case()
@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.books.app.exceptions import ServiceUnavailableException
+from src.books.domain.schemas import BookListSchema, BooksSearchCriteriaSchema
+from src.books.infra.searcher.circuit_breaker.service import (
+    CircuitBreakerBookSearcherService,
+)
+from src.core.application.circuit_breaker.base import CircuitBreaker
+
+
+@pytest.fixture
+def upstream():
+    return AsyncMock()
+
+
+@pytest.fixture
+def breaker_searcher(upstream):
+    circuit_breaker = CircuitBreaker(
+        name="test", window_size=1, minimum_calls=1, open_seconds=60
+    )
+    return CircuitBreakerBookSearcherService(upstream, circuit_breaker)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_last_known_good(breaker_searcher, upstream):
+    # Arrange
+    criteria = BooksSearchCriteriaSchema(list="hardcover-fiction")
+    books = BookListSchema(num_results=0, results=[])
+    upstream.search_books.return_value = books
+    await breaker_searcher.search_books(criteria)
+    upstream.search_books.side_effect = Exception("Upstream error")
+    with pytest.raises(Exception):
+        await breaker_searcher.search_books(criteria)
+
+    # Act
+    with pytest.raises(ServiceUnavailableException) as exc_info:
+        await breaker_searcher.search_books(criteria)
+
+    # Assert
+    assert exc_info.value.fallback is books
+    assert upstream.search_books.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_without_fallback(breaker_searcher, upstream):
+    # Arrange
+    upstream.get_books_genres.side_effect = Exception("Upstream error")
+    with pytest.raises(Exception):
+        await breaker_searcher.get_books_genres()
+
+    # Act
+    with pytest.raises(ServiceUnavailableException) as exc_info:
+        await breaker_searcher.get_books_genres()
+
+    # Assert
+    assert exc_info.value.fallback is None
+    upstream.get_books_genres.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_upstream_rejection_gets_the_last_known_good(upstream):
+    # Arrange
+    circuit_breaker = CircuitBreaker(
+        name="test",
+        window_size=1,
+        minimum_calls=1,
+        open_seconds=60,
+        is_failure=lambda error: not isinstance(error, ServiceUnavailableException),
+    )
+    breaker_searcher = CircuitBreakerBookSearcherService(upstream, circuit_breaker)
+    criteria = BooksSearchCriteriaSchema(list="hardcover-fiction")
+    books = BookListSchema(num_results=0, results=[])
+    upstream.search_books.return_value = books
+    await breaker_searcher.search_books(criteria)
+    upstream.search_books.side_effect = ServiceUnavailableException("NYT")
+
+    # Act
+    with pytest.raises(ServiceUnavailableException) as exc_info:
+        await breaker_searcher.search_books(criteria)
+
+    # Assert
+    assert exc_info.value.fallback is books
+    assert circuit_breaker.stats()["transitions_to_open"] == 0
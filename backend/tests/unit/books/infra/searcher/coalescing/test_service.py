@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.books.domain.schemas import BookListSchema, BooksSearchCriteriaSchema
+from src.books.infra.searcher.coalescing.service import CoalescingBookSearcherService
+
+
+@pytest.fixture
+def upstream():
+    return AsyncMock()
+
+
+@pytest.fixture
+def coalescing_searcher(upstream):
+    return CoalescingBookSearcherService(upstream)
+
+
+async def slow_result(*args, **kwargs):
+    await asyncio.sleep(0.01)
+    return BookListSchema(num_results=0, results=[])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_call(
+    coalescing_searcher, upstream
+):
+    # Arrange
+    upstream.search_books.side_effect = slow_result
+    criteria = [
+        BooksSearchCriteriaSchema(list="hardcover-fiction"),
+        BooksSearchCriteriaSchema(list=" Hardcover-Fiction ", offset=None),
+        BooksSearchCriteriaSchema(list="hardcover-fiction", offset=0),
+    ]
+
+    # Act
+    results = await asyncio.gather(
+        *(coalescing_searcher.search_books(item) for item in criteria)
+    )
+
+    # Assert
+    upstream.search_books.assert_called_once()
+    assert results[0] is results[1] is results[2]
+    assert coalescing_searcher.stats()["search_books_coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_different_criteria_are_not_coalesced(coalescing_searcher, upstream):
+    # Arrange
+    upstream.search_books.side_effect = slow_result
+
+    # Act
+    await asyncio.gather(
+        coalescing_searcher.search_books(BooksSearchCriteriaSchema(list="a")),
+        coalescing_searcher.search_books(BooksSearchCriteriaSchema(list="b")),
+    )
+
+    # Assert
+    assert upstream.search_books.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_error_is_shared_by_every_waiter(coalescing_searcher, upstream):
+    # Arrange
+    async def failing_genres():
+        await asyncio.sleep(0.01)
+        raise ValueError("Upstream error")
+
+    upstream.get_books_genres.side_effect = failing_genres
+
+    # Act
+    results = await asyncio.gather(
+        coalescing_searcher.get_books_genres(),
+        coalescing_searcher.get_books_genres(),
+        return_exceptions=True,
+    )
+
+    # Assert
+    upstream.get_books_genres.assert_called_once()
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_finished_calls_are_not_reused(coalescing_searcher, upstream):
+    # Arrange
+    upstream.search_books.side_effect = slow_result
+    criteria = BooksSearchCriteriaSchema(list="hardcover-fiction")
+
+    # Act
+    await coalescing_searcher.search_books(criteria)
+    await coalescing_searcher.search_books(criteria)
+
+    # Assert
+    assert upstream.search_books.call_count == 2
+    assert coalescing_searcher.stats()["search_books_in_flight"] == 0
@@ -0,0 +1,369 @@
+import sys
+
+import httpx
+import pytest
+
+from src.books.infra.searcher.nyt_books.client import NYTBooksClient
+from src.books.infra.searcher.nyt_books.client.exceptions import (
+    NYTBooksHTTP2UnavailableException,
+    NYTBooksInvalidPayloadRequestException,
+    NYTBooksNotFoundException,
+)
+
+
+def genres_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "results": [
+                {"list_name_encoded": "hardcover-fiction", "display_name": "Fiction"}
+            ]
+        },
+    )
+
+
+def overview_handler(request: httpx.Request) -> httpx.Response:
+    book = {
+        "rank": 1,
+        "rank_last_week": 0,
+        "weeks_on_list": 1,
+        "price": "0.00",
+        "title": "A TITLE",
+        "author": "An Author",
+        "contributor": "by An Author",
+        "publisher": "Publisher",
+        "primary_isbn10": "1234567890",
+        "primary_isbn13": "9781234567890",
+        "amazon_product_url": "https://www.amazon.com/dp/1234567890",
+        "description": "",
+    }
+    return httpx.Response(
+        200,
+        json={
+            "results": {
+                "bestsellers_date": "2024-01-06",
+                "published_date": "2024-01-21",
+                "lists": [
+                    {
+                        "list_name": "Hardcover Fiction",
+                        "list_name_encoded": "hardcover-fiction",
+                        "display_name": "Hardcover Fiction",
+                        "books": [book, {**book, "rank": 2}],
+                    },
+                    {
+                        "list_name": "Advice",
+                        "list_name_encoded": "advice-how-to-and-miscellaneous",
+                        "display_name": "Advice, How-To & Miscellaneous",
+                        "books": [book],
+                    },
+                ],
+            }
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_books_overview_splits_lists():
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        transport=httpx.MockTransport(overview_handler),
+    )
+
+    async with client:
+        overview = await client.get_books_overview()
+
+    assert list(overview) == ["hardcover-fiction", "advice-how-to-and-miscellaneous"]
+    fiction = overview["hardcover-fiction"]
+    assert fiction.num_results == 2
+    assert [result.rank for result in fiction.results] == [1, 2]
+    assert fiction.results[0].published_date == "2024-01-21"
+    assert fiction.results[0].book_details[0].primary_isbn13 == "9781234567890"
+    assert fiction.results[0].isbns[0].isbn10 == "1234567890"
+
+
+@pytest.mark.asyncio
+async def test_search_books_decodes_response_body():
+    result = {
+        "list_name": "Hardcover Fiction",
+        "display_name": "Hardcover Fiction",
+        "bestsellers_date": "2024-01-06",
+        "published_date": "2024-01-21",
+        "rank": 1,
+        "rank_last_week": 0,
+        "weeks_on_list": 1,
+        "asterisk": 0,
+        "dagger": 0,
+        "amazon_product_url": "https://www.amazon.com/dp/1234567890",
+        "isbns": [{"isbn10": "1234567890", "isbn13": "9781234567890"}],
+        "book_details": [
+            {
+                "title": "A TITLE",
+                "contributor": "by An Author",
+                "author": "An Author",
+                "price": "0.00",
+                "publisher": "Publisher",
+                "primary_isbn13": "9781234567890",
+                "primary_isbn10": "1234567890",
+            }
+        ],
+        "reviews": [{"book_review_link": ""}],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "status": "OK",
+                "copyright": "Copyright (c) The New York Times Company.",
+                "num_results": 40,
+                "last_modified": "2024-01-17T22:22:13-05:00",
+                "results": [result, {**result, "rank": 2}],
+            },
+        )
+
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async with client:
+        books = await client.search_books({"list": "hardcover-fiction"})
+
+    assert books.num_results == 40
+    assert books.page_size == 2
+    assert books.results[0].book_details[0].price == 0.0
+    assert books.model_dump()["page_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_not_modified_response_reuses_parsed_value():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        response = genres_handler(request)
+        response.headers["ETag"] = '"v1"'
+        return response
+
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async with client:
+        first = await client.get_books_genres()
+        second = await client.get_books_genres()
+
+    assert second is first
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert client.response_cache_stats()["not_modified"] == 1
+
+
+def flaky_handler(statuses):
+    responses = iter(statuses)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status_code = next(responses)
+        if status_code == 200:
+            return genres_handler(request)
+        return httpx.Response(status_code, json={"detail": []})
+
+    return handler, calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "statuses,expected_calls",
+    [([503, 502, 200], 3), ([500, 200], 2)],
+)
+async def test_server_errors_are_retried(statuses, expected_calls):
+    handler, calls = flaky_handler(statuses)
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        retry_delay=0,
+        transport=httpx.MockTransport(handler),
+    )
+
+    async with client:
+        genres = await client.get_books_genres()
+
+    assert genres
+    assert len(calls) == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_invalid_payload_is_not_retried():
+    handler, calls = flaky_handler([422, 200])
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        retry_delay=0,
+        transport=httpx.MockTransport(handler),
+    )
+
+    async with client:
+        with pytest.raises(NYTBooksInvalidPayloadRequestException):
+            await client.get_books_genres()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_not_retried():
+    handler, calls = flaky_handler([404, 200])
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        retry_delay=0,
+        transport=httpx.MockTransport(handler),
+    )
+
+    async with client:
+        with pytest.raises(NYTBooksNotFoundException):
+            await client.search_books({"list": "nope"})
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+class TestClientPool:
+    @pytest.fixture
+    def client(self):
+        return NYTBooksClient(
+            api_key="test",
+            base_url="https://nyt.test",
+            transport=httpx.MockTransport(genres_handler),
+        )
+
+    async def test_pool_is_reused_between_requests(self, client):
+        async with client:
+            await client.get_books_genres()
+            pool = client._client
+            await client.get_books_genres()
+
+            assert client._client is pool
+            assert client.pool_stats()["requests_total"] == 2
+            assert client.pool_stats()["requests_in_use"] == 0
+
+    async def test_close_releases_the_pool(self, client):
+        await client.connect()
+        await client.close()
+
+        assert client._client is None
+
+    async def test_request_opens_the_pool_lazily(self, client):
+        genres = await client.get_books_genres()
+
+        assert genres == [{"code": "hardcover-fiction", "display_name": "Fiction"}]
+        await client.close()
+
+
+def paged_handler(total: int, requested: list):
+    def book_result(rank: int) -> dict:
+        return {
+            "list_name": "Hardcover Fiction",
+            "display_name": "Hardcover Fiction",
+            "bestsellers_date": "2024-01-06",
+            "published_date": "2024-01-21",
+            "rank": rank,
+            "rank_last_week": 0,
+            "weeks_on_list": 1,
+            "asterisk": 0,
+            "dagger": 0,
+            "amazon_product_url": "",
+            "isbns": [],
+            "book_details": [],
+            "reviews": [],
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        requested.append(offset)
+        ranks = range(offset + 1, min(offset + 20, total) + 1)
+        return httpx.Response(
+            200,
+            json={
+                "num_results": total,
+                "results": [book_result(rank) for rank in ranks],
+            },
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_iter_books_yields_every_page_in_order():
+    requested = []
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        transport=httpx.MockTransport(paged_handler(45, requested)),
+    )
+
+    async with client:
+        ranks = [
+            result.rank
+            async for result in client.iter_books({"list": "hardcover-fiction"})
+        ]
+
+    assert ranks == list(range(1, 46))
+    assert sorted(requested) == [0, 20, 40]
+
+
+@pytest.mark.asyncio
+async def test_iter_books_honours_max_pages():
+    requested = []
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        transport=httpx.MockTransport(paged_handler(100, requested)),
+    )
+
+    async with client:
+        results = [
+            result
+            async for result in client.iter_books(
+                {"list": "hardcover-fiction"}, max_pages=2
+            )
+        ]
+
+    assert len(results) == 40
+    assert sorted(requested) == [0, 20]
+
+
+@pytest.mark.asyncio
+async def test_iter_books_stops_fetching_when_consumer_stops():
+    requested = []
+    client = NYTBooksClient(
+        api_key="test",
+        base_url="https://nyt.test",
+        transport=httpx.MockTransport(paged_handler(1000, requested)),
+    )
+
+    async with client:
+        iterator = client.iter_books({"list": "hardcover-fiction"}, concurrency=2)
+        async for result in iterator:
+            if result.rank == 21:
+                break
+        await iterator.aclose()
+
+    assert len(requested) <= 4
+
+
+def test_http2_without_h2_fails_when_the_client_is_built(monkeypatch):
+    # A None entry makes `import h2` fail whether or not it is installed
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with pytest.raises(NYTBooksHTTP2UnavailableException, match="'h2'"):
+        NYTBooksClient(api_key="test", http2=True)
+
+    NYTBooksClient(api_key="test")
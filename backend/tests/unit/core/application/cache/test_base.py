@@ -0,0 +1,57 @@
+from src.core.application.cache.base import LocalCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LocalCache(max_entries=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_the_shortest_ttl():
+    clock = FakeClock()
+    cache = LocalCache(max_entries=10, ttl=60, clock=clock)
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 2, ttl=3600)
+
+    clock.now = 10
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+    clock.now = 61
+    assert cache.get("long") is None
+    assert cache.stats()["expirations"] == 2
+
+
+def test_invalidate_and_stats():
+    cache = LocalCache(max_entries=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate(["a", "missing"])
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats() == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "invalidations": 1,
+    }
@@ -0,0 +1,80 @@
+import unittest
+
+from src.core.application.circuit_breaker.base import CircuitBreaker
+from src.core.application.circuit_breaker.dto import CircuitState
+from src.core.application.circuit_breaker.exceptions import (
+    CircuitBreakerOpenException,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def succeed():
+    return "ok"
+
+
+async def fail():
+    raise ValueError("Upstream error")
+
+
+class TestCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            name="test",
+            failure_rate_threshold=0.5,
+            window_size=4,
+            minimum_calls=4,
+            open_seconds=10,
+            is_failure=lambda error: isinstance(error, ValueError),
+            clock=self.clock,
+        )
+
+    async def trip(self):
+        for func in (succeed, succeed, fail, fail):
+            try:
+                await self.breaker.call(func)
+            except ValueError:
+                pass
+
+    async def test_opens_when_failure_rate_is_reached(self):
+        await self.trip()
+
+        assert self.breaker.state == CircuitState.OPEN
+        with self.assertRaises(CircuitBreakerOpenException):
+            await self.breaker.call(succeed)
+        assert self.breaker.stats()["rejected"] == 1
+
+    async def test_ignored_errors_do_not_count_as_failures(self):
+        async def not_found():
+            raise KeyError()
+
+        for _ in range(4):
+            with self.assertRaises(KeyError):
+                await self.breaker.call(not_found)
+
+        assert self.breaker.state == CircuitState.CLOSED
+
+    async def test_closes_after_a_successful_trial_call(self):
+        await self.trip()
+        self.clock.now += 10
+
+        assert self.breaker.state == CircuitState.HALF_OPEN
+        assert await self.breaker.call(succeed) == "ok"
+        assert self.breaker.state == CircuitState.CLOSED
+
+    async def test_reopens_after_a_failed_trial_call(self):
+        await self.trip()
+        self.clock.now += 10
+
+        with self.assertRaises(ValueError):
+            await self.breaker.call(fail)
+
+        assert self.breaker.state == CircuitState.OPEN
+        assert self.breaker.stats()["transitions_to_open"] == 2
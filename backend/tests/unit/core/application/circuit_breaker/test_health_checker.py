@@ -0,0 +1,28 @@
+import unittest
+
+from src.core.application.circuit_breaker.base import CircuitBreaker
+from src.core.application.circuit_breaker.health_checker import CircuitBreakerCheck
+
+
+async def fail():
+    raise ValueError("Upstream error")
+
+
+class TestCircuitBreakerCheck(unittest.IsolatedAsyncioTestCase):
+    async def test_open_breaker_is_reported_without_failing(self):
+        breaker = CircuitBreaker(
+            name="test",
+            failure_rate_threshold=0.5,
+            window_size=2,
+            minimum_calls=2,
+            open_seconds=10,
+            is_failure=lambda error: isinstance(error, ValueError),
+        )
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                await breaker.call(fail)
+
+        result = await CircuitBreakerCheck(breaker, name="NYT")()
+
+        assert result.passed
+        assert result.details == "state=open"
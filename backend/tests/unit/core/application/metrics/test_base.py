@@ -0,0 +1,23 @@
+import unittest
+
+from src.core.application.metrics.base import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_snapshot_reads_collectors_live(self):
+        counter = {"value": 0}
+        registry = MetricsRegistry()
+        registry.register("counter", lambda: {"value": counter["value"]})
+
+        counter["value"] = 3
+        report = registry.snapshot()
+
+        assert report.sources == {"counter": {"value": 3}}
+
+    def test_unregister(self):
+        registry = MetricsRegistry()
+        registry.register("source", lambda: {"value": 1})
+
+        registry.unregister("source")
+
+        assert registry.snapshot().sources == {}
@@ -0,0 +1,67 @@
+import unittest
+
+from src.core.application.retry.base import RetryBudget, RetryPolicy
+from src.core.application.retry.dto import ErrorKind, RetryDecisionDTO
+
+
+def retry_everything(error: BaseException) -> RetryDecisionDTO:
+    return RetryDecisionDTO(retryable=True, kind=ErrorKind.OTHER)
+
+
+def retry_value_errors(error: BaseException) -> RetryDecisionDTO:
+    return RetryDecisionDTO(retryable=isinstance(error, ValueError))
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_full_jitter_backoff_is_capped(self):
+        policy = RetryPolicy(
+            base_delay=1, max_delay=5, rng=lambda low, high: high
+        )
+
+        delays = [policy.backoff(attempt) for attempt in range(5)]
+
+        assert delays == [1, 2, 4, 5, 5]
+
+    def test_non_retryable_errors_are_not_retried(self):
+        policy = RetryPolicy(classifier=retry_value_errors)
+
+        assert policy.next_delay(0, KeyError()) is None
+        assert policy.next_delay(0, ValueError()) is not None
+
+    def test_stops_after_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3, classifier=retry_everything)
+        call = policy.new_call()
+
+        delays = [call.next_delay(ValueError()) for _ in range(3)]
+
+        assert delays[0] is not None and delays[1] is not None
+        assert delays[2] is None
+        assert call.attempt == 2
+
+    def test_retry_after_is_a_lower_bound(self):
+        policy = RetryPolicy(
+            classifier=lambda error: RetryDecisionDTO(retryable=True, retry_after=7),
+            rng=lambda low, high: high,
+        )
+
+        assert policy.next_delay(0, ValueError()) == 7
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_retries_are_limited_to_a_fraction_of_requests(self):
+        budget = RetryBudget(
+            ratio=0.5, min_retries_per_second=0, max_tokens=1, clock=lambda: 0
+        )
+        policy = RetryPolicy(
+            max_attempts=10, classifier=retry_everything, budget=budget
+        )
+
+        first = policy.new_call().next_delay(ValueError())
+        second = policy.new_call().next_delay(ValueError())
+        policy.new_call()
+        third = policy.new_call().next_delay(ValueError())
+
+        assert first is not None
+        assert second is None
+        assert third is not None
+        assert policy.stats()["budget_exhausted"] == 1
@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.application.scheduler.base import CronSchedule, ScheduledJob
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "expression,moment,expected",
+    [
+        # Wednesday 23:15, from a Monday
+        ("15 23 * * 3", utc(2024, 1, 15, 12, 0), utc(2024, 1, 17, 23, 15)),
+        # Exactly on an occurrence moves to the next week
+        ("15 23 * * 3", utc(2024, 1, 17, 23, 15), utc(2024, 1, 24, 23, 15)),
+        ("*/20 * * * *", utc(2024, 1, 1, 10, 41, 30), utc(2024, 1, 1, 11, 0)),
+        ("0 9-17/4 * * 1-5", utc(2024, 1, 5, 18, 0), utc(2024, 1, 8, 9, 0)),
+        ("0 0 * * 7", utc(2024, 1, 1, 0, 0), utc(2024, 1, 7, 0, 0)),
+        # Day of month and day of week restricted: either matches
+        ("0 0 1 * 3", utc(2024, 1, 1, 0, 0), utc(2024, 1, 3, 0, 0)),
+        ("0 0 29 2 *", utc(2024, 3, 1), utc(2028, 2, 29)),
+    ],
+)
+def test_next_after(expression, moment, expected):
+    assert CronSchedule(expression).next_after(moment) == expected
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "60 * * * *", "* * * 13 *", "5-1 * * * *", "*/0 * * * *"]
+)
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+@pytest.mark.asyncio
+async def test_job_sleeps_until_the_next_occurrence_and_survives_failures():
+    # Arrange
+    job = AsyncMock(side_effect=[RuntimeError("boom"), None])
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) > 2:
+            raise StopAsyncIteration
+
+    scheduled_job = ScheduledJob(
+        name="test",
+        schedule=CronSchedule("0 * * * *"),
+        job=job,
+        clock=lambda: utc(2024, 1, 1, 10, 30),
+        sleep=sleep,
+    )
+
+    # Act
+    with pytest.raises(StopAsyncIteration):
+        await scheduled_job._run()
+
+    # Assert
+    assert sleeps == [1800.0, 1800.0, 1800.0]
+    assert job.await_count == 2
+    stats = scheduled_job.stats()
+    assert stats["runs"] == 2
+    assert stats["failures"] == 1
+    assert stats["next_run_timestamp"] == utc(2024, 1, 1, 11, 0).timestamp()
+
+
+@pytest.mark.asyncio
+async def test_run_on_start_runs_before_waiting():
+    # Arrange
+    job = AsyncMock()
+    scheduled_job = ScheduledJob(
+        name="test",
+        schedule=CronSchedule("0 * * * *"),
+        job=job,
+        run_on_start=True,
+        sleep=AsyncMock(side_effect=StopAsyncIteration),
+    )
+
+    # Act
+    with pytest.raises(StopAsyncIteration):
+        await scheduled_job._run()
+
+    # Assert
+    job.assert_awaited_once()
@@ -0,0 +1,48 @@
+import pytest
+
+from src.core.infra.database.redis.service import RedisClient, RedisService
+
+
+@pytest.mark.asyncio
+async def test_pool_is_configured_from_the_client_settings():
+    client = RedisClient(
+        url="redis://redis.test:6380/2",
+        max_connections=7,
+        pool_timeout=1.5,
+        socket_timeout=0.5,
+        socket_connect_timeout=0.25,
+        health_check_interval=10,
+    )
+
+    await client.connect()
+    pool = client.connection.connection_pool
+
+    assert pool.max_connections == 7
+    assert pool.timeout == 1.5
+    assert pool.connection_kwargs["host"] == "redis.test"
+    assert pool.connection_kwargs["port"] == 6380
+    assert pool.connection_kwargs["db"] == 2
+    assert pool.connection_kwargs["socket_timeout"] == 0.5
+    assert pool.connection_kwargs["socket_connect_timeout"] == 0.25
+    assert pool.connection_kwargs["health_check_interval"] == 10
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_services_share_a_single_pool():
+    client = RedisClient()
+    first = RedisService(client=client)
+    second = RedisService(client=client)
+
+    await first.setup()
+    await second.setup()
+
+    assert second.client.connection is first.client.connection
+    assert client.pool_stats() == {
+        "connections_open": 0,
+        "connections_in_use": 0,
+        "connections_idle": 0,
+        "max_connections": 50,
+    }
+    await client.close()
+    assert client.connection is None
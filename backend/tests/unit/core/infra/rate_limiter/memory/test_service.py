@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from src.core.domain.rate_limiter.exceptions import RateLimitExceededException
+from src.core.domain.rate_limiter.schemas import RequestPriority
+from src.core.infra.rate_limiter.memory.service import InMemoryRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, per_minute=2, background_reserve=0.0):
+    return InMemoryRateLimiter(
+        per_minute=per_minute,
+        per_day=1000,
+        background_reserve=background_reserve,
+        max_poll_interval=0.001,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_waits_for_a_token_instead_of_failing(clock):
+    # Arrange
+    limiter = make_limiter(clock)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    # Act
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    blocked = not waiter.done()
+    clock.now += 30
+    await asyncio.wait_for(waiter, timeout=1)
+
+    # Assert
+    assert blocked
+    assert limiter.stats()["granted_interactive"] == 3
+
+
+@pytest.mark.asyncio
+async def test_interactive_callers_go_ahead_of_background(clock):
+    # Arrange
+    limiter = make_limiter(clock)
+    await limiter.acquire()
+    await limiter.acquire()
+    order = []
+
+    async def acquire(priority):
+        await limiter.acquire(priority)
+        order.append(priority)
+
+    # Act
+    background = asyncio.create_task(acquire(RequestPriority.BACKGROUND))
+    await asyncio.sleep(0.01)
+    interactive = asyncio.create_task(acquire(RequestPriority.INTERACTIVE))
+    await asyncio.sleep(0.01)
+    clock.now += 30
+    await asyncio.wait_for(interactive, timeout=1)
+    clock.now += 30
+    await asyncio.wait_for(background, timeout=1)
+
+    # Assert
+    assert order == [RequestPriority.INTERACTIVE, RequestPriority.BACKGROUND]
+
+
+@pytest.mark.asyncio
+async def test_background_callers_leave_the_reserve(clock):
+    # Arrange
+    limiter = make_limiter(clock, per_minute=4, background_reserve=0.25)
+    for _ in range(3):
+        await limiter.acquire(RequestPriority.BACKGROUND)
+
+    # Act
+    background = asyncio.create_task(limiter.acquire(RequestPriority.BACKGROUND))
+    await asyncio.wait_for(limiter.acquire(RequestPriority.INTERACTIVE), timeout=1)
+
+    # Assert
+    assert not background.done()
+    background.cancel()
+
+
+@pytest.mark.asyncio
+async def test_penalize_blocks_every_caller(clock):
+    # Arrange
+    limiter = make_limiter(clock)
+    await limiter.penalize(10)
+
+    # Act
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    blocked = not waiter.done()
+    clock.now += 10
+    await asyncio.wait_for(waiter, timeout=1)
+
+    # Assert
+    assert blocked
+    assert limiter.stats()["penalties"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interactive_caller_gives_up_when_the_token_is_too_far(clock):
+    # Arrange
+    limiter = InMemoryRateLimiter(
+        per_minute=2, per_day=1000, max_poll_interval=0.001, max_wait=5, clock=clock
+    )
+    await limiter.penalize(60)
+
+    # Act
+    with pytest.raises(RateLimitExceededException):
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+    background = asyncio.create_task(limiter.acquire(RequestPriority.BACKGROUND))
+    await asyncio.sleep(0.01)
+
+    # Assert
+    assert not background.done()
+    assert limiter.stats()["rejected"] == 1
+    background.cancel()
+
+
+@pytest.mark.asyncio
+async def test_interactive_caller_gives_up_when_the_queue_is_full(clock):
+    # Arrange
+    limiter = InMemoryRateLimiter(
+        per_minute=2, per_day=1000, max_poll_interval=0.001, max_queue=1, clock=clock
+    )
+    await limiter.penalize(60)
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+
+    # Act
+    with pytest.raises(RateLimitExceededException) as exc_info:
+        await limiter.acquire()
+
+    # Assert
+    assert exc_info.value.reason == "queue is full"
+    assert not waiter.done()
+    waiter.cancel()
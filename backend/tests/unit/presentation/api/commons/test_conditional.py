@@ -0,0 +1,25 @@
+import pytest
+from starlette.requests import Request
+
+from src.presentation.api.commons.conditional import etag_matches
+
+
+def make_request(if_none_match: str) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "if_none_match, matches",
+    [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", W/"abc"', True),
+        ("*", True),
+        ('"other"', False),
+        ("", False),
+    ],
+)
+def test_etag_matches(if_none_match, matches):
+    assert etag_matches(make_request(if_none_match), '"abc"') is matches
+    assert etag_matches(make_request(if_none_match), 'W/"abc"') is matches
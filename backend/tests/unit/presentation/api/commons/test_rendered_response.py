@@ -0,0 +1,132 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from starlette.requests import Request
+
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.books.domain.schemas import BookListSchema
+from src.presentation.api.commons.rendered_response import (
+    HISTORICAL_MAX_AGE,
+    cache_control_for,
+    render_cached_books,
+    rendered_response,
+)
+from src.presentation.api.commons.response_model import (
+    BaseResponseModel,
+    ResponseMetadataModel,
+)
+
+
+@pytest.fixture
+def cached():
+    books = BookListSchema(num_results=0, results=[])
+    return CachedBooksSchema(data=books, stored_at=0.0, fresh_until=10.0)
+
+
+def make_request(accept_encoding: str = "", if_none_match: str = "") -> Request:
+    headers = [(b"accept-encoding", accept_encoding.encode())]
+    if if_none_match:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_body_matches_the_serialized_response_model(cached):
+    metadata = ResponseMetadataModel(stale=True, age_seconds=12.5)
+
+    body = render_cached_books(cached, "En caché").body(metadata)
+
+    expected = BaseResponseModel(
+        error=False, message="En caché", data=cached.data, metadata=metadata
+    )
+    assert json.loads(body) == json.loads(expected.model_dump_json())
+
+
+def test_gzip_body_decompresses_to_the_same_bytes(cached):
+    rendered = render_cached_books(cached, "En caché")
+
+    for age in (0.0, 1.5, 3600.0):
+        metadata = ResponseMetadataModel(age_seconds=age)
+        compressed = rendered.gzip_body(metadata)
+
+        assert gzip.decompress(compressed) == rendered.body(metadata)
+        assert zlib.decompress(compressed, 16 + zlib.MAX_WBITS) == rendered.body(
+            metadata
+        )
+
+
+def test_rendering_is_memoized_per_entry_and_message(cached):
+    first = render_cached_books(cached, "En caché")
+
+    assert render_cached_books(cached, "En caché") is first
+    assert render_cached_books(cached, "Otro mensaje") is not first
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, gzip_min_size, encoding",
+    [("gzip, br", 0, "gzip"), ("", 0, None), ("gzip", 10**6, None)],
+)
+def test_response_is_gzipped_only_when_accepted_and_large_enough(
+    cached, accept_encoding, gzip_min_size, encoding
+):
+    rendered = render_cached_books(cached, "En caché")
+
+    response = rendered_response(
+        make_request(accept_encoding),
+        rendered,
+        ResponseMetadataModel(),
+        gzip_min_size=gzip_min_size,
+    )
+
+    assert response.media_type == "application/json"
+    assert response.headers.get("content-encoding") == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_matching_etag_gets_an_empty_304(cached):
+    rendered = render_cached_books(cached, "En caché")
+    gzipped = rendered_response(
+        make_request("gzip"), rendered, ResponseMetadataModel(), gzip_min_size=0
+    )
+
+    response = rendered_response(
+        make_request("gzip", if_none_match=gzipped.headers["etag"]),
+        rendered,
+        ResponseMetadataModel(),
+        cache_control="no-cache",
+    )
+
+    # Weak, as the metadata is not part of it; shared by both encodings
+    assert rendered.etag.startswith('W/"')
+    assert gzipped.headers["etag"] == rendered.etag
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == rendered.etag
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_etag_changes_with_the_data(cached):
+    other = CachedBooksSchema(
+        data=BookListSchema(num_results=1, results=[]), stored_at=0.0
+    )
+
+    etag = render_cached_books(cached, "En caché").etag
+
+    assert etag == render_cached_books(cached.model_copy(), "En caché").etag
+    assert etag != render_cached_books(other, "En caché").etag
+
+
+@pytest.mark.parametrize(
+    "fresh_until, expected",
+    [
+        (10.0, "public, max-age=6"),
+        (4.0, "no-cache"),
+        (None, f"public, max-age={HISTORICAL_MAX_AGE}"),
+    ],
+)
+def test_cache_control_follows_freshness(fresh_until, expected):
+    books = BookListSchema(num_results=0, results=[])
+    cached = CachedBooksSchema(data=books, stored_at=0.0, fresh_until=fresh_until)
+
+    assert cache_control_for(cached, now=4.0) == expected
@@ -0,0 +1,95 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.requests import Request
+
+from src.books.app.cache.schemas import CachedBooksSchema
+from src.books.app.exceptions import ServiceUnavailableException
+from src.books.domain.schemas import BookListSchema, BooksSearchCriteriaSchema
+from src.presentation.api.resources.books.routes import get_books
+
+
+def make_request(if_none_match: str = "") -> Request:
+    headers = []
+    if if_none_match:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.fixture
+def books_cache():
+    books_cache = AsyncMock()
+    books_cache.get.return_value = None
+    books_cache.is_missing.return_value = False
+    books_cache.set.side_effect = lambda criteria, books: CachedBooksSchema(
+        data=books, stored_at=0.0, fresh_until=None
+    )
+    return books_cache
+
+
+@pytest.fixture
+def genre_index():
+    genre_index = AsyncMock()
+    genre_index.validate.side_effect = lambda criteria: criteria
+    return genre_index
+
+
+async def call_get_books(request, books_service, books_cache, genre_index):
+    return await get_books(
+        request,
+        BooksSearchCriteriaSchema(list="hardcover-fiction"),
+        books_service=books_service,
+        books_cache=books_cache,
+        books_refresh=AsyncMock(),
+        list_hit_counter=MagicMock(),
+        genre_index=genre_index,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_is_sent_with_etag_and_cache_control(
+    books_cache, genre_index
+):
+    # Arrange
+    books_service = AsyncMock()
+    books_service.search_books.return_value = BookListSchema(
+        num_results=0, results=[]
+    )
+
+    # Act
+    response = await call_get_books(
+        make_request(), books_service, books_cache, genre_index
+    )
+    revalidated = await call_get_books(
+        make_request(response.headers["etag"]), books_service, books_cache, genre_index
+    )
+
+    # Assert
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    assert json.loads(response.body)["metadata"]["stale"] is False
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_fallback_is_sent_with_etag_and_must_be_revalidated(
+    books_cache, genre_index
+):
+    # Arrange
+    books_service = AsyncMock()
+    books_service.search_books.side_effect = ServiceUnavailableException(
+        "NYT Books API", fallback=BookListSchema(num_results=3, results=[])
+    )
+
+    # Act
+    response = await call_get_books(
+        make_request(), books_service, books_cache, genre_index
+    )
+
+    # Assert
+    body = json.loads(response.body)
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "no-cache"
+    assert body["data"]["num_results"] == 3
+    assert body["metadata"]["stale"] is True
@@ -0,0 +1,25 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.application.circuit_breaker.dto import CircuitState
+from src.core.application.circuit_breaker.health_checker import CircuitBreakerCheck
+from src.core.application.health_checkers.base import HealthCheckExecutor
+from src.presentation.api.resources.health_checkers.routes import readyz
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_breaker_keeps_the_pod_ready():
+    # Arrange
+    circuit_breaker = MagicMock(state=CircuitState.OPEN)
+    executor = HealthCheckExecutor([CircuitBreakerCheck(circuit_breaker, name="NYT")])
+
+    # Act
+    response = await readyz(health_check_report=await executor())
+
+    # Assert
+    body = json.loads(response.body)
+    assert response.status_code == 200
+    assert body["data"]["healthy"] is True
+    assert body["data"]["checks"][0]["details"] == "state=open"